@@ -30,11 +30,19 @@ __spec_version__ = (
 # Import all submodules.
 from . import protocol
 from . import base
-from . import validator
 from .subnet_links import SUBNET_LINKS
 
+import importlib
 import os
 
+
+def __getattr__(name: str):
+    # core.validator pulls in bittensor, so it is only imported on first access.
+    if name == "validator":
+        return importlib.import_module(".validator", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_database_url(role: str = "miner") -> str:
     if role == "miner":
         host = os.getenv("MINER_DB_HOST", "localhost")
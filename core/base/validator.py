@@ -73,7 +73,7 @@ class BaseValidatorNeuron(BaseNeuron):
             bt.logging.warning("axon off, not serving ip to chain.")
 
         # Create asyncio event loop to manage async tasks.
-        self.loop = asyncio.get_event_loop()
+        self.loop = self._create_event_loop()
 
         # Instantiate runners
         self.should_exit: bool = False
@@ -81,6 +81,19 @@ class BaseValidatorNeuron(BaseNeuron):
         self.thread: Union[threading.Thread, None] = None
         self.lock = asyncio.Lock()
 
+    def _create_event_loop(self) -> asyncio.AbstractEventLoop:
+        """Create the event loop selected by --neuron.event_loop."""
+        if self.config.neuron.event_loop == "uvloop":
+            try:
+                import uvloop
+            except ImportError:
+                bt.logging.warning("uvloop is not installed, using the asyncio event loop.")
+            else:
+                loop = uvloop.new_event_loop()
+                asyncio.set_event_loop(loop)
+                return loop
+        return asyncio.get_event_loop()
+
     def serve_axon(self):
         """Serve axon to enable external connections."""
 
@@ -7,44 +7,132 @@ This module provides:
 - DataManager class for database operations
 """
 
+import csv
+import io
+import logging
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional
+from select import select as wait_for_readable
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from sqlalchemy import (
     create_engine,
-    Column,
     BigInteger,
     String,
     Text,
     DateTime,
     Integer,
     ForeignKey,
+    Index,
+    PrimaryKeyConstraint,
+    select,
     and_,
     or_,
     text
 )
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session, relationship
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker, Session, relationship
+import orjson
 
+from core import get_database_url
 
-Base = declarative_base()
 
+class Base(DeclarativeBase):
+    pass
+
+
+logger = logging.getLogger(__name__)
+
+# Channel notified by the patterns insert trigger, see DataManager._install_pattern_notify_trigger
+PATTERNS_CHANNEL = 'patterns_chan'
+
+# Database URLs whose schema (tables, indexes, notify trigger) this process has already created
+_INITIALIZED_SCHEMAS = set()
+
+# pg_advisory_xact_lock key serializing DataManager._migrate_legacy_schema across miner processes
+_MIGRATION_LOCK_KEY = 0x6d696e6572  # "miner"
+
+# Shared DataManager per database URL, see create_data_manager
+_MANAGERS: Dict[str, "DataManager"] = {}
+_MANAGERS_LOCK = threading.Lock()
+
+# Number of patterns a validator (:validator_hotkey) has not acknowledged yet
+_UNACKNOWLEDGED_COUNT_SQL = """
+    SELECT count(*) FROM patterns p
+    WHERE NOT EXISTS (
+        SELECT 1 FROM acknowledged_patterns ap
+        WHERE ap.pattern_id = p.id AND ap.validator_hotkey = :validator_hotkey
+    )
+"""
+
+# Built once, so every call reuses the same statement and its compiled form
+_ACKNOWLEDGMENT_COUNT = text("SELECT count(*) FROM acknowledged_patterns WHERE pattern_id = :pattern_id")
+
+_UNACKNOWLEDGED_COUNT = text(_UNACKNOWLEDGED_COUNT_SQL)
+
+# The other subqueries see the snapshot from before the insert,
+# so acknowledge_and_summarize adds the inserted row (if any) back in by hand
+_ACKNOWLEDGE_AND_SUMMARIZE = text(f"""
+    WITH inserted AS (
+        INSERT INTO acknowledged_patterns (pattern_id, validator_hotkey, timestamp)
+        VALUES (:pattern_id, :validator_hotkey, :timestamp)
+        ON CONFLICT (pattern_id, validator_hotkey) DO NOTHING
+        RETURNING pattern_id
+    )
+    SELECT
+        (SELECT count(*) FROM inserted) AS inserted,
+        ({_UNACKNOWLEDGED_COUNT_SQL}) AS unacknowledged,
+        (SELECT count(*) FROM acknowledged_patterns WHERE pattern_id = :pattern_id) AS acknowledgments
+""")
+
+_UNACKNOWLEDGED_PATTERNS = text("""
+    SELECT p.id, p.pattern_id, p.network, p.asset_symbol, p.asset_contract,
+           p.data, p.timestamp, p.importance
+    FROM patterns p
+    LEFT JOIN acknowledged_patterns ap ON p.id = ap.pattern_id
+        AND ap.validator_hotkey = :validator_hotkey
+    WHERE ap.pattern_id IS NULL
+    ORDER BY p.importance DESC, p.id ASC
+    LIMIT :limit
+""")
+
+_ACKNOWLEDGE_PATTERN_KEYS = text("""
+    INSERT INTO acknowledged_patterns (pattern_id, validator_hotkey, timestamp)
+    SELECT p.id, a.validator_hotkey, :timestamp
+    FROM unnest(CAST(:pattern_keys AS varchar[]), CAST(:validator_hotkeys AS varchar[]))
+        AS a(pattern_key, validator_hotkey)
+    JOIN patterns p ON p.pattern_id = a.pattern_key
+    ON CONFLICT (pattern_id, validator_hotkey) DO NOTHING
+""")
+
+
+
+def _json_dumps(value: Any) -> str:
+    return orjson.dumps(value).decode()
 
 
 class Pattern(Base):
     __tablename__ = 'patterns'
+    __table_args__ = (
+        # Serves the importance-ranked scan in get_unacknowledged_patterns
+        Index('ix_patterns_importance_id', text('importance DESC'), 'id'),
+    )
     
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
-    pattern_id = Column(String(255), nullable=False, index=True)
-    network = Column(String(100), nullable=False)
-    asset_symbol = Column(String(50), nullable=False)
-    asset_contract = Column(String(255), nullable=False, default='native')
-    data = Column(Text, nullable=False)
-    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow)
-    importance = Column(Integer, nullable=False, default=0)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    pattern_id: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    network: Mapped[str] = mapped_column(String(100), nullable=False)
+    asset_symbol: Mapped[str] = mapped_column(String(50), nullable=False)
+    asset_contract: Mapped[str] = mapped_column(String(255), nullable=False, default='native')
+    data: Mapped[Any] = mapped_column(JSONB, nullable=False)
+    timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    importance: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     
     # Relationship to acknowledged patterns
-    acknowledgments = relationship("AcknowledgedPattern", back_populates="pattern")
+    acknowledgments: Mapped[List["AcknowledgedPattern"]] = relationship(back_populates="pattern")
     
     def __repr__(self):
         return f"<Pattern(id={self.id}, pattern_id='{self.pattern_id}', network='{self.network}', importance={self.importance})>"
@@ -53,41 +141,228 @@ class Pattern(Base):
 class AcknowledgedPattern(Base):
 
     __tablename__ = 'acknowledged_patterns'
+    __table_args__ = (
+        # The natural key: repeated acks conflict on it, and the anti-join in
+        # get_unacknowledged_patterns probes acks per validator from it alone.
+        # No surrogate id, so each ack maintains two indexes instead of three.
+        PrimaryKeyConstraint('validator_hotkey', 'pattern_id', name='pk_acknowledged_patterns'),
+        # Acknowledgment counts and foreign key checks by pattern
+        Index('ix_acknowledged_patterns_pattern_id', 'pattern_id'),
+    )
     
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
-    pattern_id = Column(BigInteger, ForeignKey('patterns.id'), nullable=False, index=True)
-    validator_hotkey = Column(String(255), nullable=False, index=True)
-    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow)
+    pattern_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('patterns.id'), nullable=False)
+    validator_hotkey: Mapped[str] = mapped_column(String(255), nullable=False)
+    timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
     
     # Relationship to pattern
-    pattern = relationship("Pattern", back_populates="acknowledgments")
+    pattern: Mapped["Pattern"] = relationship(back_populates="acknowledgments")
     
     def __repr__(self):
-        return f"<AcknowledgedPattern(id={self.id}, pattern_id={self.pattern_id}, validator_hotkey='{self.validator_hotkey}')>"
+        return f"<AcknowledgedPattern(pattern_id={self.pattern_id}, validator_hotkey='{self.validator_hotkey}')>"
 
 
 class DataManager:
 
-    def __init__(self, database_url: str):
+    def __init__(self, database_url: str, listen_for_changes: bool = True):
         """
         Initialize the DataManager with database connection.
         
         Args:
             database_url: SQLAlchemy database URL. If None, uses PostgreSQL with default configuration.
+            listen_for_changes: Invalidate cached queries on LISTEN/NOTIFY when patterns are inserted
         """
 
+        # libpq TCP keepalives detect dead connections without a pre-ping round trip per checkout
+        connect_args = {
+            "keepalives": 1,
+            "keepalives_idle": 30,
+            "keepalives_interval": 10,
+            "keepalives_count": 3
+        }
+        if make_url(database_url).get_driver_name() == "psycopg":
+            # psycopg 3: switch repeated statements to server-side prepared ones after one execution
+            connect_args["prepare_threshold"] = 1
+
         self.engine = create_engine(
             database_url,
             echo=False,
             pool_size=10,
             max_overflow=20,
-            pool_pre_ping=True,
-            pool_recycle=3600
+            pool_recycle=3600,
+            pool_use_lifo=True,
+            query_cache_size=1200,
+            connect_args=connect_args,
+            json_serializer=_json_dumps,
+            json_deserializer=orjson.loads
         )
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine)
+
+        # Short-lived cache of get_unacknowledged_patterns results:
+        # validator_hotkey -> (expires_at, pattern or None). Writers swap in a
+        # new dict under the lock and bump the generation, so a query that
+        # overlapped an invalidation does not put its stale result back.
+        self.unacknowledged_cache_ttl = 2.0
+        self.unacknowledged_cache_maxsize = 1024
+        self._unacknowledged_cache = {}
+        self._unacknowledged_generation = 0
+        self._unacknowledged_lock = threading.Lock()
+
+        # LRU of get_pattern_by_id results; patterns are never updated, so entries stay valid
+        self.pattern_cache_maxsize = 1024
+        self._pattern_cache: 'OrderedDict[int, Pattern]' = OrderedDict()
+
+        # Short-lived cache of get_acknowledgment_count results: pattern id -> (expires_at, count).
+        # Acks written here invalidate their entries; the TTL bounds staleness from other writers.
+        self.ack_count_cache_ttl = 5.0
+        self.ack_count_cache_maxsize = 1024
+        self._ack_count_cache: Dict[int, Tuple[float, int]] = {}
         
-        # Create tables if they don't exist
-        Base.metadata.create_all(bind=self.engine)
+        # Configure mappers up front rather than lazily on first query
+        Base.registry.configure()
+
+        # Create tables if they don't exist; DDL probes run once per URL per process
+        self.database_url = database_url
+        if database_url not in _INITIALIZED_SCHEMAS:
+            self._migrate_legacy_schema()
+            Base.metadata.create_all(bind=self.engine)
+            self._install_pattern_notify_trigger()
+            _INITIALIZED_SCHEMAS.add(database_url)
+
+        self._listener_stop = threading.Event()
+        self._listener_thread = None
+        if listen_for_changes:
+            # New patterns are pushed to us, so the TTL only bounds staleness for missed notifications
+            self.unacknowledged_cache_ttl = 30.0
+            self._listener_thread = threading.Thread(
+                target=self._listen_for_pattern_changes, name="pattern-notify-listener", daemon=True
+            )
+            self._listener_thread.start()
+
+    def _migrate_legacy_schema(self):
+        """
+        Bring tables created by earlier miner versions up to the current models.
+
+        create_all only creates missing tables, so columns and indexes of
+        existing ones are converted here. Every step checks the catalog first,
+        which makes this a no-op on an up-to-date database.
+        """
+        with self.engine.begin() as connection:
+            connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _MIGRATION_LOCK_KEY})
+
+            data_type = connection.execute(text("""
+                SELECT data_type FROM information_schema.columns
+                WHERE table_schema = current_schema() AND table_name = 'patterns' AND column_name = 'data'
+            """)).scalar()
+            if data_type is None:
+                # Fresh database, create_all builds everything
+                return
+
+            if data_type == 'text':
+                # Pattern data used to be stored as JSON text; anything that does
+                # not parse is kept as a JSON string rather than failing the upgrade
+                logger.info("Converting patterns.data from text to jsonb")
+                connection.execute(text("""
+                    CREATE FUNCTION pg_temp.try_jsonb(value text) RETURNS jsonb AS $$
+                    BEGIN
+                        RETURN value::jsonb;
+                    EXCEPTION WHEN others THEN
+                        RETURN to_jsonb(value);
+                    END;
+                    $$ LANGUAGE plpgsql IMMUTABLE
+                """))
+                connection.execute(text(
+                    "ALTER TABLE patterns ALTER COLUMN data TYPE jsonb USING pg_temp.try_jsonb(data)"
+                ))
+
+            connection.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_patterns_importance_id ON patterns (importance DESC, id)"
+            ))
+
+            has_surrogate_id = connection.execute(text("""
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema() AND table_name = 'acknowledged_patterns'
+                    AND column_name = 'id'
+            """)).scalar()
+            if has_surrogate_id:
+                # Acks used to be keyed by a surrogate id, and before the unique
+                # constraint existed the same ack could be stored more than once
+                logger.info("Keying acknowledged_patterns on (validator_hotkey, pattern_id)")
+                connection.execute(text("""
+                    DELETE FROM acknowledged_patterns a
+                    USING acknowledged_patterns b
+                    WHERE a.validator_hotkey = b.validator_hotkey
+                        AND a.pattern_id = b.pattern_id
+                        AND a.id > b.id
+                """))
+                constraints = connection.execute(text("""
+                    SELECT conname FROM pg_constraint
+                    WHERE conrelid = 'acknowledged_patterns'::regclass AND contype IN ('p', 'u')
+                """)).scalars().all()
+                for constraint in constraints:
+                    connection.execute(text(f'ALTER TABLE acknowledged_patterns DROP CONSTRAINT "{constraint}"'))
+                connection.execute(text("ALTER TABLE acknowledged_patterns DROP COLUMN id"))
+                connection.execute(text(
+                    "ALTER TABLE acknowledged_patterns "
+                    "ADD CONSTRAINT pk_acknowledged_patterns PRIMARY KEY (validator_hotkey, pattern_id)"
+                ))
+                # Covered by the primary key's leading column
+                connection.execute(text("DROP INDEX IF EXISTS ix_acknowledged_patterns_validator_hotkey"))
+                connection.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_acknowledged_patterns_pattern_id "
+                    "ON acknowledged_patterns (pattern_id)"
+                ))
+
+    def _install_pattern_notify_trigger(self):
+        """Create the trigger that NOTIFYs PATTERNS_CHANNEL with the id of every inserted pattern."""
+        with self.engine.begin() as connection:
+            connection.execute(text(f"""
+                CREATE OR REPLACE FUNCTION notify_pattern() RETURNS trigger AS $$
+                BEGIN
+                    PERFORM pg_notify('{PATTERNS_CHANNEL}', NEW.id::text);
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql
+            """))
+            connection.execute(text("DROP TRIGGER IF EXISTS patterns_notify ON patterns"))
+            connection.execute(text(
+                "CREATE TRIGGER patterns_notify AFTER INSERT ON patterns "
+                "FOR EACH ROW EXECUTE FUNCTION notify_pattern()"
+            ))
+
+    def _listen_for_pattern_changes(self):
+        """Background loop clearing the query cache whenever a pattern is inserted."""
+        while not self._listener_stop.is_set():
+            try:
+                # A dedicated connection, detached from the pool, stays in LISTEN mode
+                pooled = self.engine.raw_connection()
+                connection = pooled.driver_connection  # None once detached
+                pooled.detach()
+                try:
+                    connection.autocommit = True
+                    cursor = connection.cursor()
+                    cursor.execute(f"LISTEN {PATTERNS_CHANNEL}")
+                    cursor.close()
+                    # Anything inserted while we were not listening may be cached already
+                    self._invalidate_unacknowledged()
+
+                    while not self._listener_stop.is_set():
+                        if callable(connection.notifies):
+                            # psycopg 3
+                            notified = any(True for _ in connection.notifies(timeout=5.0))
+                        else:
+                            # psycopg2
+                            if wait_for_readable([connection], [], [], 5.0) == ([], [], []):
+                                continue
+                            connection.poll()
+                            notified = bool(connection.notifies)
+                            connection.notifies.clear()
+                        if notified:
+                            self._invalidate_unacknowledged()
+                finally:
+                    connection.close()
+            except Exception as e:
+                logger.warning(f"Pattern notification listener failed, retrying: {e}")
+                self._listener_stop.wait(5.0)
     
     def get_session(self) -> Session:
         """Get a new database session."""
@@ -98,73 +373,135 @@ class DataManager:
         validator_hotkey: str
     ) -> Pattern | None:
 
-        with self.get_session() as session:
-            raw_sql = text("""
-                SELECT p.id, p.pattern_id, p.network, p.asset_symbol, p.asset_contract,
-                       p.data, p.timestamp, p.importance
-                FROM patterns p
-                LEFT JOIN acknowledged_patterns ap ON p.id = ap.pattern_id
-                    AND ap.validator_hotkey = :validator_hotkey
-                WHERE ap.pattern_id IS NULL
-                ORDER BY p.id ASC, p.importance DESC
-                LIMIT 1
-            """)
-            
-            result = session.execute(raw_sql, {"validator_hotkey": validator_hotkey}).fetchone()
-            
-            if result is None:
-                return None
-            
-            # Create Pattern object from raw result
-            pattern = Pattern(
-                id=result.id,
-                pattern_id=result.pattern_id,
-                network=result.network,
-                asset_symbol=result.asset_symbol,
-                asset_contract=result.asset_contract,
-                data=result.data,
-                timestamp=result.timestamp,
-                importance=result.importance
+        now = time.monotonic()
+        cached = self._unacknowledged_cache.get(validator_hotkey)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        generation = self._unacknowledged_generation
+        pattern = self._query_unacknowledged_pattern(validator_hotkey)
+
+        with self._unacknowledged_lock:
+            if generation != self._unacknowledged_generation:
+                # Patterns or acks were written while we queried: the result may be stale
+                return pattern
+            if len(self._unacknowledged_cache) >= self.unacknowledged_cache_maxsize:
+                cache = {
+                    hotkey: entry for hotkey, entry in self._unacknowledged_cache.items() if entry[0] > now
+                }
+                self._unacknowledged_cache = cache if len(cache) < self.unacknowledged_cache_maxsize else {}
+            self._unacknowledged_cache[validator_hotkey] = (now + self.unacknowledged_cache_ttl, pattern)
+
+        return pattern
+
+    def _invalidate_unacknowledged(self, validator_hotkeys: Optional[Iterable[str]] = None):
+        """Drop cached get_unacknowledged_patterns results of validator_hotkeys, or all of them."""
+        with self._unacknowledged_lock:
+            self._unacknowledged_generation += 1
+            if validator_hotkeys is None:
+                self._unacknowledged_cache = {}
+            else:
+                for validator_hotkey in validator_hotkeys:
+                    self._unacknowledged_cache.pop(validator_hotkey, None)
+
+    def _query_unacknowledged_pattern(self, validator_hotkey: str) -> Pattern | None:
+
+        patterns = self.get_unacknowledged_patterns_batch(validator_hotkey, 1)
+        return patterns[0] if patterns else None
+
+    def get_unacknowledged_patterns_batch(self, validator_hotkey: str, limit: int) -> List[Pattern]:
+        """
+        Get up to limit patterns the validator has not acknowledged, most important first.
+
+        Uncached, unlike get_unacknowledged_patterns; serves batched queries
+        with a single round trip.
+
+        Args:
+            validator_hotkey: Hotkey of the querying validator
+            limit: Maximum number of patterns to return
+
+        Returns:
+            List of Pattern objects, in the order get_unacknowledged_patterns would serve them
+        """
+        with self.engine.connect() as connection:
+            result = connection.execute(
+                _UNACKNOWLEDGED_PATTERNS, {"validator_hotkey": validator_hotkey, "limit": limit}
             )
             
-            return pattern
+            # Create Pattern objects from raw results
+            return [
+                Pattern(
+                    id=row.id,
+                    pattern_id=row.pattern_id,
+                    network=row.network,
+                    asset_symbol=row.asset_symbol,
+                    asset_contract=row.asset_contract,
+                    data=row.data,
+                    timestamp=row.timestamp,
+                    importance=row.importance
+                )
+                for row in result
+            ]
 
     def acknowledge_pattern(self, pattern_id: int, validator_hotkey: str) -> bool:
 
-        with self.get_session() as session:
-            pattern = session.query(Pattern).filter(Pattern.id == pattern_id).first()
-            if not pattern:
-                return False
-            
-            # Check if already acknowledged by this validator
-            existing_ack = session.query(AcknowledgedPattern).filter(
-                and_(
-                    AcknowledgedPattern.pattern_id == pattern_id,
-                    AcknowledgedPattern.validator_hotkey == validator_hotkey
-                )
-            ).first()
-            
-            if existing_ack:
-                # Already acknowledged
-                return True
-            
-            # Create new acknowledgment
-            acknowledgment = AcknowledgedPattern(
-                pattern_id=pattern_id,
-                validator_hotkey=validator_hotkey,
-                timestamp=datetime.utcnow()
-            )
-            
-            session.add(acknowledgment)
-            session.commit()
-            return True
+        # Single idempotent upsert; the unique constraint makes repeated acks a no-op
+        # and the foreign key rejects acks for patterns that do not exist.
+        statement = pg_insert(AcknowledgedPattern).values(
+            pattern_id=pattern_id,
+            validator_hotkey=validator_hotkey,
+            timestamp=datetime.utcnow()
+        ).on_conflict_do_nothing(index_elements=['pattern_id', 'validator_hotkey'])
+
+        try:
+            with self.engine.begin() as connection:
+                connection.execute(statement)
+        except IntegrityError:
+            return False
+
+        self._invalidate_unacknowledged([validator_hotkey])
+        self._ack_count_cache.pop(pattern_id, None)
+        return True
+
+    def acknowledge_and_summarize(self, pattern_id: int, validator_hotkey: str) -> Tuple[bool, int, int]:
+        """
+        Acknowledge a pattern and report the resulting counts in one round trip.
+
+        Args:
+            pattern_id: The database ID of the pattern
+            validator_hotkey: Hotkey of the acknowledging validator
+
+        Returns:
+            (success, patterns still unacknowledged by the validator,
+            acknowledgments of the pattern), as acknowledge_pattern,
+            get_unacknowledged_patterns and get_acknowledgment_count would
+            report them one after the other
+        """
+        try:
+            with self.engine.begin() as connection:
+                row = connection.execute(_ACKNOWLEDGE_AND_SUMMARIZE, {
+                    "pattern_id": pattern_id,
+                    "validator_hotkey": validator_hotkey,
+                    "timestamp": datetime.utcnow()
+                }).one()
+        except IntegrityError:
+            # Unknown pattern: nothing was acknowledged
+            with self.engine.connect() as connection:
+                unacknowledged = connection.execute(
+                    _UNACKNOWLEDGED_COUNT, {"validator_hotkey": validator_hotkey}
+                ).scalar_one()
+            return False, unacknowledged, 0
+
+        self._invalidate_unacknowledged([validator_hotkey])
+        self._ack_count_cache.pop(pattern_id, None)
+        return True, row.unacknowledged - row.inserted, row.acknowledgments + row.inserted
 
     def add_pattern(
         self,
         pattern_id: str,
         network: str,
         asset_symbol: str,
-        data: str,
+        data: Any,
         importance: int = 0,
         asset_contract: str = 'native'
     ) -> Optional[Pattern]:
@@ -175,7 +512,7 @@ class DataManager:
             pattern_id: Unique identifier for the pattern
             network: Network name
             asset_symbol: Asset symbol
-            data: Pattern data
+            data: The detected pattern(s) as JSON, in the layout read by core.protocol.patterns_from_json
             importance: Importance level (default: 0)
             asset_contract: Asset contract address (default: 'native')
             
@@ -196,7 +533,7 @@ class DataManager:
             
             session.add(pattern)
             session.commit()
-            session.refresh(pattern)
+            self._invalidate_unacknowledged()
             return pattern
             
         except Exception as e:
@@ -205,6 +542,175 @@ class DataManager:
         finally:
             session.close()
     
+    def add_patterns_bulk(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Add many patterns in a single COPY round trip, bypassing the ORM.
+
+        Prefer this over add_pattern when ingesting bursts of patterns.
+
+        Args:
+            rows: Dicts with the add_pattern arguments as keys
+                (pattern_id, network, asset_symbol, data, and optionally
+                importance and asset_contract)
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+
+        now = datetime.utcnow()
+        records = [
+            (
+                row['pattern_id'],
+                row['network'],
+                row['asset_symbol'],
+                row.get('asset_contract', 'native'),
+                row['data'],
+                row.get('timestamp', now),
+                row.get('importance', 0),
+            )
+            for row in rows
+        ]
+        connection = self.engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            self._copy_rows(
+                cursor,
+                "patterns",
+                ["pattern_id", "network", "asset_symbol", "asset_contract", "data", "timestamp", "importance"],
+                ["varchar", "varchar", "varchar", "varchar", "jsonb", "timestamp", "int4"],
+                records
+            )
+            cursor.close()
+            connection.commit()
+            self._invalidate_unacknowledged()
+            return len(records)
+
+        except Exception as e:
+            connection.rollback()
+            raise e
+        finally:
+            connection.close()
+
+    def acknowledge_pattern_keys(self, acks: Sequence[Tuple[str, str]]) -> int:
+        """
+        Record many acknowledgments, keyed by pattern_id string, in one statement.
+
+        This is the form PatternQueryAck carries. Each key acknowledges every
+        stored pattern with that pattern_id; unknown keys and repeated acks
+        are skipped.
+
+        Args:
+            acks: (pattern_id, validator_hotkey) pairs, possibly for several validators
+
+        Returns:
+            Number of newly recorded acknowledgments
+        """
+        if not acks:
+            return 0
+
+        acks = list(dict.fromkeys(acks))
+        with self.engine.begin() as connection:
+            inserted = connection.execute(_ACKNOWLEDGE_PATTERN_KEYS, {
+                "pattern_keys": [pattern_key for pattern_key, _ in acks],
+                "validator_hotkeys": [validator_hotkey for _, validator_hotkey in acks],
+                "timestamp": datetime.utcnow()
+            }).rowcount
+
+        self._invalidate_unacknowledged(validator_hotkey for _, validator_hotkey in acks)
+        # Acks are keyed by pattern_id string here, not by the cached row ids
+        self._ack_count_cache = {}
+        return inserted
+
+    def acknowledge_patterns_bulk(self, pattern_ids: Sequence[int], validator_hotkey: str) -> int:
+        """
+        Acknowledge many patterns for one validator in a single transaction.
+
+        Rows are COPYed into a temporary staging table and merged with
+        INSERT ... ON CONFLICT DO NOTHING, so repeated and unknown pattern ids
+        are skipped instead of failing the batch.
+
+        Args:
+            pattern_ids: Database IDs of the patterns to acknowledge
+            validator_hotkey: Hotkey of the acknowledging validator
+
+        Returns:
+            Number of newly recorded acknowledgments
+        """
+        if not pattern_ids:
+            return 0
+
+        now = datetime.utcnow()
+        records = [(pattern_id, validator_hotkey, now) for pattern_id in dict.fromkeys(pattern_ids)]
+
+        connection = self.engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute("""
+                CREATE TEMP TABLE acknowledged_patterns_stage (
+                    pattern_id BIGINT NOT NULL,
+                    validator_hotkey VARCHAR(255) NOT NULL,
+                    timestamp TIMESTAMP NOT NULL
+                ) ON COMMIT DROP
+            """)
+            self._copy_rows(
+                cursor,
+                "acknowledged_patterns_stage",
+                ["pattern_id", "validator_hotkey", "timestamp"],
+                ["int8", "varchar", "timestamp"],
+                records
+            )
+            cursor.execute("""
+                INSERT INTO acknowledged_patterns (pattern_id, validator_hotkey, timestamp)
+                SELECT s.pattern_id, s.validator_hotkey, s.timestamp
+                FROM acknowledged_patterns_stage s
+                JOIN patterns p ON p.id = s.pattern_id
+                ON CONFLICT (pattern_id, validator_hotkey) DO NOTHING
+            """)
+            inserted = cursor.rowcount
+            cursor.close()
+            connection.commit()
+            self._invalidate_unacknowledged([validator_hotkey])
+            for pattern_id in pattern_ids:
+                self._ack_count_cache.pop(pattern_id, None)
+            return inserted
+
+        except Exception as e:
+            connection.rollback()
+            raise e
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _copy_rows(cursor, table: str, columns: List[str], types: List[str], records: List[tuple]):
+        """COPY records into table on a raw DBAPI cursor, for psycopg 3 or psycopg2."""
+        column_list = ", ".join(columns)
+        jsonb_positions = [position for position, column_type in enumerate(types) if column_type == "jsonb"]
+        if hasattr(cursor, 'copy'):
+            # psycopg 3: stream typed rows using the binary COPY format
+            from psycopg.types.json import Jsonb
+
+            with cursor.copy(f"COPY {table} ({column_list}) FROM STDIN WITH (FORMAT BINARY)") as copy:
+                copy.set_types(types)
+                for record in records:
+                    if jsonb_positions:
+                        record = list(record)
+                        for position in jsonb_positions:
+                            record[position] = Jsonb(record[position], dumps=_json_dumps)
+                    copy.write_row(record)
+        else:
+            # psycopg2: buffer the batch as CSV and send it with copy_expert
+            if jsonb_positions:
+                records = [list(record) for record in records]
+                for record in records:
+                    for position in jsonb_positions:
+                        record[position] = _json_dumps(record[position])
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(records)
+            buffer.seek(0)
+            cursor.copy_expert(f"COPY {table} ({column_list}) FROM STDIN WITH (FORMAT CSV)", buffer)
+
     def get_pattern_by_id(self, pattern_id: int) -> Optional[Pattern]:
         """
         Get a pattern by its database ID.
@@ -215,11 +721,25 @@ class DataManager:
         Returns:
             Pattern object if found, None otherwise
         """
-        session = self.get_session()
-        try:
-            return session.query(Pattern).filter(Pattern.id == pattern_id).first()
-        finally:
-            session.close()
+        pattern = self._pattern_cache.get(pattern_id)
+        if pattern is not None:
+            self._pattern_cache.move_to_end(pattern_id)
+            return pattern
+
+        with self.engine.connect() as connection:
+            result = connection.execute(
+                select(Pattern.__table__).where(Pattern.id == pattern_id).limit(1)
+            ).fetchone()
+
+        # Misses are not cached: the id may be assigned by a later insert
+        if result is None:
+            return None
+
+        pattern = Pattern(**result._mapping)
+        self._pattern_cache[pattern_id] = pattern
+        if len(self._pattern_cache) > self.pattern_cache_maxsize:
+            self._pattern_cache.popitem(last=False)
+        return pattern
     
     def get_acknowledgment_count(self, pattern_id: int) -> int:
         """
@@ -231,29 +751,49 @@ class DataManager:
         Returns:
             Number of acknowledgments
         """
-        session = self.get_session()
-        try:
-            return session.query(AcknowledgedPattern).filter(
-                AcknowledgedPattern.pattern_id == pattern_id
-            ).count()
-        finally:
-            session.close()
+        now = time.monotonic()
+        cached = self._ack_count_cache.get(pattern_id)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        with self.engine.connect() as connection:
+            count = connection.execute(_ACKNOWLEDGMENT_COUNT, {"pattern_id": pattern_id}).scalar_one()
+
+        if len(self._ack_count_cache) >= self.ack_count_cache_maxsize:
+            self._ack_count_cache = {
+                key: entry for key, entry in list(self._ack_count_cache.items()) if entry[0] > now
+            }
+            if len(self._ack_count_cache) >= self.ack_count_cache_maxsize:
+                self._ack_count_cache.clear()
+        self._ack_count_cache[pattern_id] = (now + self.ack_count_cache_ttl, count)
+        return count
     
     def close(self):
-        """Close the database engine."""
+        """Stop the notification listener and close the database engine."""
+        self._listener_stop.set()
+        if self._listener_thread is not None:
+            self._listener_thread.join(timeout=10.0)
         self.engine.dispose()
 
+        with _MANAGERS_LOCK:
+            if _MANAGERS.get(self.database_url) is self:
+                del _MANAGERS[self.database_url]
+
 
 # Convenience function to create a DataManager instance
 def create_data_manager(database_url: Optional[str] = None, role: str = "miner") -> DataManager:
     """
-    Create a DataManager instance.
+    Get the shared DataManager for a database, creating it on first use.
     
     Args:
         database_url: SQLAlchemy database URL. If None, uses PostgreSQL with default configuration.
         role: Either "miner" or "validator" to determine which database to connect to
         
     Returns:
-        DataManager instance
+        DataManager instance, reused across calls with the same URL
     """
-    return DataManager(database_url, role)
\ No newline at end of file
+    url = database_url or get_database_url(role)
+    with _MANAGERS_LOCK:
+        if url not in _MANAGERS:
+            _MANAGERS[url] = DataManager(url)
+        return _MANAGERS[url]
\ No newline at end of file
@@ -16,14 +16,24 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import base64
+import binascii
+import hashlib
+import io
+import re
+import sys
 import time
 import typing
 from dataclasses import dataclass, field
 from decimal import Decimal
-from enum import Enum
-from typing import List, Optional, Dict, Any
+from functools import cached_property
+from operator import attrgetter
+from enum import IntEnum
+from typing import List, Optional, Dict, Any, Mapping, Tuple
 
-import bittensor as bt
+import msgspec
+import numpy as np
+import zstandard
 
 # Chainswarm Patterns Subnet Protocol
 # This protocol enables distributed detection of malicious transaction patterns across blockchains.
@@ -36,7 +46,14 @@ import bittensor as bt
 # 3. Validator verifies patterns on-chain, classifies, scores, and stores
 # 4. Validator updates miner reputation based on pattern quality
 
+# Edge amounts are integers in the asset's smallest unit (wei, satoshi, ...)
+DEFAULT_DECIMALS = 18
+_INT64_MAX = np.iinfo(np.int64).max
+_edge_amount = attrgetter("amount")
+
 # ---- Usage Examples ----
+# PatternQuery, PatternQueryBatch and PatternQueryAck are defined in core.synapses and resolved
+# lazily from this module, so bittensor is only imported when they are used.
 
 # Validator side:
 #   query = PatternQuery()
@@ -50,55 +67,145 @@ import bittensor as bt
 #   axon = bt.axon().attach(handle_pattern_query).serve(netuid=...).start()
 
 
-class PatternType(Enum):
+class PatternType(IntEnum):
     """Types of malicious transaction patterns that can be detected"""
-    SMURFING = "smurfing"                    # Breaking large transactions into smaller ones
-    LAYERING = "layering"                    # Complex chains to obscure transaction origin
-    CIRCULAR_TRANSFER = "circular_transfer"   # Tokens moving in loops
-    WASH_TRADING = "wash_trading"            # Artificial volume creation
-    MIXER_TUMBLER = "mixer_tumbler"          # Privacy coin mixing patterns
-    SUSPICIOUS_VOLUME = "suspicious_volume"   # Unusual volume patterns
-    RAPID_FIRE = "rapid_fire"                # High-frequency micro-transactions
-    CUSTOM = "custom"                        # Novel emerging patterns
+    SMURFING = 0             # Breaking large transactions into smaller ones
+    LAYERING = 1             # Complex chains to obscure transaction origin
+    CIRCULAR_TRANSFER = 2    # Tokens moving in loops
+    WASH_TRADING = 3         # Artificial volume creation
+    MIXER_TUMBLER = 4        # Privacy coin mixing patterns
+    SUSPICIOUS_VOLUME = 5    # Unusual volume patterns
+    RAPID_FIRE = 6           # High-frequency micro-transactions
+    CUSTOM = 7               # Novel emerging patterns
+
+    @property
+    def label(self) -> str:
+        """String name used when serializing the pattern type"""
+        return _PATTERN_LABELS[self]
+
+    @classmethod
+    def from_label(cls, label: str) -> "PatternType":
+        """Look up a pattern type by its serialized string name"""
+        return _PATTERN_BY_LABEL[label]
+
+    @classmethod
+    def from_value(cls, value: int) -> "PatternType":
+        """Look up a pattern type by its stored integer value, bypassing Enum call dispatch"""
+        if value < 0:
+            raise ValueError(f"{value} is not a valid PatternType")
+        try:
+            return _PATTERN_BY_VALUE[value]
+        except IndexError:
+            raise ValueError(f"{value} is not a valid PatternType") from None
+
+
+# Indexed by PatternType value
+_PATTERN_LABELS = (
+    "smurfing",
+    "layering",
+    "circular_transfer",
+    "wash_trading",
+    "mixer_tumbler",
+    "suspicious_volume",
+    "rapid_fire",
+    "custom",
+)
+_PATTERN_BY_LABEL = {label: PatternType(value) for value, label in enumerate(_PATTERN_LABELS)}
+# Values are contiguous from 0, so a tuple index replaces the Enum lookup
+_PATTERN_BY_VALUE = tuple(PatternType)
 
 
-@dataclass
+def normalize_address(address: str) -> str:
+    """
+    Canonical form of an address: 0x-hex (EVM) addresses are lowercased, since
+    their checksum casing carries no identity; other encodings (base58, SS58)
+    are case-sensitive and kept as given. The result is interned, as the same
+    hub addresses repeat across many edges and graphs.
+    """
+    if address.startswith("0x") and not address.islower():
+        address = address.lower()
+    return sys.intern(address)
+
+
+@dataclass(slots=True, frozen=True)
 class GraphNode:
     """
     Represents a blockchain address in the transaction graph.
     
     Attributes:
-        address: The blockchain address (e.g., Ethereum address, Bitcoin address)
+        address: The blockchain address (e.g., Ethereum address, Bitcoin address), normalized by normalize_address
         node_type: Type of address ("eoa", "contract", "exchange", "mixer", "unknown")
-        metadata: Additional information about the address
+        metadata: Additional information about the address (None when absent)
     """
     address: str
     node_type: str  # "eoa", "contract", "exchange", "mixer", "unknown"
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Mapping[str, Any]] = field(default=None, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "address", normalize_address(self.address))
+
+
+@dataclass(slots=True, frozen=True)
+class EdgeMetadata:
+    """
+    Typed transaction details attached to a graph edge.
+    
+    Attributes:
+        block_number: Block the transaction was included in
+        gas_used: Gas consumed by the transaction
+        gas_price: Gas price paid, in the chain's smallest unit
+        extra: Any other chain-specific fields (None when absent)
+    """
+    block_number: Optional[int] = None
+    gas_used: Optional[int] = None
+    gas_price: Optional[int] = None
+    extra: Optional[Mapping[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "EdgeMetadata":
+        """Build from a free-form dict, keeping unknown keys in extra"""
+        extra = {key: value for key, value in data.items() if key not in _EDGE_METADATA_FIELDS}
+        return cls(
+            block_number=data.get("block_number"),
+            gas_used=data.get("gas_used"),
+            gas_price=data.get("gas_price"),
+            extra=extra or None,
+        )
+
 
+_EDGE_METADATA_FIELDS = frozenset(("block_number", "gas_used", "gas_price"))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class GraphEdge:
     """
     Represents a transaction between two addresses in the graph.
     
     Attributes:
-        from_address: Source address of the transaction
-        to_address: Destination address of the transaction
-        amount: Transaction amount in the asset's base unit
+        from_address: Source address of the transaction, normalized by normalize_address
+        to_address: Destination address of the transaction, normalized by normalize_address
+        amount: Transaction amount as an integer in the asset's smallest unit (wei, satoshi, ...)
         transaction_hash: Blockchain transaction hash for verification
         timestamp: Unix timestamp when transaction occurred
-        metadata: Additional transaction information (gas fees, block number, etc.)
+        metadata: Additional transaction information (block number, gas; None when absent)
     """
     from_address: str
     to_address: str
-    amount: Decimal
+    amount: int
     transaction_hash: str
     timestamp: int
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[EdgeMetadata] = field(default=None, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "from_address", normalize_address(self.from_address))
+        object.__setattr__(self, "to_address", normalize_address(self.to_address))
 
+    def amount_as_decimal(self, decimals: int = DEFAULT_DECIMALS) -> Decimal:
+        """Get the amount in asset units, for display"""
+        return Decimal(self.amount).scaleb(-decimals)
 
-@dataclass
+
+@dataclass(frozen=True)
 class TransactionGraph:
     """
     Graph structure representing a pattern of connected transactions.
@@ -109,39 +216,263 @@ class TransactionGraph:
     Attributes:
         nodes: List of addresses involved in the pattern
         edges: List of transactions connecting the addresses
+        decimals: Number of decimal places of the asset, used to turn edge amounts into asset units
     """
     nodes: List[GraphNode]
     edges: List[GraphEdge]
+    decimals: int = DEFAULT_DECIMALS
     
+    # Not slotted: the lookup indexes below are cached_property values kept in
+    # the instance __dict__, built on first use. Call invalidate_indexes()
+    # after mutating the node or edge lists of a graph that has been queried.
+
+    _INDEXES = (
+        '_nodes_by_address', '_outgoing_edges', '_incoming_edges', '_successors',
+        '_amounts', '_address_ids', '_edge_arrays', '_canonical_bytes', '_csr', '_derived',
+    )
+
+    def invalidate_indexes(self) -> None:
+        """Drop the cached lookup indexes so they are rebuilt on next use"""
+        for name in self._INDEXES:
+            self.__dict__.pop(name, None)
+
+    @cached_property
+    def _derived(self) -> Dict[str, Any]:
+        return {}
+
+    def derived_cache(self) -> Dict[str, Any]:
+        """
+        Get a dict for caching values other modules derive from this graph
+        (signatures, hashes). Cleared by invalidate_indexes() with the indexes.
+        """
+        return self._derived
+
+    @cached_property
+    def _nodes_by_address(self) -> Dict[str, GraphNode]:
+        # Reversed so that the first node wins for duplicate addresses
+        return {node.address: node for node in reversed(self.nodes)}
+
+    @cached_property
+    def _outgoing_edges(self) -> Dict[str, List[GraphEdge]]:
+        outgoing: Dict[str, List[GraphEdge]] = {}
+        for edge in self.edges:
+            outgoing.setdefault(edge.from_address, []).append(edge)
+        return outgoing
+
+    @cached_property
+    def _incoming_edges(self) -> Dict[str, List[GraphEdge]]:
+        incoming: Dict[str, List[GraphEdge]] = {}
+        for edge in self.edges:
+            incoming.setdefault(edge.to_address, []).append(edge)
+        return incoming
+
+    @cached_property
+    def _successors(self) -> Dict[str, Tuple[str, ...]]:
+        # Distinct neighbour addresses, in first-seen edge order
+        return {
+            address: tuple(dict.fromkeys(edge.to_address for edge in edges))
+            for address, edges in self._outgoing_edges.items()
+        }
+
+    def get_successor_addresses(self, address: str) -> Tuple[str, ...]:
+        """Get the distinct addresses an address sends funds to"""
+        return self._successors.get(address, ())
+
     def get_node_by_address(self, address: str) -> Optional[GraphNode]:
         """Get a node by its address"""
-        for node in self.nodes:
-            if node.address == address:
-                return node
-        return None
+        return self._nodes_by_address.get(address)
     
     def get_edges_from_address(self, address: str) -> List[GraphEdge]:
         """Get all outgoing edges from an address"""
-        return [edge for edge in self.edges if edge.from_address == address]
+        return list(self._outgoing_edges.get(address, ()))
     
     def get_edges_to_address(self, address: str) -> List[GraphEdge]:
         """Get all incoming edges to an address"""
-        return [edge for edge in self.edges if edge.to_address == address]
+        return list(self._incoming_edges.get(address, ()))
     
+    @cached_property
+    def _amounts(self) -> Optional[np.ndarray]:
+        # None when the amounts or their sum could overflow int64
+        amounts = list(map(_edge_amount, self.edges))
+        if amounts and max(map(abs, amounts)) * len(amounts) > _INT64_MAX:
+            return None
+        return np.fromiter(amounts, dtype=np.int64, count=len(amounts))
+
+    def to_asset_units(self, amount: int) -> Decimal:
+        """Convert an amount in the smallest unit into asset units"""
+        return Decimal(amount).scaleb(-self.decimals)
+
+    def get_total_volume_base_units(self) -> int:
+        """Calculate total transaction volume in the asset's smallest unit"""
+        amounts = self._amounts
+        if amounts is None:
+            return sum(map(_edge_amount, self.edges))
+        return int(amounts.sum())
+
     def get_total_volume(self) -> Decimal:
-        """Calculate total transaction volume in the pattern"""
-        return sum(edge.amount for edge in self.edges)
+        """Calculate total transaction volume in the pattern, in asset units"""
+        return self.to_asset_units(self.get_total_volume_base_units())
     
     def get_unique_addresses(self) -> set:
         """Get all unique addresses in the pattern"""
-        addresses = set()
+        return self._outgoing_edges.keys() | self._incoming_edges.keys()
+
+    @cached_property
+    def _address_ids(self) -> Dict[str, int]:
+        # Dense ids in first-seen edge order
+        ids: Dict[str, int] = {}
         for edge in self.edges:
-            addresses.add(edge.from_address)
-            addresses.add(edge.to_address)
-        return addresses
+            ids.setdefault(edge.from_address, len(ids))
+            ids.setdefault(edge.to_address, len(ids))
+        return ids
+
+    @cached_property
+    def _edge_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        ids = self._address_ids
+        count = len(self.edges)
+        from_idx = np.fromiter((ids[edge.from_address] for edge in self.edges), dtype=np.int32, count=count)
+        to_idx = np.fromiter((ids[edge.to_address] for edge in self.edges), dtype=np.int32, count=count)
+        amounts = self._amounts
+        if amounts is None:
+            amounts = np.array(list(map(_edge_amount, self.edges)), dtype=object)
+        return from_idx, to_idx, amounts
+
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the edges as parallel arrays (from_idx, to_idx, amounts).
+
+        Addresses are interned to dense int32 ids in first-seen edge order.
+        Amounts are int64, or Python ints (object dtype) when int64 could overflow.
+        The arrays are cached and must not be modified.
+        """
+        return self._edge_arrays
+
+    def get_address_volumes(self) -> Dict[str, int]:
+        """Calculate the outgoing volume of every address, in the asset's smallest unit"""
+        from_idx, _, amounts = self._edge_arrays
+        if amounts.dtype == object:
+            volumes: Dict[str, int] = {}
+            for edge in self.edges:
+                volumes[edge.from_address] = volumes.get(edge.from_address, 0) + edge.amount
+            return volumes
+        totals = np.zeros(len(self._address_ids), dtype=np.int64)
+        np.add.at(totals, from_idx, amounts)
+        return {
+            address: int(totals[index])
+            for address, index in self._address_ids.items()
+            if address in self._outgoing_edges
+        }
+
+
+    @cached_property
+    def _canonical_bytes(self) -> bytes:
+        nodes = sorted((node.address, node.node_type) for node in self.nodes)
+        edges = sorted(
+            (edge.from_address, edge.to_address, edge.transaction_hash, _pack_amount(edge.amount), edge.timestamp)
+            for edge in self.edges
+        )
+        return _ENCODER.encode([self.decimals, nodes, edges])
+
+    def canonical_bytes(self) -> bytes:
+        """
+        Get a deterministic MessagePack image of the graph.
+
+        Nodes and edges are sorted, so graphs that differ only in ordering
+        encode identically. Metadata is not included.
+        """
+        return self._canonical_bytes
+
+
+    @cached_property
+    def _csr(self) -> "CSRGraph":
+        from_idx, to_idx, amounts = self._edge_arrays
+        # Stable, so each address keeps its edges in their original order
+        order = np.argsort(from_idx, kind="stable")
+        counts = np.bincount(from_idx, minlength=len(self._address_ids))
+        indptr = np.zeros(len(counts) + 1, dtype=np.int32)
+        np.cumsum(counts, out=indptr[1:])
+        edges = self.edges
+        return CSRGraph(
+            addresses=tuple(self._address_ids),
+            indptr=indptr,
+            indices=to_idx[order],
+            amounts=amounts[order],
+            transaction_hashes=np.array([edges[i].transaction_hash for i in order.tolist()], dtype=object),
+            timestamps=np.fromiter((edges[i].timestamp for i in order.tolist()), dtype=np.int64, count=len(edges)),
+        )
 
+    def to_csr(self) -> "CSRGraph":
+        """Get the edges in compressed sparse row form (cached; do not modify)"""
+        return self._csr
 
-@dataclass
+    @classmethod
+    def from_csr(cls, csr: "CSRGraph", nodes: List[GraphNode], decimals: int = DEFAULT_DECIMALS) -> "TransactionGraph":
+        """Build a graph from CSR edges. Edge metadata is not part of the CSR form and is dropped."""
+        return cls(nodes=nodes, edges=list(csr.iter_edges()), decimals=decimals)
+
+
+@dataclass(slots=True, frozen=True)
+class CSRGraph:
+    """
+    Edges of a transaction graph in compressed sparse row form.
+    
+    The outgoing edges of the address with id i occupy positions
+    indptr[i]:indptr[i + 1] of the per-edge arrays.
+    
+    Attributes:
+        addresses: Address of each dense id
+        indptr: Row offsets, one more than the number of addresses (int32)
+        indices: Destination address id of each edge (int32)
+        amounts: Edge amounts (int64, or Python ints when int64 could overflow)
+        transaction_hashes: Transaction hash of each edge
+        timestamps: Timestamp of each edge (int64)
+    """
+    addresses: Tuple[str, ...]
+    indptr: np.ndarray
+    indices: np.ndarray
+    amounts: np.ndarray
+    transaction_hashes: np.ndarray
+    timestamps: np.ndarray
+
+    def successor_ids(self, address_id: int) -> np.ndarray:
+        """Destination ids of an address's outgoing edges (a view, not a copy)"""
+        return self.indices[self.indptr[address_id]:self.indptr[address_id + 1]]
+
+    def iter_edges(self) -> typing.Iterator[GraphEdge]:
+        """Materialize the edges as GraphEdge objects, grouped by source address"""
+        addresses = self.addresses
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        amounts = self.amounts.tolist()
+        timestamps = self.timestamps.tolist()
+        for source in range(len(addresses)):
+            for position in range(indptr[source], indptr[source + 1]):
+                yield GraphEdge(
+                    from_address=addresses[source],
+                    to_address=addresses[indices[position]],
+                    amount=amounts[position],
+                    transaction_hash=self.transaction_hashes[position],
+                    timestamp=timestamps[position],
+                )
+
+
+def batch_total_volume(graphs: List[TransactionGraph]) -> List[int]:
+    """Calculate the total volume of each graph, in the asset's smallest unit"""
+    arrays = [graph._amounts for graph in graphs]
+    if any(amounts is None for amounts in arrays):
+        return [graph.get_total_volume_base_units() for graph in graphs]
+
+    lengths = np.fromiter((len(amounts) for amounts in arrays), dtype=np.int64, count=len(arrays))
+    totals = np.zeros(len(arrays), dtype=np.int64)
+    non_empty = lengths > 0
+    if non_empty.any():
+        # Each graph's own sum is known to fit in int64, so per-segment sums are safe
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        totals[non_empty] = np.add.reduceat(np.concatenate(arrays), offsets[non_empty])
+    return [int(total) for total in totals]
+
+
+@dataclass(slots=True)
 class DetectedPattern:
     """
     Raw pattern detected by a miner.
@@ -160,72 +491,315 @@ class DetectedPattern:
     asset_symbol: str
     detection_timestamp: int
     
-    def __post_init__(self):
-        """Validate the pattern data"""
-        if not self.transaction_graph.nodes:
-            raise ValueError("Pattern must have at least one node")
-        if not self.transaction_graph.edges:
-            raise ValueError("Pattern must have at least one edge")
-        if not self.blockchain:
-            raise ValueError("Blockchain must be specified")
-        if not self.asset_symbol:
-            raise ValueError("Asset symbol must be specified")
-
-
-class PatternQuery(bt.Synapse):
-    """
-    Primary communication synapse for pattern detection queries.
-    
-    This synapse handles the simple query-response pattern:
-    1. Validator sends empty query to miner
-    2. Miner fills detected_patterns with any new patterns found
-    3. Validator processes the patterns
-    
-    The design is intentionally minimal - miners only submit raw transaction graphs,
-    and validators handle all the complex processing (classification, scoring, verification).
-    
-    Attributes:
-        query_timestamp: When the validator sent the query
-        detected_patterns: List of patterns detected by the miner (filled by miner)
-    """
-
-    # miners patter id, defined individually on the miner side, used for sending back ACKs
-    pattern_id: str
+    # Construction does not validate; patterns coming from another neuron are
+    # checked once via validate() where they are decoded (see unpack_patterns
+    # and PatternQuery.deserialize).
 
-    # Request fields (filled by validator)
-    query_timestamp: int = field(default_factory=lambda: int(time.time()))
-    
-    # Response fields (filled by miner)
-    detected_patterns: Optional[List[DetectedPattern]] = None
-    
-    def deserialize(self) -> List[DetectedPattern]:
+    def validate(self) -> "DetectedPattern":
         """
-        Deserialize the response from the miner.
-        
+        Validate the pattern data.
+
         Returns:
-            List of detected patterns, or empty list if none found
-            
-        Example:
-            >>> query = PatternQuery()
-            >>> response = await dendrite.query(axons=[miner], synapse=query)
-            >>> patterns = response.deserialize()
-            >>> print(f"Received {len(patterns)} patterns")
+            This pattern, so the call can be chained
+
+        Raises:
+            ValueError: If a required part of the pattern is missing
         """
-        return self.detected_patterns or []
-    
-    def has_patterns(self) -> bool:
-        """Check if the miner found any patterns"""
-        return bool(self.detected_patterns)
-    
-    def get_pattern_count(self) -> int:
-        """Get the number of patterns detected"""
-        return len(self.detected_patterns) if self.detected_patterns else 0
+        graph = self.transaction_graph
+        if graph.nodes and graph.edges and self.blockchain and self.asset_symbol:
+            return self
+        for value, message in (
+            (graph.nodes, "Pattern must have at least one node"),
+            (graph.edges, "Pattern must have at least one edge"),
+            (self.blockchain, "Blockchain must be specified"),
+            (self.asset_symbol, "Asset symbol must be specified"),
+        ):
+            if not value:
+                raise ValueError(message)
+
+    def pattern_hash(self) -> str:
+        """Content hash of the pattern: a 16-byte BLAKE2b digest as hex"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(_ENCODER.encode([self.blockchain, self.asset_symbol]))
+        digest.update(self.transaction_graph.canonical_bytes())
+        return digest.hexdigest()
+
+
+# ---- Wire encoding ----
+# Detected patterns travel as base64(zstd(msgpack(...))). Lowercase 0x-hex
+# addresses and hashes are packed as raw bytes and amounts that fit are packed
+# as int64. Anything else is kept as a string so the round trip is lossless.
+
+_LOWERCASE_HEX = re.compile(r"0x(?:[0-9a-f]{2})+")
+_ZSTD_LEVEL = 3
+# Cap on the decompressed payload of unpack_patterns; blobs come from miners,
+# so a small zstd bomb must not be able to expand without limit
+_MAX_UNPACKED_SIZE = 16 * 1024 * 1024
+
+
+def _pack_hex(value: str) -> typing.Union[str, bytes]:
+    if _LOWERCASE_HEX.fullmatch(value):
+        return bytes.fromhex(value[2:])
+    return value
+
+
+def _unpack_hex(value: Any) -> str:
+    if isinstance(value, bytes):
+        return "0x" + value.hex()
+    if not isinstance(value, str):
+        raise ValueError(f"Malformed pattern payload: expected str or bytes, got {type(value).__name__}")
+    return value
+
+
+def _pack_amount(amount: int) -> typing.Union[int, str]:
+    if abs(amount) <= _INT64_MAX:
+        return amount
+    return str(amount)
+
+
+def _unpack_amount(value: typing.Union[int, str]) -> int:
+    return int(value)
+
+
+def _pack_metadata(metadata: Optional[Mapping[str, Any]]) -> Optional[Dict[str, Any]]:
+    return dict(metadata) if metadata is not None else None
+
+
+def _pack_edge_metadata(metadata: typing.Union[EdgeMetadata, Mapping[str, Any], None]) -> Optional[list]:
+    if metadata is None:
+        return None
+    if not isinstance(metadata, EdgeMetadata):
+        # Legacy free-form dict
+        metadata = EdgeMetadata.from_dict(metadata)
+    return [metadata.block_number, metadata.gas_used, metadata.gas_price, _pack_metadata(metadata.extra)]
+
+
+def _unpack_edge_metadata(metadata: "Optional[_EdgeMetadataWire]") -> Optional[EdgeMetadata]:
+    if metadata is None:
+        return None
+    return EdgeMetadata(metadata.block_number, metadata.gas_used, metadata.gas_price, metadata.extra)
+
+
+# Typed mirrors of the wire payload, so the decoder checks the shape of every
+# record while parsing. Hex-like fields are either a str or the raw bytes;
+# msgspec cannot decode that union, so they are typed Any and checked in _unpack_hex.
+class _NodeWire(msgspec.Struct, array_like=True):
+    address: Any
+    node_type: str
+    metadata: Optional[Dict[str, Any]]
+
+
+class _EdgeMetadataWire(msgspec.Struct, array_like=True):
+    block_number: Optional[int]
+    gas_used: Optional[int]
+    gas_price: Optional[int]
+    extra: Optional[Dict[str, Any]]
+
+
+class _EdgeWire(msgspec.Struct, array_like=True):
+    from_address: Any
+    to_address: Any
+    amount: typing.Union[int, str]
+    transaction_hash: Any
+    timestamp: int
+    metadata: Optional[_EdgeMetadataWire]
+
+
+class _PatternWire(msgspec.Struct, array_like=True):
+    blockchain: str
+    asset_symbol: str
+    detection_timestamp: int
+    decimals: int
+    nodes: List[_NodeWire]
+    edges: List[_EdgeWire]
 
-class PatternQueryAck(bt.Synapse):
-    pattern_id: str
 
-    def deserialize(self):
-        return self.pattern_id
+_ENCODER = msgspec.msgpack.Encoder(enc_hook=str)
+_DECODER = msgspec.msgpack.Decoder(List[_PatternWire])
+
+
+def pack_patterns(patterns: List[DetectedPattern]) -> str:
+    """Encode detected patterns into the compact wire format"""
+    payload = [
+        [
+            pattern.blockchain,
+            pattern.asset_symbol,
+            pattern.detection_timestamp,
+            pattern.transaction_graph.decimals,
+            [
+                [_pack_hex(node.address), node.node_type, _pack_metadata(node.metadata)]
+                for node in pattern.transaction_graph.nodes
+            ],
+            [
+                [
+                    _pack_hex(edge.from_address),
+                    _pack_hex(edge.to_address),
+                    _pack_amount(edge.amount),
+                    _pack_hex(edge.transaction_hash),
+                    edge.timestamp,
+                    _pack_edge_metadata(edge.metadata),
+                ]
+                for edge in pattern.transaction_graph.edges
+            ],
+        ]
+        for pattern in patterns
+    ]
+    packed = _ENCODER.encode(payload)
+    compressed = zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(packed)
+    return base64.b64encode(compressed).decode("ascii")
+
+
+def unpack_patterns(blob: str, validate: bool = True) -> List[DetectedPattern]:
+    """
+    Decode patterns produced by pack_patterns.
+
+    Args:
+        blob: The packed patterns
+        validate: Check every pattern with DetectedPattern.validate(); pass
+            False only for payloads from a trusted source
+
+    Raises:
+        ValueError: If the payload is malformed, decompresses to more than
+            _MAX_UNPACKED_SIZE bytes, or a pattern is invalid
+    """
+    try:
+        compressed = base64.b64decode(blob, validate=True)
+        # Streamed, so at most one byte past the cap is ever decompressed
+        reader = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(compressed))
+        packed = reader.read(_MAX_UNPACKED_SIZE + 1)
+    except (binascii.Error, zstandard.ZstdError) as e:
+        raise ValueError(f"Malformed pattern payload: {e}") from e
+    if len(packed) > _MAX_UNPACKED_SIZE:
+        raise ValueError(f"Pattern payload exceeds {_MAX_UNPACKED_SIZE} bytes when decompressed")
+    try:
+        payload = _DECODER.decode(packed)
+    except msgspec.DecodeError as e:
+        raise ValueError(f"Malformed pattern payload: {e}") from e
+    patterns = [
+        DetectedPattern(
+            transaction_graph=TransactionGraph(
+                nodes=[
+                    GraphNode(address=_unpack_hex(node.address), node_type=node.node_type, metadata=node.metadata)
+                    for node in pattern.nodes
+                ],
+                edges=[
+                    GraphEdge(
+                        from_address=_unpack_hex(edge.from_address),
+                        to_address=_unpack_hex(edge.to_address),
+                        amount=_unpack_amount(edge.amount),
+                        transaction_hash=_unpack_hex(edge.transaction_hash),
+                        timestamp=edge.timestamp,
+                        metadata=_unpack_edge_metadata(edge.metadata),
+                    )
+                    for edge in pattern.edges
+                ],
+                decimals=pattern.decimals,
+            ),
+            blockchain=pattern.blockchain,
+            asset_symbol=pattern.asset_symbol,
+            detection_timestamp=pattern.detection_timestamp,
+        )
+        for pattern in payload
+    ]
+    if validate:
+        for pattern in patterns:
+            pattern.validate()
+    return patterns
+
+
+# Keyed mirrors of DetectedPattern for patterns_from_json; unknown keys are ignored
+class _EdgeMetadataJson(msgspec.Struct):
+    block_number: Optional[int] = None
+    gas_used: Optional[int] = None
+    gas_price: Optional[int] = None
+    extra: Optional[Dict[str, Any]] = None
+
+
+class _NodeJson(msgspec.Struct):
+    address: str
+    node_type: str
+    metadata: Optional[Dict[str, Any]] = None
+
+
+class _EdgeJson(msgspec.Struct):
+    from_address: str
+    to_address: str
+    amount: typing.Union[int, str]
+    transaction_hash: str
+    timestamp: int
+    metadata: Optional[_EdgeMetadataJson] = None
+
+
+class _GraphJson(msgspec.Struct):
+    nodes: List[_NodeJson]
+    edges: List[_EdgeJson]
+    decimals: int = DEFAULT_DECIMALS
+
+
+class _PatternJson(msgspec.Struct):
+    transaction_graph: _GraphJson
+    blockchain: str
+    asset_symbol: str
+    detection_timestamp: int
+
+
+def patterns_from_json(data: Any, validate: bool = True) -> List[DetectedPattern]:
+    """
+    Build patterns from their JSON form, as a miner stores them.
+
+    Args:
+        data: One decoded JSON object, or a list of them, keyed by the
+            DetectedPattern field names (the dataclasses.asdict layout).
+            Amounts may be integers or decimal strings, since JSON numbers
+            cannot hold every 256-bit amount.
+        validate: Check every pattern with DetectedPattern.validate()
+
+    Raises:
+        ValueError: If the data does not have that layout or a pattern is invalid
+    """
+    try:
+        records = msgspec.convert(data if isinstance(data, list) else [data], List[_PatternJson])
+    except msgspec.ValidationError as e:
+        raise ValueError(f"Malformed pattern JSON: {e}") from e
+    patterns = [
+        DetectedPattern(
+            transaction_graph=TransactionGraph(
+                nodes=[
+                    GraphNode(address=node.address, node_type=node.node_type, metadata=node.metadata)
+                    for node in record.transaction_graph.nodes
+                ],
+                edges=[
+                    GraphEdge(
+                        from_address=edge.from_address,
+                        to_address=edge.to_address,
+                        amount=_unpack_amount(edge.amount),
+                        transaction_hash=edge.transaction_hash,
+                        timestamp=edge.timestamp,
+                        metadata=_unpack_edge_metadata(edge.metadata),
+                    )
+                    for edge in record.transaction_graph.edges
+                ],
+                decimals=record.transaction_graph.decimals,
+            ),
+            blockchain=record.blockchain,
+            asset_symbol=record.asset_symbol,
+            detection_timestamp=record.detection_timestamp,
+        )
+        for record in records
+    ]
+    if validate:
+        for pattern in patterns:
+            pattern.validate()
+    return patterns
+
+
+def __getattr__(name: str):
+    # The bittensor synapses live in core.synapses so that importing the
+    # plain pattern dataclasses does not pull in bittensor and torch.
+    if name in ("PatternQuery", "PatternQueryBatch", "PatternQueryAck"):
+        from core import synapses
+        return getattr(synapses, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def create_sample_pattern() -> DetectedPattern:
@@ -242,28 +816,30 @@ def create_sample_pattern() -> DetectedPattern:
         GraphNode(address="0x9abc...ijkl", node_type="contract")
     ]
     
+    now = int(time.time())
+    
     # Create sample edges (circular pattern)
     edges = [
         GraphEdge(
             from_address="0x1234...abcd",
             to_address="0x5678...efgh",
-            amount=Decimal("100.0"),
+            amount=100 * 10 ** 18,
             transaction_hash="0xabc123...",
-            timestamp=int(time.time()) - 3600
+            timestamp=now - 3600
         ),
         GraphEdge(
             from_address="0x5678...efgh",
             to_address="0x9abc...ijkl",
-            amount=Decimal("95.0"),
+            amount=95 * 10 ** 18,
             transaction_hash="0xdef456...",
-            timestamp=int(time.time()) - 3000
+            timestamp=now - 3000
         ),
         GraphEdge(
             from_address="0x9abc...ijkl",
             to_address="0x1234...abcd",
-            amount=Decimal("90.0"),
+            amount=90 * 10 ** 18,
             transaction_hash="0xghi789...",
-            timestamp=int(time.time()) - 1800
+            timestamp=now - 1800
         )
     ]
     
@@ -275,5 +851,5 @@ def create_sample_pattern() -> DetectedPattern:
         transaction_graph=graph,
         blockchain="ethereum",
         asset_symbol="ETH",
-        detection_timestamp=int(time.time())
+        detection_timestamp=now
     )
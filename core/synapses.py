@@ -0,0 +1,132 @@
+# The MIT License (MIT)
+# Copyright © 2023 Yuma Rao
+# Copyright © 2024 Chainswarm Patterns Subnet
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import time
+from dataclasses import field
+from typing import List, Optional
+
+import bittensor as bt
+
+from core.protocol import DetectedPattern, pack_patterns, unpack_patterns
+
+# Bittensor synapses for the Chainswarm Patterns Subnet protocol.
+# Kept apart from core.protocol so that the pattern dataclasses can be used
+# without importing bittensor; core.protocol re-exports these lazily.
+
+
+class PatternQuery(bt.Synapse):
+    """
+    Primary communication synapse for pattern detection queries.
+    
+    This synapse handles the simple query-response pattern:
+    1. Validator sends empty query to miner
+    2. Miner fills detected_patterns with any new patterns found
+    3. Validator processes the patterns
+    
+    The design is intentionally minimal - miners only submit raw transaction graphs,
+    and validators handle all the complex processing (classification, scoring, verification).
+    
+    Attributes:
+        query_timestamp: When the validator sent the query
+        detected_patterns: List of patterns detected by the miner (filled by miner)
+    """
+
+    # miners patter id, defined individually on the miner side, used for sending back ACKs
+    pattern_id: str
+
+    # Request fields (filled by validator)
+    query_timestamp: int = field(default_factory=lambda: int(time.time()))
+    
+    # Response fields (filled by miner)
+    detected_patterns: Optional[List[DetectedPattern]] = None
+
+    # Compact wire form of detected_patterns, set by pack()
+    packed_patterns: Optional[str] = None
+
+    def pack(self) -> "PatternQuery":
+        """
+        Move detected_patterns into packed_patterns before the response is sent.
+
+        Returns:
+            This synapse, so handlers can `return synapse.pack()`
+        """
+        if self.detected_patterns:
+            self.packed_patterns = pack_patterns(self.detected_patterns)
+            self.detected_patterns = None
+        return self
+    
+    def deserialize(self) -> List[DetectedPattern]:
+        """
+        Deserialize the response from the miner.
+        
+        Returns:
+            List of detected patterns, or empty list if none found
+            
+        Example:
+            >>> query = PatternQuery()
+            >>> response = await dendrite.query(axons=[miner], synapse=query)
+            >>> patterns = response.deserialize()
+            >>> print(f"Received {len(patterns)} patterns")
+        """
+        if self.packed_patterns:
+            return unpack_patterns(self.packed_patterns)
+        return [pattern.validate() for pattern in self.detected_patterns or []]
+    
+    def has_patterns(self) -> bool:
+        """Check if the miner found any patterns"""
+        return bool(self.detected_patterns) or bool(self.packed_patterns)
+    
+    def get_pattern_count(self) -> int:
+        """Get the number of patterns detected"""
+        return len(self.deserialize())
+
+
+class PatternQueryBatch(bt.Synapse):
+    """
+    Several pattern queries to one miner in a single round trip.
+    
+    The miner answers each query in queries with a different unacknowledged
+    pattern, so a validator collects a batch without awaiting one request
+    per pattern.
+    
+    Attributes:
+        queries: Queries to fill (filled by miner)
+    """
+
+    queries: List[PatternQuery] = []
+
+    def deserialize(self) -> List[List[DetectedPattern]]:
+        """Deserialize each query of the response, in order"""
+        return [query.deserialize() for query in self.queries]
+
+
+class PatternQueryAck(bt.Synapse):
+    """
+    Acknowledgment that a validator has stored a pattern.
+    
+    Attributes:
+        pattern_id: Key of the acknowledged pattern
+        accepted: Whether the miner queued the ack for writing (filled by
+            miner); False when its ack queue is full, so resend it later
+    """
+
+    pattern_id: str
+    accepted: Optional[bool] = None
+
+    def deserialize(self):
+        return self.pattern_id
@@ -155,6 +155,34 @@ def add_miner_args(cls, parser):
         default=False,
     )
 
+    parser.add_argument(
+        "--miner.max_concurrent_queries",
+        type=int,
+        help="Maximum number of pattern queries served from the database at once.",
+        default=10,
+    )
+
+    parser.add_argument(
+        "--miner.query_wait_timeout",
+        type=float,
+        help="Seconds a pattern query waits for a database slot before it is answered empty.",
+        default=1.0,
+    )
+
+    parser.add_argument(
+        "--miner.max_batch_query",
+        type=int,
+        help="Maximum number of queries answered per PatternQueryBatch; extra queries are dropped from the reply.",
+        default=64,
+    )
+
+    parser.add_argument(
+        "--miner.ack_queue_size",
+        type=int,
+        help="Maximum number of pattern acks waiting to be written; acks beyond it are answered with accepted=False.",
+        default=10000,
+    )
+
     parser.add_argument(
         "--wandb.project_name",
         type=str,
@@ -232,6 +260,16 @@ def add_validator_args(cls, parser):
         default=4096,
     )
 
+    parser.add_argument(
+        "--neuron.event_loop",
+        type=str,
+        choices=["asyncio", "uvloop"],
+        # uvloop (libuv) cuts per-request overhead when verifying patterns
+        #   against many blockchain RPCs; it is optional and must be installed separately.
+        help="Event loop implementation that runs the validator's async tasks.",
+        default="asyncio",
+    )
+
     parser.add_argument(
         "--wandb.project_name",
         type=str,
@@ -16,16 +16,192 @@
 # DEALINGS IN THE SOFTWARE.
 
 import hashlib
-import json
+import sqlite3
+import threading
 import time
+from collections import OrderedDict, defaultdict, deque
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Optional
+from typing import Deque, List, Dict, Tuple, Optional
 
-from core.protocol import DetectedPattern, TransactionGraph
+import numpy as np
+import xxhash
+
+from core.protocol import CSRGraph, DetectedPattern, TransactionGraph
 from core.validator.pattern_processing import MinerReputation
 
 
-@dataclass
+# DFS colors for cycle counting
+_WHITE, _GREY, _BLACK = 0, 1, 2
+
+# Length of the truncated digests used as registry keys
+_HASH_KEY_BYTES = 16
+
+# Number of independently locked shards in the deduplication registries
+_DEDUP_SHARDS = 64
+
+
+def _node_addresses(graph: TransactionGraph) -> frozenset:
+    memo = graph.derived_cache()
+    if 'node_addresses' not in memo:
+        memo['node_addresses'] = frozenset(node.address for node in graph.nodes)
+    return memo['node_addresses']
+
+
+# MinHash sketches of graph address sets, used to pick which recent
+# submissions get an exact address-overlap check. Seeds are drawn per process
+# so that miners cannot grind addresses against known hash functions.
+_MINHASH_SIZE = 128
+_MINHASH_RNG = np.random.default_rng()
+_MINHASH_SEED = int(_MINHASH_RNG.integers(2 ** 63))
+_MINHASH_SALTS = _MINHASH_RNG.integers(0, 2 ** 64, size=_MINHASH_SIZE, dtype=np.uint64, endpoint=False)
+# Estimated Jaccard below which a pair is not checked exactly. With 128
+# hashes, a true overlap above 0.5 estimates this low with probability ~1e-6.
+_MINHASH_CANDIDATE_JACCARD = 0.3
+
+
+def _mix64(values: np.ndarray) -> np.ndarray:
+    # splitmix64 finalizer; uint64 arithmetic wraps
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+def _address_sketch(graph: TransactionGraph) -> np.ndarray:
+    memo = graph.derived_cache()
+    if 'address_sketch' not in memo:
+        addresses = _node_addresses(graph)
+        base = np.fromiter(
+            (xxhash.xxh3_64_intdigest(address.encode(), seed=_MINHASH_SEED) for address in addresses),
+            dtype=np.uint64,
+            count=len(addresses),
+        )
+        memo['address_sketch'] = _mix64(base[:, None] ^ _MINHASH_SALTS).min(
+            axis=0, initial=np.iinfo(np.uint64).max
+        )
+    return memo['address_sketch']
+
+
+def _log2_bucket(value: int) -> int:
+    # Zero can never be similar to a non-zero count, so it gets a far-away bucket
+    return value.bit_length() - 1 if value > 0 else -16
+
+
+def _signature_bucket(signature: 'GraphSignature') -> Tuple[int, int, int]:
+    return (
+        _log2_bucket(signature.node_count),
+        _log2_bucket(signature.edge_count),
+        _log2_bucket(signature.max_degree),
+    )
+
+
+def _bucket_offsets() -> Tuple[Tuple[int, int, int], ...]:
+    # Two counts k log2-buckets apart differ by more than 1 - 2 ** (1 - k)
+    # relative to the larger one. similarity_score > 0.7 needs the three
+    # relative differences to sum below 0.9, so keep only the offset triples
+    # whose lower bounds can.
+    def lower_bound(offset: int) -> float:
+        return max(0.0, 1 - 2.0 ** (1 - abs(offset)))
+    
+    span = range(-4, 5)
+    return tuple(
+        (n, e, d)
+        for n in span for e in span for d in span
+        if lower_bound(n) + lower_bound(e) + lower_bound(d) < 0.9
+    )
+
+
+_SIGNATURE_BUCKET_OFFSETS = _bucket_offsets()
+
+
+def _int_column(values: List[int]) -> np.ndarray:
+    # int64 when every value fits, otherwise Python ints (object dtype)
+    try:
+        return np.array(values, dtype=np.int64)
+    except OverflowError:
+        return np.array(values, dtype=object)
+
+
+def _column_bytes(column: np.ndarray) -> bytes:
+    if column.dtype != object:
+        return b'\x00' + column.astype('<i8', copy=False).tobytes()
+    parts = [b'\x01']
+    for value in column.tolist():
+        value_bytes = value.to_bytes((value.bit_length() + 8) // 8, 'little', signed=True)
+        parts.append(len(value_bytes).to_bytes(2, 'little'))
+        parts.append(value_bytes)
+    return b''.join(parts)
+
+
+def _address_ranks(graph: TransactionGraph) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Get the graph's addresses in sorted order, with the from and to columns of
+    its edges as ranks into that list. Ranks order like the addresses
+    themselves, so sorting on them is sorting on the addresses.
+    """
+    memo = graph.derived_cache()
+    if 'address_ranks' not in memo:
+        from_idx, to_idx, _ = graph.to_arrays()
+        addresses = graph.to_csr().addresses  # first-seen order, indexed by the ids above
+        order = sorted(range(len(addresses)), key=addresses.__getitem__)
+        rank_of_id = np.empty(len(addresses), dtype=np.int32)
+        rank_of_id[order] = np.arange(len(addresses), dtype=np.int32)
+        memo['address_ranks'] = (
+            [addresses[i] for i in order],
+            rank_of_id[from_idx],
+            rank_of_id[to_idx],
+        )
+    return memo['address_ranks']
+
+
+def _hash_edge_columns(graph: TransactionGraph, amounts: np.ndarray, timestamps: np.ndarray, sort_keys, digest=None) -> bytes:
+    """
+    Hash the graph's edges as sorted (from, to, amount, timestamp) columns.
+    
+    sort_keys picks the column order as np.lexsort does (last key is the
+    primary one), from the names 'from', 'to', 'amount' and 'timestamp'.
+    The edges are sorted in NumPy and the columns hashed as contiguous
+    little-endian arrays, after the sorted address table they index into.
+    
+    Uses SHA-256 unless another hashlib-style digest object is given. Returns
+    the first 16 bytes of the digest; 128 bits is ample for deduplication keys
+    and halves the memory of the hash registries.
+    """
+    if digest is None:
+        digest = hashlib.sha256()
+    addresses, from_rank, to_rank = _address_ranks(graph)
+    columns = {'from': from_rank, 'to': to_rank, 'amount': amounts, 'timestamp': timestamps}
+    order = np.lexsort([columns[key] for key in sort_keys])
+    
+    digest.update(len(addresses).to_bytes(4, 'little'))
+    for address in addresses:
+        address_bytes = address.encode()
+        digest.update(len(address_bytes).to_bytes(2, 'little'))
+        digest.update(address_bytes)
+    digest.update(len(order).to_bytes(4, 'little'))
+    digest.update(from_rank[order].astype('<u4').tobytes())
+    digest.update(to_rank[order].astype('<u4').tobytes())
+    digest.update(_column_bytes(amounts[order]))
+    digest.update(_column_bytes(timestamps[order]))
+    return digest.digest()[:_HASH_KEY_BYTES]
+
+
+def _relative_diff(a: int, b: int) -> float:
+    # |a - b| / max(a, b) for non-negative counts; equal counts (including 0, 0) differ by nothing
+    if a == b:
+        return 0.0
+    return (a - b) / a if a > b else (b - a) / b
+
+
+def _similarity(nodes: int, edges: int, degree: int, other_nodes: int, other_edges: int, other_degree: int) -> float:
+    similarity = 1.0 - (
+        _relative_diff(nodes, other_nodes)
+        + _relative_diff(edges, other_edges)
+        + _relative_diff(degree, other_degree)
+    ) / 3.0
+    return similarity if similarity > 0.0 else 0.0
+
+
+@dataclass(slots=True, frozen=True)
 class GraphSignature:
     """Structural signature of a transaction graph for similarity detection"""
     node_count: int
@@ -34,21 +210,17 @@ class GraphSignature:
     cycle_count: int
     diameter: int
     clustering_coefficient: float
-    degree_distribution: List[int]
+    degree_distribution: Tuple[int, ...]
     
     def similarity_score(self, other: 'GraphSignature') -> float:
         """Calculate similarity score between signatures"""
-        # Normalize differences
-        node_diff = abs(self.node_count - other.node_count) / max(self.node_count, other.node_count)
-        edge_diff = abs(self.edge_count - other.edge_count) / max(self.edge_count, other.edge_count)
-        degree_diff = abs(self.max_degree - other.max_degree) / max(self.max_degree, other.max_degree)
-        
-        # Calculate overall similarity
-        similarity = 1.0 - (node_diff + edge_diff + degree_diff) / 3.0
-        return max(0.0, similarity)
+        return _similarity(
+            self.node_count, self.edge_count, self.max_degree,
+            other.node_count, other.edge_count, other.max_degree,
+        )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DiscoveryRegistrationResult:
     """Result of pattern discovery registration for first-discovery rule"""
     is_first_discovery: bool
@@ -58,7 +230,7 @@ class DiscoveryRegistrationResult:
     credit_multiplier: float  # 0.0 = no credit, 0.5 = partial, 1.0 = full
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GamingAnalysisResult:
     """Result of comprehensive gaming analysis"""
     gaming_flags: List[str]
@@ -71,7 +243,7 @@ class GamingAnalysisResult:
         return self.overall_gaming_probability > 0.8 or "coordination_detected" in self.gaming_flags
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AddressAgeAnalysis:
     """Analysis of address ages in pattern"""
     new_address_count: int
@@ -81,7 +253,7 @@ class AddressAgeAnalysis:
     confidence: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComplexityAuthenticityAnalysis:
     """Analysis of pattern complexity authenticity"""
     circular_ratio: float
@@ -92,7 +264,7 @@ class ComplexityAuthenticityAnalysis:
     confidence: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CoordinationAnalysis:
     """Analysis of coordination between miners"""
     coordination_indicators: List[str]
@@ -103,18 +275,52 @@ class CoordinationAnalysis:
 class PatternDeduplicationEngine:
     """Advanced pattern deduplication using graph similarity algorithms"""
     
+    # Safe to share between validation threads. Writes take the lock of one
+    # shard, picked by the first byte of the pattern hash or by the signature
+    # bucket, so concurrent registrations rarely contend. Reads take no lock:
+    # single dict lookups and list iteration are atomic under the GIL.
+
     def __init__(self):
         self.similarity_threshold = 0.85  # 85% similarity = duplicate
-        self.stored_pattern_hashes = {}   # Quick hash lookup
+        # Quick hash lookup, sharded: pattern_hash -> pattern_id
+        self.hash_shards: List[Dict[bytes, str]] = [{} for _ in range(_DEDUP_SHARDS)]
+        self.shard_locks: List[threading.Lock] = [threading.Lock() for _ in range(_DEDUP_SHARDS)]
         self.graph_signatures = {}        # Graph structural signatures
+        # Log-scale (node_count, edge_count, max_degree) bucket -> (pattern id, node_count, edge_count, max_degree)
+        self.signature_buckets: Dict[Tuple[int, int, int], List[Tuple[str, int, int, int]]] = {}
+    
+    def register_pattern(self, pattern_id: str, pattern: DetectedPattern) -> str:
+        """
+        Store an accepted pattern so later submissions are checked against it
+        
+        Returns:
+            The id the pattern's hash is registered under: pattern_id, or the id
+            of an identical pattern registered first, possibly by another thread
+        """
+        pattern_hash = self._calculate_pattern_hash(pattern)
+        shard = pattern_hash[0] % _DEDUP_SHARDS
+        with self.shard_locks[shard]:
+            owner = self.hash_shards[shard].setdefault(pattern_hash, pattern_id)
+        if owner != pattern_id:
+            return owner
+        
+        signature = self._calculate_graph_signature(pattern)
+        self.graph_signatures[pattern_id] = signature
+        bucket_key = _signature_bucket(signature)
+        with self.shard_locks[hash(bucket_key) % _DEDUP_SHARDS]:
+            self.signature_buckets.setdefault(bucket_key, []).append(
+                (pattern_id, signature.node_count, signature.edge_count, signature.max_degree)
+            )
+        return pattern_id
     
     def is_duplicate_pattern(self, new_pattern: DetectedPattern) -> Tuple[bool, List[str]]:
         """Check if pattern is duplicate of existing patterns"""
         
         # Level 1: Quick hash check
         pattern_hash = self._calculate_pattern_hash(new_pattern)
-        if pattern_hash in self.stored_pattern_hashes:
-            return True, [self.stored_pattern_hashes[pattern_hash]]
+        owner = self.hash_shards[pattern_hash[0] % _DEDUP_SHARDS].get(pattern_hash)
+        if owner is not None:
+            return True, [owner]
         
         # Level 2: Graph signature similarity
         graph_signature = self._calculate_graph_signature(new_pattern)
@@ -128,45 +334,62 @@ class PatternDeduplicationEngine:
         
         return False, []
     
-    def _calculate_pattern_hash(self, pattern: DetectedPattern) -> str:
+    def _calculate_pattern_hash(self, pattern: DetectedPattern) -> bytes:
         """Calculate quick hash for exact duplicate detection"""
-        # Normalize addresses and amounts for consistent hashing
-        normalized_edges = []
-        for edge in pattern.transaction_graph.edges:
-            normalized_edges.append((
-                edge.from_address.lower(),
-                edge.to_address.lower(),
-                str(edge.amount),
-                edge.timestamp
-            ))
-        
-        # Sort for consistent ordering
-        normalized_edges.sort()
-        hash_input = json.dumps(normalized_edges, sort_keys=True)
-        return hashlib.sha256(hash_input.encode()).hexdigest()
+        memo = pattern.transaction_graph.derived_cache()
+        if 'pattern_hash' not in memo:
+            memo['pattern_hash'] = self._hash_pattern_edges(pattern.transaction_graph)
+        return memo['pattern_hash']
+    
+    def _hash_pattern_edges(self, graph: TransactionGraph) -> bytes:
+        # Sorted by from, to, amount, timestamp for a consistent ordering. This
+        # key only deduplicates within this validator, so the non-cryptographic
+        # XXH3 is enough; the first-discovery hash, which decides rewards
+        # between miners, stays on SHA-256.
+        _, _, amounts = graph.to_arrays()
+        timestamps = _int_column([edge.timestamp for edge in graph.edges])
+        return _hash_edge_columns(
+            graph, amounts, timestamps, ('timestamp', 'amount', 'to', 'from'), xxhash.xxh3_128()
+        )
     
     def _calculate_graph_signature(self, pattern: DetectedPattern) -> GraphSignature:
         """Calculate structural signature for similarity detection"""
-        graph = pattern.transaction_graph
+        memo = pattern.transaction_graph.derived_cache()
+        if 'signature' not in memo:
+            memo['signature'] = self._build_graph_signature(pattern.transaction_graph)
+        return memo['signature']
+    
+    def _build_graph_signature(self, graph: TransactionGraph) -> GraphSignature:
+        csr, degree = self._build_graph_indices(graph)
         
         return GraphSignature(
             node_count=len(graph.nodes),
             edge_count=len(graph.edges),
-            max_degree=self._calculate_max_degree(graph),
-            cycle_count=self._count_cycles(graph),
+            max_degree=int(degree.max(initial=0)),
+            cycle_count=self._count_cycles(graph, csr),
             diameter=self._calculate_diameter(graph),
             clustering_coefficient=self._calculate_clustering(graph),
-            degree_distribution=self._calculate_degree_distribution(graph)
+            degree_distribution=self._calculate_degree_distribution(degree)
         )
     
     def _find_similar_signatures(self, signature: GraphSignature) -> List[str]:
         """Find patterns with similar graph signatures"""
         similar_patterns = []
-        
-        for pattern_id, stored_signature in self.graph_signatures.items():
-            similarity = signature.similarity_score(stored_signature)
-            if similarity > 0.7:  # Threshold for detailed analysis
-                similar_patterns.append(pattern_id)
+        nodes, edges, degree = _signature_bucket(signature)
+        node_count, edge_count, max_degree = signature.node_count, signature.edge_count, signature.max_degree
+        
+        # Only buckets that can hold a signature above the threshold are probed
+        for node_offset, edge_offset, degree_offset in _SIGNATURE_BUCKET_OFFSETS:
+            bucket = self.signature_buckets.get((nodes + node_offset, edges + edge_offset, degree + degree_offset))
+            if not bucket:
+                continue
+            for pattern_id, other_nodes, other_edges, other_degree in bucket:
+                # A node count difference above 90% alone keeps the score below 0.7
+                if abs(node_count - other_nodes) * 10 > max(node_count, other_nodes) * 9:
+                    continue
+                similarity = _similarity(node_count, edge_count, max_degree, other_nodes, other_edges, other_degree)
+                if similarity > 0.7:  # Threshold for detailed analysis
+                    similar_patterns.append(pattern_id)
         
         return similar_patterns
     
@@ -176,44 +399,50 @@ class PatternDeduplicationEngine:
         # For now, return a placeholder
         return 0.0
     
-    def _calculate_max_degree(self, graph: TransactionGraph) -> int:
-        """Calculate maximum degree in the graph"""
-        degree_count = {}
-        
-        for edge in graph.edges:
-            degree_count[edge.from_address] = degree_count.get(edge.from_address, 0) + 1
-            degree_count[edge.to_address] = degree_count.get(edge.to_address, 0) + 1
-        
-        return max(degree_count.values()) if degree_count else 0
-    
-    def _count_cycles(self, graph: TransactionGraph) -> int:
-        """Count cycles in the graph"""
-        # Simplified cycle counting
-        visited = set()
+    def _build_graph_indices(self, graph: TransactionGraph) -> Tuple[CSRGraph, np.ndarray]:
+        """Get the graph's CSR edges and the degree of every address (indexed by dense address id)"""
+        # The CSR form is built once and cached on the graph, so the hash,
+        # degree and cycle passes all share it
+        csr = graph.to_csr()
+        degree = np.diff(csr.indptr) + np.bincount(csr.indices, minlength=len(csr.addresses))
+        return csr, degree
+    
+    def _count_cycles(self, graph: TransactionGraph, csr: Optional[CSRGraph] = None) -> int:
+        """Count cycles in the graph as DFS back edges"""
+        if csr is None:
+            csr = graph.to_csr()
+        
+        indptr = csr.indptr.tolist()
+        indices = csr.indices.tolist()
+        address_ids = {address: address_id for address_id, address in enumerate(csr.addresses)}
+        
+        # Iterative DFS: GREY addresses are on the current branch, BLACK ones are finished.
+        # Stack entries are [address id, next edge position].
+        color = bytearray(len(indptr) - 1)
         cycles = 0
         
         for node in graph.nodes:
-            if node.address not in visited:
-                cycles += self._dfs_cycle_count(graph, node.address, set(), visited)
-        
-        return cycles
-    
-    def _dfs_cycle_count(self, graph: TransactionGraph, address: str, path: set, global_visited: set) -> int:
-        """DFS-based cycle counting"""
-        if address in path:
-            return 1
-        
-        if address in global_visited:
-            return 0
-        
-        global_visited.add(address)
-        path.add(address)
-        
-        cycles = 0
-        outgoing_edges = graph.get_edges_from_address(address)
-        
-        for edge in outgoing_edges:
-            cycles += self._dfs_cycle_count(graph, edge.to_address, path.copy(), global_visited)
+            root = address_ids.get(node.address)
+            if root is None or color[root] != _WHITE:
+                continue
+            
+            color[root] = _GREY
+            stack = [[root, indptr[root]]]
+            while stack:
+                frame = stack[-1]
+                address_id, position = frame
+                if position == indptr[address_id + 1]:
+                    color[address_id] = _BLACK
+                    stack.pop()
+                    continue
+                
+                frame[1] = position + 1
+                child = indices[position]
+                if color[child] == _GREY:
+                    cycles += 1
+                elif color[child] == _WHITE:
+                    color[child] = _GREY
+                    stack.append([child, indptr[child]])
         
         return cycles
     
@@ -227,53 +456,120 @@ class PatternDeduplicationEngine:
         # Simplified implementation
         return 0.5
     
-    def _calculate_degree_distribution(self, graph: TransactionGraph) -> List[int]:
-        """Calculate degree distribution"""
-        degree_count = {}
-        
-        for edge in graph.edges:
-            degree_count[edge.from_address] = degree_count.get(edge.from_address, 0) + 1
-            degree_count[edge.to_address] = degree_count.get(edge.to_address, 0) + 1
-        
-        # Return distribution as list
-        max_degree = max(degree_count.values()) if degree_count else 0
-        distribution = [0] * (max_degree + 1)
-        
-        for degree in degree_count.values():
-            distribution[degree] += 1
-        
-        return distribution
+    def _calculate_degree_distribution(self, degree: np.ndarray) -> Tuple[int, ...]:
+        """Calculate degree distribution from per-address degrees"""
+        # Return distribution as tuple: distribution[d] = number of addresses with degree d
+        if not degree.size:
+            return (0,)
+        return tuple(np.bincount(degree).tolist())
+
+
+class DiscoveryRegistry:
+    """
+    First discoveries keyed by canonical pattern hash, kept in two tiers.
+    
+    The most recently used entries live in an in-memory LRU of
+    (miner_hotkey, timestamp) tuples. Entries evicted from it move to a SQLite
+    table, in memory by default or in the file at cold_path, so that resident
+    memory stays bounded however long the validator runs. close() writes the
+    hot entries there too, so a file-backed registry keeps all of them.
+    """
+    
+    def __init__(self, hot_capacity: int = 100_000, cold_path: str = ":memory:"):
+        self.hot_capacity = hot_capacity
+        self.hot: 'OrderedDict[bytes, Tuple[str, int]]' = OrderedDict()
+        # Autocommit without fsync: like the hot tier, the cold tier is a cache
+        # of this validator's view, not a durable record
+        self.cold = sqlite3.connect(cold_path, isolation_level=None, check_same_thread=False)
+        self.cold.execute("PRAGMA synchronous = OFF")
+        self.cold.execute(
+            "CREATE TABLE IF NOT EXISTS discoveries ("
+            "pattern_hash BLOB PRIMARY KEY, miner_hotkey TEXT NOT NULL, timestamp INTEGER NOT NULL"
+            ") WITHOUT ROWID"
+        )
+    
+    def get(self, pattern_hash: bytes) -> Optional[Tuple[str, int]]:
+        """Get the (miner_hotkey, timestamp) of the first discovery, if any"""
+        entry = self.hot.get(pattern_hash)
+        if entry is not None:
+            self.hot.move_to_end(pattern_hash)
+            return entry
+        row = self.cold.execute(
+            "SELECT miner_hotkey, timestamp FROM discoveries WHERE pattern_hash = ?", (pattern_hash,)
+        ).fetchone()
+        if row is None:
+            return None
+        entry = (row[0], row[1])
+        self._put_hot(pattern_hash, entry)
+        return entry
+    
+    def add(self, pattern_hash: bytes, miner_hotkey: str, timestamp: int):
+        """Record a first discovery"""
+        self._put_hot(pattern_hash, (miner_hotkey, timestamp))
+    
+    def _put_hot(self, pattern_hash: bytes, entry: Tuple[str, int]):
+        self.hot[pattern_hash] = entry
+        if len(self.hot) > self.hot_capacity:
+            evicted_hash, (miner_hotkey, timestamp) = self.hot.popitem(last=False)
+            # Entries never change, so one promoted back from the cold tier is already there
+            self.cold.execute(
+                "INSERT OR IGNORE INTO discoveries (pattern_hash, miner_hotkey, timestamp) VALUES (?, ?, ?)",
+                (evicted_hash, miner_hotkey, timestamp),
+            )
+    
+    def __contains__(self, pattern_hash: bytes) -> bool:
+        return self.get(pattern_hash) is not None
+    
+    def close(self):
+        """Write the hot tier through to the cold tier and close it"""
+        # One transaction rather than one per row under autocommit
+        self.cold.execute("BEGIN")
+        self.cold.executemany(
+            "INSERT OR IGNORE INTO discoveries (pattern_hash, miner_hotkey, timestamp) VALUES (?, ?, ?)",
+            ((pattern_hash, miner_hotkey, timestamp) for pattern_hash, (miner_hotkey, timestamp) in self.hot.items()),
+        )
+        self.cold.execute("COMMIT")
+        self.cold.close()
 
 
 class FirstDiscoveryEnforcement:
     """Enforce first-discovery rule for pattern rewards"""
     
-    def __init__(self):
-        self.discovery_registry = {}  # pattern_hash -> (miner_hotkey, timestamp)
+    def __init__(self, hot_capacity: int = 100_000, cold_path: str = ":memory:"):
+        self.discovery_registry = DiscoveryRegistry(hot_capacity, cold_path)
         self.grace_period = 300       # 5 minutes grace period for network delays
     
     def register_pattern_discovery(
         self, 
         pattern: DetectedPattern, 
-        miner_hotkey: str
+        miner_hotkey: str,
+        now: Optional[int] = None
     ) -> DiscoveryRegistrationResult:
-        """Register pattern discovery and determine if miner gets credit"""
+        """
+        Register pattern discovery and determine if miner gets credit
+        
+        Args:
+            pattern: The submitted pattern
+            miner_hotkey: Hotkey of the submitting miner
+            now: Current Unix timestamp; batch callers can read the clock once and pass it in
+        """
         
         pattern_hash = self._calculate_canonical_pattern_hash(pattern)
-        current_time = int(time.time())
+        current_time = int(time.time()) if now is None else now
         
         # Check if pattern already discovered
-        if pattern_hash in self.discovery_registry:
-            first_discovery = self.discovery_registry[pattern_hash]
-            time_diff = current_time - first_discovery['timestamp']
+        first_discovery = self.discovery_registry.get(pattern_hash)
+        if first_discovery is not None:
+            first_discoverer, discovery_timestamp = first_discovery
+            time_diff = current_time - discovery_timestamp
             
             # Within grace period - both miners get partial credit
             if time_diff <= self.grace_period:
                 return DiscoveryRegistrationResult(
                     is_first_discovery=False,
                     is_within_grace_period=True,
-                    first_discoverer=first_discovery['miner_hotkey'],
-                    discovery_timestamp=first_discovery['timestamp'],
+                    first_discoverer=first_discoverer,
+                    discovery_timestamp=discovery_timestamp,
                     credit_multiplier=0.5  # Partial credit
                 )
             else:
@@ -281,16 +577,13 @@ class FirstDiscoveryEnforcement:
                 return DiscoveryRegistrationResult(
                     is_first_discovery=False,
                     is_within_grace_period=False,
-                    first_discoverer=first_discovery['miner_hotkey'],
-                    discovery_timestamp=first_discovery['timestamp'],
+                    first_discoverer=first_discoverer,
+                    discovery_timestamp=discovery_timestamp,
                     credit_multiplier=0.0  # No credit
                 )
         
         # First discovery - full credit
-        self.discovery_registry[pattern_hash] = {
-            'miner_hotkey': miner_hotkey,
-            'timestamp': current_time
-        }
+        self.discovery_registry.add(pattern_hash, miner_hotkey, current_time)
         
         return DiscoveryRegistrationResult(
             is_first_discovery=True,
@@ -300,27 +593,23 @@ class FirstDiscoveryEnforcement:
             credit_multiplier=1.0  # Full credit
         )
     
-    def _calculate_canonical_pattern_hash(self, pattern: DetectedPattern) -> str:
+    def _calculate_canonical_pattern_hash(self, pattern: DetectedPattern) -> bytes:
         """Calculate canonical hash that's invariant to minor variations"""
-        # Normalize addresses to lowercase
+        memo = pattern.transaction_graph.derived_cache()
+        if 'canonical_hash' not in memo:
+            memo['canonical_hash'] = self._hash_canonical_edges(pattern.transaction_graph)
+        return memo['canonical_hash']
+    
+    def _hash_canonical_edges(self, graph: TransactionGraph) -> bytes:
+        # Addresses are already normalized by GraphEdge
         # Round amounts to remove minor precision differences
         # Sort transactions by timestamp then amount
         # Create hash from canonical representation
-        
-        normalized_edges = []
-        for edge in pattern.transaction_graph.edges:
-            normalized_edges.append((
-                edge.from_address.lower(),
-                edge.to_address.lower(),
-                round(float(edge.amount), 6),  # Round to 6 decimal places
-                edge.timestamp
-            ))
-        
-        # Sort for consistent ordering
-        normalized_edges.sort(key=lambda x: (x[3], x[2]))  # Sort by timestamp, then amount
-        
-        hash_input = json.dumps(normalized_edges, sort_keys=True)
-        return hashlib.sha256(hash_input.encode()).hexdigest()
+        scale = 10 ** graph.decimals
+        # Round to 6 decimal places of the asset unit, in exact integer arithmetic
+        amounts = _int_column([(edge.amount * 10 ** 6 + scale // 2) // scale for edge in graph.edges])
+        timestamps = _int_column([edge.timestamp for edge in graph.edges])
+        return _hash_edge_columns(graph, amounts, timestamps, ('to', 'from', 'amount', 'timestamp'))
 
 
 class AdvancedAntiGamingSystem:
@@ -335,15 +624,26 @@ class AdvancedAntiGamingSystem:
         self, 
         pattern: DetectedPattern, 
         miner_reputation: MinerReputation,
-        recent_submissions: List[DetectedPattern]
+        recent_submissions: List[DetectedPattern],
+        now: Optional[int] = None
     ) -> GamingAnalysisResult:
-        """Comprehensive analysis for gaming detection"""
+        """
+        Comprehensive analysis for gaming detection
+        
+        Args:
+            pattern: The submitted pattern
+            miner_reputation: Reputation of the submitting miner
+            recent_submissions: The miner's recent submissions
+            now: Current Unix timestamp; batch callers can read the clock once and pass it in
+        """
+        if now is None:
+            now = int(time.time())
         
         gaming_flags = []
         confidence_scores = {}
         
         # 1. Address Age Analysis
-        age_analysis = self._analyze_address_ages(pattern)
+        age_analysis = self._analyze_address_ages(pattern, now)
         if age_analysis.suspicious_new_address_ratio > 0.7:
             gaming_flags.append("suspicious_address_ages")
             confidence_scores["address_age"] = age_analysis.confidence
@@ -373,9 +673,8 @@ class AdvancedAntiGamingSystem:
             recommended_action=self._determine_recommended_action(gaming_flags, confidence_scores)
         )
     
-    def _analyze_address_ages(self, pattern: DetectedPattern) -> AddressAgeAnalysis:
+    def _analyze_address_ages(self, pattern: DetectedPattern, current_time: int) -> AddressAgeAnalysis:
         """Analyze age distribution of addresses in pattern"""
-        current_time = int(time.time())
         new_addresses = 0
         total_addresses = len(pattern.transaction_graph.nodes)
         
@@ -435,18 +734,28 @@ class AdvancedAntiGamingSystem:
         coordination_indicators = []
         
         # Check for similar submission timing
-        submission_times = [p.detection_timestamp for p in recent_submissions]
+        submission_times = np.fromiter(
+            (p.detection_timestamp for p in recent_submissions), dtype=np.int64, count=len(recent_submissions)
+        )
         if self._has_suspicious_timing_correlation(submission_times):
             coordination_indicators.append("timing_correlation")
         
-        # Check for overlapping address sets
-        pattern_addresses = {node.address for node in pattern.transaction_graph.nodes}
-        for other_pattern in recent_submissions:
-            other_addresses = {node.address for node in other_pattern.transaction_graph.nodes}
-            overlap_ratio = len(pattern_addresses & other_addresses) / len(pattern_addresses | other_addresses)
-            if overlap_ratio > 0.5:
-                coordination_indicators.append("address_overlap")
-                break
+        # Check for overlapping address sets. MinHash sketches estimate the
+        # overlap with every recent submission at once; only likely overlaps
+        # are confirmed on the exact sets. Sketches and sets are memoized per
+        # graph, since the same recent submissions are compared against every
+        # new pattern; the union size follows from the intersection.
+        if recent_submissions:
+            sketches = np.stack([_address_sketch(p.transaction_graph) for p in recent_submissions])
+            estimates = (sketches == _address_sketch(pattern.transaction_graph)).mean(axis=1)
+            pattern_addresses = _node_addresses(pattern.transaction_graph)
+            for index in np.flatnonzero(estimates >= _MINHASH_CANDIDATE_JACCARD).tolist():
+                other_addresses = _node_addresses(recent_submissions[index].transaction_graph)
+                shared = len(pattern_addresses & other_addresses)
+                union = len(pattern_addresses) + len(other_addresses) - shared
+                if union and shared / union > 0.5:
+                    coordination_indicators.append("address_overlap")
+                    break
         
         has_coordination = len(coordination_indicators) >= 1
         confidence = len(coordination_indicators) / 2.0
@@ -487,7 +796,7 @@ class AdvancedAntiGamingSystem:
         # Simplified implementation
         return 0.2
     
-    def _has_suspicious_timing_correlation(self, timestamps: List[int]) -> bool:
+    def _has_suspicious_timing_correlation(self, timestamps: np.ndarray) -> bool:
         """Check for suspicious timing correlation"""
         # Simplified implementation
         return False
@@ -516,20 +825,20 @@ class RealTimeGamingPrevention:
     """Real-time prevention of gaming attempts"""
     
     def __init__(self):
-        self.submission_rate_limits = {}  # miner_hotkey -> submission tracker
+        self.submission_rate_limits: Dict[str, Deque[int]] = defaultdict(deque)  # miner_hotkey -> monotonic submission times, oldest first
         self.pattern_similarity_cache = {}
         self.suspicious_miner_watchlist = set()
     
     def validate_submission_rate(self, miner_hotkey: str) -> bool:
         """Check if miner is submitting at suspicious rate"""
-        current_time = int(time.time())
-        
-        if miner_hotkey not in self.submission_rate_limits:
-            self.submission_rate_limits[miner_hotkey] = []
+        # Only the age of submissions matters here, so the monotonic clock is
+        # used: integer seconds with no float conversion, immune to clock steps
+        current_time = time.monotonic_ns() // 1_000_000_000
         
         # Clean old submissions (older than 1 hour)
         submissions = self.submission_rate_limits[miner_hotkey]
-        submissions = [t for t in submissions if current_time - t < 3600]
+        while submissions and current_time - submissions[0] >= 3600:
+            submissions.popleft()
         
         # Check rate limit (max 10 patterns per hour)
         if len(submissions) >= 10:
@@ -537,7 +846,6 @@ class RealTimeGamingPrevention:
         
         # Add current submission
         submissions.append(current_time)
-        self.submission_rate_limits[miner_hotkey] = submissions
         
         return True
     
@@ -15,14 +15,24 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import asyncio
 import os
+import time
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from collections import OrderedDict
 from dataclasses import dataclass
 from decimal import Decimal
 from enum import Enum
-from typing import Dict, List, Optional, Union, Any
+from operator import attrgetter
+from typing import Awaitable, Callable, Dict, List, Optional, Union, Any, Tuple
 
-from core.protocol import DetectedPattern, TransactionGraph, GraphEdge
+import aiohttp
+import bittensor as bt
+import numpy as np
+import orjson
+
+from core.protocol import DetectedPattern, TransactionGraph, GraphEdge, normalize_address
 from core.validator.pattern_processing import PatternVerificationResult
 
 
@@ -50,7 +60,11 @@ class BlockchainNetwork(Enum):
     ZCASH = "zcash"
 
 
-@dataclass
+# Enum lookup by value without going through Enum.__call__
+_NETWORK_BY_VALUE: Dict[str, BlockchainNetwork] = {network.value: network for network in BlockchainNetwork}
+
+
+@dataclass(slots=True)
 class Transaction:
     """Standardized transaction representation across blockchains"""
     hash: str
@@ -71,9 +85,18 @@ class Transaction:
     transaction_type: str  # "transfer", "contract_call", "swap", etc.
     contract_address: Optional[str] = None
     input_data: Optional[str] = None
+    
+    # Exact amount in the asset's smallest unit, when the source provides it
+    amount_base_units: Optional[int] = None
+    decimals: Optional[int] = None
+    
+    def __post_init__(self):
+        # Same canonical form as GraphEdge addresses, so they compare directly
+        self.from_address = normalize_address(self.from_address)
+        self.to_address = normalize_address(self.to_address)
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockInfo:
     """Standardized block information"""
     number: int
@@ -83,7 +106,7 @@ class BlockInfo:
     blockchain: BlockchainNetwork
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockchainConfig:
     """Configuration for blockchain connections"""
     rpc_url: str
@@ -91,6 +114,8 @@ class BlockchainConfig:
     rate_limit_per_second: int = 10
     timeout_seconds: int = 30
     retry_attempts: int = 3
+    batch_size: int = 100  # Max calls per JSON-RPC batch request
+    rate_limit_per_call: bool = False  # Count every call in a batch against the rate limit, for per-call billing
     
     # Authentication for private nodes
     rpc_user: Optional[str] = None
@@ -101,14 +126,151 @@ class BlockchainConfig:
     websocket_url: Optional[str] = None
 
 
+class RateLimiter:
+    """
+    Token bucket allowing `rate` requests per second on average, with
+    bursts of up to `rate` requests.
+    
+    Waiters are served in arrival order, so one large batch cannot be
+    starved by a stream of single requests.
+    """
+    
+    def __init__(self, rate: float):
+        self.rate = max(rate, 1e-9)
+        self.capacity = max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, tokens: float = 1.0):
+        """Wait until `tokens` tokens (at most the bucket capacity) are available and take them"""
+        tokens = min(tokens, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+    
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
 class BlockchainInterface(ABC):
     """Abstract interface for blockchain data access"""
     
+    # Implementations set self.config to their BlockchainConfig
+    config: BlockchainConfig
+    _semaphore: Optional[asyncio.Semaphore] = None
+    _limiter: Optional[RateLimiter] = None
+    _session: Optional[aiohttp.ClientSession] = None
+    
+    def request_semaphore(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent requests to this chain at config.rate_limit_per_second"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(max(1, self.config.rate_limit_per_second))
+        return self._semaphore
+    
+    def rate_limiter(self) -> RateLimiter:
+        """Token bucket shared by all requests to this chain, at config.rate_limit_per_second"""
+        if self._limiter is None:
+            self._limiter = RateLimiter(self.config.rate_limit_per_second)
+        return self._limiter
+    
+    @asynccontextmanager
+    async def request_slot(self, calls: int = 1):
+        """
+        Hold a concurrent request slot, after taking rate limit tokens for a
+        request carrying `calls` calls (one token per request unless
+        config.rate_limit_per_call is set).
+        """
+        async with self.request_semaphore():
+            await self.rate_limiter().acquire(calls if self.config.rate_limit_per_call else 1)
+            yield
+    
+    def http_session(self) -> aiohttp.ClientSession:
+        """
+        HTTP session for this chain's RPC endpoint, created on first use.
+        
+        Connections are kept alive and reused across requests, so only the
+        first call to a provider pays for the TCP and TLS handshakes.
+        """
+        if self._session is None:
+            auth = None
+            if self.config.rpc_user is not None:
+                auth = aiohttp.BasicAuth(self.config.rpc_user, self.config.rpc_password or "")
+            connector = aiohttp.TCPConnector(
+                limit=max(1, self.config.rate_limit_per_second) * 4,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                auth=auth,
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds),
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the HTTP session, if one was opened"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def __aenter__(self) -> "BlockchainInterface":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
     @abstractmethod
     async def get_transaction(self, tx_hash: str) -> Optional[Transaction]:
         """Get transaction by hash"""
         pass
     
+    async def get_transactions_batch(self, tx_hashes: List[str]) -> Dict[str, Optional[Transaction]]:
+        """
+        Get several transactions by hash.
+        
+        Returns a dict from each requested hash to its transaction, or None
+        when it was not found. Interfaces whose backend supports batched
+        requests override this; the default fetches them concurrently, at most
+        config.rate_limit_per_second at a time.
+        """
+        async def fetch(tx_hash: str) -> Optional[Transaction]:
+            async with self.request_slot():
+                return await self.get_transaction(tx_hash)
+        
+        hashes = list(dict.fromkeys(tx_hashes))
+        return dict(zip(hashes, await asyncio.gather(*[fetch(tx_hash) for tx_hash in hashes])))
+    
+    async def get_balances_batch(self, addresses: List[str], asset: str = None) -> Dict[str, Decimal]:
+        """
+        Get the balances of several addresses.
+        
+        Returns a dict from address to balance; addresses whose lookup failed
+        are left out. Interfaces whose backend can aggregate lookups override
+        this; the default fetches them concurrently within the request limits.
+        """
+        async def fetch(address: str) -> Decimal:
+            async with self.request_slot():
+                return await self.get_address_balance(address, asset)
+        
+        addresses = list(dict.fromkeys(addresses))
+        results = await asyncio.gather(*[fetch(address) for address in addresses], return_exceptions=True)
+        return {
+            address: balance
+            for address, balance in zip(addresses, results)
+            if not isinstance(balance, Exception)
+        }
+    
     @abstractmethod
     async def get_address_transactions(
         self, 
@@ -120,6 +282,10 @@ class BlockchainInterface(ABC):
         """Get transactions for an address"""
         pass
     
+    def is_valid_address(self, address: str) -> bool:
+        """Check the address format locally, without any RPC call"""
+        return bool(address)
+    
     @abstractmethod
     async def verify_address_exists(self, address: str) -> bool:
         """Verify if address exists on blockchain"""
@@ -141,36 +307,243 @@ class BlockchainInterface(ABC):
         pass
 
 
+# Native asset of each EVM chain served by EthereumInterface
+_EVM_NATIVE_SYMBOLS = {
+    BlockchainNetwork.ETHEREUM: "ETH",
+    BlockchainNetwork.BINANCE_SMART_CHAIN: "BNB",
+    BlockchainNetwork.POLYGON: "MATIC",
+}
+_EVM_DECIMALS = 18
+
+# Address alphabets; str.lstrip(alphabet) leaves nothing only if every character is in it
+_HEX_DIGITS = "0123456789abcdefABCDEF"
+_BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_BECH32_ALPHABET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Multicall3, deployed at the same address on every major EVM chain
+_MULTICALL3_ADDRESS = "0xca11bde05977b3631167028862be2a173976ca11"
+_AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")  # aggregate3((address,bool,bytes)[])
+_GET_ETH_BALANCE_SELECTOR = bytes.fromhex("4d2301cc")  # getEthBalance(address)
+_BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")  # balanceOf(address)
+_DECIMALS_CALLDATA = "0x313ce567"  # decimals()
+
+
+def _abi_word(value: int) -> bytes:
+    return value.to_bytes(32, "big")
+
+
+def _abi_address(address: str) -> bytes:
+    return bytes.fromhex(address[2:]).rjust(32, b"\0")
+
+
+def _encode_aggregate3(calls: List[Tuple[str, bytes]]) -> bytes:
+    """ABI-encode Multicall3.aggregate3 calldata for (target, calldata) calls that may fail individually"""
+    encoded_calls = []
+    for target, calldata in calls:
+        padding = b"\0" * (-len(calldata) % 32)
+        encoded_calls.append(
+            # target, allowFailure=true, offset of the bytes field, then the bytes
+            _abi_address(target) + _abi_word(1) + _abi_word(96) + _abi_word(len(calldata)) + calldata + padding
+        )
+    offsets = []
+    position = 32 * len(encoded_calls)
+    for encoded in encoded_calls:
+        offsets.append(_abi_word(position))
+        position += len(encoded)
+    return b"".join([_AGGREGATE3_SELECTOR, _abi_word(32), _abi_word(len(calls)), *offsets, *encoded_calls])
+
+
+def _decode_aggregate3(data: bytes) -> List[Optional[bytes]]:
+    """Decode the (success, returnData)[] result of aggregate3; None for failed calls"""
+    start = int.from_bytes(data[0:32], "big")
+    count = int.from_bytes(data[start:start + 32], "big")
+    base = start + 32
+    results: List[Optional[bytes]] = []
+    for index in range(count):
+        offset = base + int.from_bytes(data[base + 32 * index:base + 32 * index + 32], "big")
+        success = int.from_bytes(data[offset:offset + 32], "big")
+        data_offset = offset + int.from_bytes(data[offset + 32:offset + 64], "big")
+        length = int.from_bytes(data[data_offset:data_offset + 32], "big")
+        results.append(data[data_offset + 32:data_offset + 32 + length] if success else None)
+    return results
+
+
+# Fields compared by BlockchainManager._match_transaction_details
+_EDGE_FIELDS = attrgetter("from_address", "to_address", "timestamp", "amount")
+_TRANSACTION_FIELDS = attrgetter("from_address", "to_address", "timestamp", "amount_base_units", "decimals")
+
+
+def _amount_tolerance(decimals: int) -> int:
+    """Amount tolerance of 1e-6 asset units, in base units; below one base unit any difference is too much"""
+    return 10 ** (decimals - 6) if decimals >= 6 else 0
+
+
+# Reconnect delays of the newHeads subscription, doubling per failed attempt
+_HEADS_RECONNECT_MIN_DELAY = 1.0
+_HEADS_RECONNECT_MAX_DELAY = 60.0
+
+
 class EthereumInterface(BlockchainInterface):
     """Ethereum and EVM-compatible blockchain interface"""
     
     def __init__(self, config: BlockchainConfig):
         self.config = config
         self.blockchain = BlockchainNetwork.ETHEREUM
-        # Initialize Web3 connection here
+        # Chain head pushed over the newHeads subscription (config.use_websocket)
+        self._latest_block: Optional[int] = None
+        self._head_task: Optional[asyncio.Task] = None
+    
+    async def close(self):
+        """Stop the newHeads subscription and close the HTTP session"""
+        if self._head_task is not None:
+            self._head_task.cancel()
+            await asyncio.gather(self._head_task, return_exceptions=True)
+            self._head_task = None
+            self._latest_block = None
+        await super().close()
+    
+    async def _follow_new_heads(self):
+        """Keep _latest_block at the chain head from an eth_subscribe("newHeads") stream, reconnecting on failure"""
+        subscribe = orjson.dumps({"jsonrpc": "2.0", "id": 1, "method": "eth_subscribe", "params": ["newHeads"]}).decode()
+        delay = _HEADS_RECONNECT_MIN_DELAY
+        while True:
+            try:
+                async with self.http_session().ws_connect(self.config.websocket_url, heartbeat=30) as ws:
+                    await ws.send_str(subscribe)
+                    async for message in ws:
+                        if message.type not in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                            break
+                        head = orjson.loads(message.data).get("params", {}).get("result")
+                        if head and "number" in head:
+                            self._latest_block = int(head["number"], 16)
+                            delay = _HEADS_RECONNECT_MIN_DELAY
+                bt.logging.warning(f"newHeads subscription closed, reconnecting in {delay:.0f}s")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                bt.logging.warning(f"newHeads subscription failed, reconnecting in {delay:.0f}s: {e}")
+            # The cached head goes stale while disconnected; fall back to polling
+            self._latest_block = None
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _HEADS_RECONNECT_MAX_DELAY)
+    
+    async def _rpc_batch(self, calls: List[Tuple[str, list]]) -> List[Any]:
+        """
+        Send JSON-RPC calls as batch requests of at most config.batch_size calls,
+        concurrently within the chain's request and rate limits.
         
+        Returns the results in call order, None for calls that returned an error
+        or got no reply. Raises RuntimeError when the node rejects a whole batch.
+        """
+        session = self.http_session()
+        results: List[Any] = [None] * len(calls)
+        
+        async def send(start: int, chunk: List[Tuple[str, list]]):
+            payload = [
+                {"jsonrpc": "2.0", "id": start + offset, "method": method, "params": params}
+                for offset, (method, params) in enumerate(chunk)
+            ]
+            async with self.request_slot(len(chunk)):
+                async with session.post(self.config.rpc_url, data=orjson.dumps(payload), headers=_JSON_HEADERS) as response:
+                    response.raise_for_status()
+                    replies = orjson.loads(await response.read())
+            if not isinstance(replies, list):
+                # A rejected batch is answered with a single error object
+                error = replies.get("error") if isinstance(replies, dict) else replies
+                raise RuntimeError(f"JSON-RPC batch of {len(chunk)} calls failed: {error}")
+            # Batch replies may come back in any order; match them by id, ignoring
+            # ids this chunk did not send so a bad reply cannot fill another call
+            end = start + len(chunk)
+            for reply in replies:
+                if not isinstance(reply, dict) or "error" in reply:
+                    continue
+                reply_id = reply.get("id")
+                if type(reply_id) is int and start <= reply_id < end:
+                    results[reply_id] = reply.get("result")
+        
+        batch_size = max(1, self.config.batch_size)
+        await asyncio.gather(*[
+            send(start, calls[start:start + batch_size]) for start in range(0, len(calls), batch_size)
+        ])
+        return results
+    
     async def get_transaction(self, tx_hash: str) -> Optional[Transaction]:
         """Get Ethereum transaction by hash"""
         try:
-            # Implementation would use Web3.py or similar
-            # For now, return a placeholder
-            return Transaction(
-                hash=tx_hash,
-                from_address="0x...",
-                to_address="0x...",
-                amount=Decimal("1.0"),
-                asset_symbol="ETH",
-                timestamp=1234567890,
-                block_number=12345,
-                gas_fee=Decimal("0.01"),
-                status="success",
-                blockchain=self.blockchain,
-                raw_data={},
-                transaction_type="transfer"
-            )
+            return (await self.get_transactions_batch([tx_hash]))[tx_hash]
         except Exception as e:
             return None
     
+    async def get_transactions_batch(self, tx_hashes: List[str]) -> Dict[str, Optional[Transaction]]:
+        """Get Ethereum transactions by hash, with their receipts and blocks, in batched RPC calls"""
+        hashes = list(dict.fromkeys(tx_hashes))
+        raw_transactions = await self._rpc_batch([("eth_getTransactionByHash", [tx_hash]) for tx_hash in hashes])
+        
+        mined = [raw for raw in raw_transactions if raw is not None and raw.get("blockNumber") is not None]
+        block_numbers = list(dict.fromkeys(raw["blockNumber"] for raw in mined))
+        details = await self._rpc_batch(
+            [("eth_getTransactionReceipt", [raw["hash"]]) for raw in mined]
+            + [("eth_getBlockByNumber", [number, False]) for number in block_numbers]
+        )
+        receipts = dict(zip((raw["hash"] for raw in mined), details[:len(mined)]))
+        blocks = dict(zip(block_numbers, details[len(mined):]))
+        
+        transactions: Dict[str, Optional[Transaction]] = {}
+        for tx_hash, raw in zip(hashes, raw_transactions):
+            if raw is None:
+                transactions[tx_hash] = None
+                continue
+            transactions[tx_hash] = self._parse_transaction(
+                raw, receipts.get(raw["hash"]), blocks.get(raw.get("blockNumber"))
+            )
+        return transactions
+    
+    def _parse_transaction(
+        self,
+        raw: Dict[str, Any],
+        receipt: Optional[Dict[str, Any]],
+        block: Optional[Dict[str, Any]]
+    ) -> Transaction:
+        """Build a Transaction from eth_getTransactionByHash, receipt and block results"""
+        input_data = raw.get("input") or "0x"
+        is_contract_call = input_data != "0x"
+        
+        if receipt is None:
+            status = "pending"
+            gas_fee = Decimal(0)
+        else:
+            status = "success" if receipt.get("status") == "0x1" else "failed"
+            gas_price = receipt.get("effectiveGasPrice") or raw.get("gasPrice") or "0x0"
+            gas_fee = Decimal(int(receipt["gasUsed"], 16) * int(gas_price, 16)).scaleb(-_EVM_DECIMALS)
+        
+        to_address = raw.get("to")
+        if to_address is None and receipt is not None:
+            # Contract creation
+            to_address = receipt.get("contractAddress")
+        
+        value = int(raw["value"], 16)
+        return Transaction(
+            hash=raw["hash"],
+            from_address=raw["from"],
+            to_address=to_address or "",
+            amount=Decimal(value).scaleb(-_EVM_DECIMALS),
+            asset_symbol=_EVM_NATIVE_SYMBOLS.get(self.blockchain, "ETH"),
+            timestamp=int(block["timestamp"], 16) if block is not None else 0,
+            block_number=int(raw["blockNumber"], 16) if raw.get("blockNumber") is not None else 0,
+            gas_fee=gas_fee,
+            status=status,
+            blockchain=self.blockchain,
+            raw_data=raw,
+            transaction_type="contract_call" if is_contract_call else "transfer",
+            contract_address=raw.get("to") if is_contract_call else None,
+            input_data=input_data if is_contract_call else None,
+            amount_base_units=value,
+            decimals=_EVM_DECIMALS
+        )
+    
     async def get_address_transactions(
         self, 
         address: str, 
@@ -182,6 +555,10 @@ class EthereumInterface(BlockchainInterface):
         # Implementation using Etherscan API or similar
         return []
     
+    def is_valid_address(self, address: str) -> bool:
+        """Check for a 0x-prefixed, 40 hex digit address"""
+        return len(address) == 42 and address.startswith("0x") and not address[2:].lstrip(_HEX_DIGITS)
+    
     async def verify_address_exists(self, address: str) -> bool:
         """Verify if Ethereum address exists"""
         # Check if address has any transaction history or balance
@@ -198,12 +575,79 @@ class EthereumInterface(BlockchainInterface):
         )
     
     async def get_current_block_number(self) -> int:
-        """Get current Ethereum block number"""
-        return 18000000
+        """
+        Get current Ethereum block number.
+        
+        With config.use_websocket the head is pushed by a newHeads
+        subscription and returned from memory; eth_blockNumber is polled
+        only until the first head arrives or while disconnected.
+        """
+        if self.config.use_websocket and self.config.websocket_url:
+            if self._head_task is None:
+                self._head_task = asyncio.create_task(self._follow_new_heads())
+            if self._latest_block is not None:
+                return self._latest_block
+        result = (await self._rpc_batch([("eth_blockNumber", [])]))[0]
+        if result is None:
+            raise RuntimeError("eth_blockNumber returned an error")
+        return int(result, 16)
     
     async def get_address_balance(self, address: str, asset: str = None) -> Decimal:
         """Get Ethereum address balance"""
-        return Decimal("1.0")
+        balances = await self.get_balances_batch([address], asset)
+        if address not in balances:
+            raise RuntimeError(f"Balance lookup failed for {address}")
+        return balances[address]
+    
+    async def get_balances_batch(self, addresses: List[str], asset: str = None) -> Dict[str, Decimal]:
+        """
+        Get the balances of several addresses through Multicall3 aggregate3
+        eth_calls, each covering up to config.batch_size addresses.
+        
+        The asset is the chain's native asset when None or its symbol, or
+        else an ERC20 token contract address.
+        """
+        addresses = list(dict.fromkeys(addresses))
+        if asset is None or asset == _EVM_NATIVE_SYMBOLS.get(self.blockchain, "ETH"):
+            token = None
+            target, selector = _MULTICALL3_ADDRESS, _GET_ETH_BALANCE_SELECTOR
+        elif self.is_valid_address(asset):
+            token = asset
+            target, selector = token, _BALANCE_OF_SELECTOR
+        else:
+            raise ValueError(f"Unknown asset {asset}; expected the native symbol or an ERC20 contract address")
+        
+        batch_size = max(1, self.config.batch_size)
+        chunks = [addresses[start:start + batch_size] for start in range(0, len(addresses), batch_size)]
+        calls = [
+            ("eth_call", [
+                {
+                    "to": _MULTICALL3_ADDRESS,
+                    "data": "0x" + _encode_aggregate3([(target, selector + _abi_address(address)) for address in chunk]).hex(),
+                },
+                "latest",
+            ])
+            for chunk in chunks
+        ]
+        if token is not None:
+            calls.append(("eth_call", [{"to": token, "data": _DECIMALS_CALLDATA}, "latest"]))
+        results = await self._rpc_batch(calls)
+        
+        decimals = _EVM_DECIMALS
+        if token is not None:
+            raw_decimals = results.pop()
+            if raw_decimals is None:
+                raise RuntimeError(f"decimals() call failed for token {token}")
+            decimals = int(raw_decimals, 16)
+        
+        balances: Dict[str, Decimal] = {}
+        for chunk, result in zip(chunks, results):
+            if result is None:
+                continue
+            for address, data in zip(chunk, _decode_aggregate3(bytes.fromhex(result[2:]))):
+                if data is not None and len(data) >= 32:
+                    balances[address] = Decimal(int.from_bytes(data[:32], "big")).scaleb(-decimals)
+        return balances
 
 
 class BitcoinInterface(BlockchainInterface):
@@ -230,7 +674,9 @@ class BitcoinInterface(BlockchainInterface):
                 status="success",
                 blockchain=self.blockchain,
                 raw_data={},
-                transaction_type="transfer"
+                transaction_type="transfer",
+                amount_base_units=10_000_000,
+                decimals=8
             )
         except Exception as e:
             return None
@@ -245,6 +691,14 @@ class BitcoinInterface(BlockchainInterface):
         """Get transactions for Bitcoin address"""
         return []
     
+    def is_valid_address(self, address: str) -> bool:
+        """Check for a base58 (P2PKH/P2SH) or bech32 (SegWit) address; checksums are not verified"""
+        if address[:3].lower() == "bc1":
+            # Bech32 addresses are single-case
+            address = address.lower() if address.isupper() else address
+            return 14 <= len(address) <= 74 and not address[3:].lstrip(_BECH32_ALPHABET)
+        return 26 <= len(address) <= 35 and address[:1] in ("1", "3") and not address.lstrip(_BASE58_ALPHABET)
+    
     async def verify_address_exists(self, address: str) -> bool:
         """Verify if Bitcoin address exists"""
         return True
@@ -349,10 +803,28 @@ class BlockchainConfigManager:
 class BlockchainManager:
     """Manages multiple blockchain interfaces"""
     
-    def __init__(self, blockchain_configs: Dict[BlockchainNetwork, BlockchainConfig]):
+    def __init__(
+        self,
+        blockchain_configs: Dict[BlockchainNetwork, BlockchainConfig],
+        address_cache_ttl: float = 300.0,
+        balance_cache_ttl: float = 5.0,
+        transaction_cache_ttl: float = 600.0,
+        cache_size: int = 100_000
+    ):
         self.interfaces = {}
         self.configs = blockchain_configs
         
+        # Address and transaction lookups, keyed by (kind, blockchain, address or
+        # hash, ...) -> (value, expiry). Hub addresses and shared transactions
+        # recur across patterns, so most lookups are answered here.
+        self.address_cache_ttl = address_cache_ttl
+        self.balance_cache_ttl = balance_cache_ttl
+        self.transaction_cache_ttl = transaction_cache_ttl
+        self.cache_size = cache_size
+        self._lookup_cache: 'OrderedDict[tuple, Tuple[Any, float]]' = OrderedDict()
+        # Lookups in flight, so concurrent misses on one key share a single request
+        self._lookups_in_flight: Dict[tuple, asyncio.Future] = {}
+        
         # Initialize interfaces for configured blockchains
         for blockchain, config in blockchain_configs.items():
             try:
@@ -361,24 +833,254 @@ class BlockchainManager:
             except Exception as e:
                 print(f"Failed to initialize {blockchain.value} interface: {e}")
     
-    async def verify_pattern_on_chain(self, pattern: DetectedPattern) -> PatternVerificationResult:
-        """Verify pattern across relevant blockchains"""
-        blockchain = BlockchainNetwork(pattern.blockchain)
+    async def close(self):
+        """Close the connections of every interface"""
+        await asyncio.gather(*[interface.close() for interface in self.interfaces.values()])
+    
+    async def __aenter__(self) -> "BlockchainManager":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def _cached_lookup(self, key: tuple, ttl: float, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        now = time.monotonic()
+        entry = self._lookup_cache.get(key)
+        if entry is not None and now < entry[1]:
+            self._lookup_cache.move_to_end(key)
+            return entry[0]
+        
+        in_flight = self._lookups_in_flight.get(key)
+        if in_flight is None:
+            in_flight = self._lookups_in_flight[key] = asyncio.ensure_future(fetch())
+            try:
+                # Shielded, so a cancelled caller does not cancel the lookup for the others
+                value = await asyncio.shield(in_flight)
+            finally:
+                del self._lookups_in_flight[key]
+            self._cache_store(key, value, time.monotonic() + ttl)
+            return value
+        # Errors are not cached; every waiter sees the same failure
+        return await asyncio.shield(in_flight)
+    
+    def _cache_store(self, key: tuple, value: Any, expiry: float):
+        self._lookup_cache[key] = (value, expiry)
+        self._lookup_cache.move_to_end(key)
+        if len(self._lookup_cache) > self.cache_size:
+            self._lookup_cache.popitem(last=False)
+    
+    async def get_transactions(
+        self,
+        blockchain: BlockchainNetwork,
+        tx_hashes: List[str]
+    ) -> Dict[str, Optional[Transaction]]:
+        """
+        Get transactions by hash, fetching only the uncached ones, in one batch.
+        
+        Found transactions are cached for transaction_cache_ttl seconds, so a
+        transaction shared by several patterns is fetched once. Missing ones
+        are not cached, as they may still be pending.
+        """
+        now = time.monotonic()
+        hashes = list(dict.fromkeys(tx_hashes))
+        found: Dict[str, Optional[Transaction]] = {}
+        missing = []
+        for tx_hash in hashes:
+            key = ("tx", blockchain, tx_hash)
+            entry = self._lookup_cache.get(key)
+            if entry is not None and now < entry[1]:
+                self._lookup_cache.move_to_end(key)
+                found[tx_hash] = entry[0]
+            else:
+                missing.append(tx_hash)
+        
+        if missing:
+            fetched = await self.interfaces[blockchain].get_transactions_batch(missing)
+            expiry = time.monotonic() + self.transaction_cache_ttl
+            for tx_hash, tx in fetched.items():
+                found[tx_hash] = tx
+                if tx is not None:
+                    self._cache_store(("tx", blockchain, tx_hash), tx, expiry)
+        return {tx_hash: found.get(tx_hash) for tx_hash in hashes}
+    
+    async def verify_address_exists(self, blockchain: BlockchainNetwork, address: str) -> bool:
+        """Check that an address exists, cached for address_cache_ttl seconds"""
+        interface = self.interfaces[blockchain]
+        # Malformed addresses cannot exist; skip the RPC
+        if not interface.is_valid_address(address):
+            return False
+        
+        async def fetch() -> bool:
+            async with interface.request_slot():
+                return await interface.verify_address_exists(address)
+        
+        return await self._cached_lookup(("exists", blockchain, address), self.address_cache_ttl, fetch)
+    
+    async def get_address_balance(self, blockchain: BlockchainNetwork, address: str, asset: str = None) -> Decimal:
+        """Get an address balance, cached for balance_cache_ttl seconds"""
+        interface = self.interfaces[blockchain]
+        
+        async def fetch() -> Decimal:
+            # The interface applies the request limits itself
+            balances = await interface.get_balances_batch([address], asset)
+            if address not in balances:
+                raise RuntimeError(f"Balance lookup failed for {address}")
+            return balances[address]
+        
+        return await self._cached_lookup(("balance", blockchain, address, asset), self.balance_cache_ttl, fetch)
+    
+    async def get_address_balances(
+        self,
+        blockchain: BlockchainNetwork,
+        addresses: List[str],
+        asset: str = None
+    ) -> Dict[str, Decimal]:
+        """
+        Get the balances of several addresses, cached for balance_cache_ttl
+        seconds, looking up the uncached ones in one batch.
+        
+        Addresses whose lookup failed are left out.
+        """
+        now = time.monotonic()
+        balances: Dict[str, Decimal] = {}
+        missing = []
+        for address in dict.fromkeys(addresses):
+            key = ("balance", blockchain, address, asset)
+            entry = self._lookup_cache.get(key)
+            if entry is not None and now < entry[1]:
+                self._lookup_cache.move_to_end(key)
+                balances[address] = entry[0]
+            else:
+                missing.append(address)
+        
+        if missing:
+            fetched = await self.interfaces[blockchain].get_balances_batch(missing, asset)
+            expiry = time.monotonic() + self.balance_cache_ttl
+            for address, balance in fetched.items():
+                balances[address] = balance
+                self._cache_store(("balance", blockchain, address, asset), balance, expiry)
+        return balances
+    
+    async def verify_pattern_on_chain(
+        self,
+        pattern: DetectedPattern,
+        fail_fast: bool = False,
+        max_errors: Optional[int] = None
+    ) -> PatternVerificationResult:
+        """
+        Verify pattern across relevant blockchains
+        
+        Args:
+            pattern: The pattern to verify
+            fail_fast: Stop at the first error, leaving the remaining lookups unsent
+            max_errors: Stop once more than this many errors were found (None: check everything)
+        """
+        blockchain = _NETWORK_BY_VALUE.get(pattern.blockchain)
         
         if blockchain not in self.interfaces:
-            return PatternVerificationResult(
-                pattern_id="unknown",
-                is_valid=False,
-                verification_timestamp=int(time.time()),
-                addresses_exist=False,
-                transactions_verified=0,
-                total_transactions=len(pattern.transaction_graph.edges),
-                verification_confidence=0.0,
-                verification_errors=[f"No interface available for {blockchain.value}"]
-            )
+            return self._unsupported_result(pattern)
         
         interface = self.interfaces[blockchain]
-        verification_result = PatternVerificationResult(
+        verification_result = self._new_verification_result(pattern)
+        errors = verification_result.verification_errors
+        error_limit = 0 if fail_fast else max_errors
+        
+        # Fetch the pattern's transactions in batches, concurrently, and check
+        # each batch as it arrives so a bad pattern can stop early
+        edges_by_hash = self._edges_by_hash(pattern)
+        hashes = list(edges_by_hash)
+        batch_size = max(1, interface.config.batch_size)
+        batches = [
+            asyncio.ensure_future(self.get_transactions(blockchain, hashes[start:start + batch_size]))
+            for start in range(0, len(hashes), batch_size)
+        ]
+        
+        stopped = False
+        try:
+            for next_batch in asyncio.as_completed(batches):
+                try:
+                    transactions = await next_batch
+                except Exception as e:
+                    errors.append(f"Error fetching transactions: {str(e)}")
+                    verification_result.is_valid = False
+                else:
+                    self._check_transactions(verification_result, pattern, edges_by_hash, transactions)
+                
+                if error_limit is not None and len(errors) > error_limit:
+                    stopped = True
+                    break
+        finally:
+            for batch in batches:
+                batch.cancel()
+            await asyncio.gather(*batches, return_exceptions=True)
+        
+        # When stopped early, skip the address checks; the confidence counts only what was verified
+        if not stopped:
+            await self._check_addresses(verification_result, blockchain, pattern)
+        
+        self._set_confidence(verification_result)
+        return verification_result
+    
+    async def verify_chain_patterns(
+        self,
+        blockchain_name: str,
+        patterns: List[DetectedPattern]
+    ) -> List[PatternVerificationResult]:
+        """
+        Verify several patterns on one blockchain.
+        
+        The transactions of all the patterns are fetched together in one
+        batched lookup, and then checked against each pattern.
+        """
+        blockchain = _NETWORK_BY_VALUE.get(blockchain_name)
+        if blockchain not in self.interfaces:
+            return [self._unsupported_result(pattern) for pattern in patterns]
+        
+        pattern_edges = [self._edges_by_hash(pattern) for pattern in patterns]
+        hashes = list(dict.fromkeys(tx_hash for edges_by_hash in pattern_edges for tx_hash in edges_by_hash))
+        fetch_error = None
+        try:
+            transactions = await self.get_transactions(blockchain, hashes)
+        except Exception as e:
+            fetch_error = f"Error fetching transactions: {str(e)}"
+        
+        results = []
+        for pattern, edges_by_hash in zip(patterns, pattern_edges):
+            verification_result = self._new_verification_result(pattern)
+            if fetch_error is None:
+                self._check_transactions(
+                    verification_result,
+                    pattern,
+                    edges_by_hash,
+                    {tx_hash: transactions.get(tx_hash) for tx_hash in edges_by_hash}
+                )
+            else:
+                verification_result.verification_errors.append(fetch_error)
+                verification_result.is_valid = False
+            results.append(verification_result)
+        
+        await asyncio.gather(*[
+            self._check_addresses(verification_result, blockchain, pattern)
+            for verification_result, pattern in zip(results, patterns)
+        ])
+        for verification_result in results:
+            self._set_confidence(verification_result)
+        return results
+    
+    def _unsupported_result(self, pattern: DetectedPattern) -> PatternVerificationResult:
+        return PatternVerificationResult(
+            pattern_id="unknown",
+            is_valid=False,
+            verification_timestamp=int(time.time()),
+            addresses_exist=False,
+            transactions_verified=0,
+            total_transactions=len(pattern.transaction_graph.edges),
+            verification_confidence=0.0,
+            verification_errors=[f"No interface available for {pattern.blockchain}"]
+        )
+    
+    def _new_verification_result(self, pattern: DetectedPattern) -> PatternVerificationResult:
+        return PatternVerificationResult(
             pattern_id="unknown",
             is_valid=True,
             verification_timestamp=int(time.time()),
@@ -389,70 +1091,114 @@ class BlockchainManager:
             verification_errors=[],
             suspicious_flags=[]
         )
-        
-        # Verify each transaction in the pattern
+    
+    @staticmethod
+    def _edges_by_hash(pattern: DetectedPattern) -> Dict[str, List[GraphEdge]]:
+        edges_by_hash: Dict[str, List[GraphEdge]] = {}
         for edge in pattern.transaction_graph.edges:
-            try:
-                # Verify transaction exists
-                tx = await interface.get_transaction(edge.transaction_hash)
-                if tx is None:
-                    verification_result.verification_errors.append(f"Transaction {edge.transaction_hash} not found")
-                    verification_result.is_valid = False
-                    continue
-                
-                # Verify transaction details match
-                if not self._verify_transaction_details(edge, tx):
-                    verification_result.verification_errors.append(f"Transaction {edge.transaction_hash} details mismatch")
-                    verification_result.is_valid = False
-                    continue
-                
-                verification_result.transactions_verified += 1
-                
-            except Exception as e:
-                verification_result.verification_errors.append(f"Error verifying {edge.transaction_hash}: {str(e)}")
+            edges_by_hash.setdefault(edge.transaction_hash, []).append(edge)
+        return edges_by_hash
+    
+    def _check_transactions(
+        self,
+        verification_result: PatternVerificationResult,
+        pattern: DetectedPattern,
+        edges_by_hash: Dict[str, List[GraphEdge]],
+        transactions: Dict[str, Optional[Transaction]]
+    ):
+        """Check the pattern's edges against the fetched transactions"""
+        errors = verification_result.verification_errors
+        pairs = [(edge, tx) for tx_hash, tx in transactions.items() for edge in edges_by_hash[tx_hash]]
+        found = [(edge, tx) for edge, tx in pairs if tx is not None]
+        matches = iter(self._match_transaction_details(found, pattern.transaction_graph.decimals).tolist())
+        for edge, tx in pairs:
+            # Verify transaction exists
+            if tx is None:
+                errors.append(f"Transaction {edge.transaction_hash} not found")
                 verification_result.is_valid = False
-        
-        # Verify addresses exist
-        all_addresses = set()
-        for node in pattern.transaction_graph.nodes:
-            all_addresses.add(node.address)
-        
-        for address in all_addresses:
-            try:
-                exists = await interface.verify_address_exists(address)
-                if not exists:
-                    verification_result.verification_errors.append(f"Address {address} does not exist")
-                    verification_result.addresses_exist = False
-            except Exception as e:
-                verification_result.verification_errors.append(f"Error verifying address {address}: {str(e)}")
-        
-        # Calculate verification confidence
+            # Verify transaction details match
+            elif not next(matches):
+                errors.append(f"Transaction {edge.transaction_hash} details mismatch")
+                verification_result.is_valid = False
+            else:
+                verification_result.transactions_verified += 1
+    
+    async def _check_addresses(
+        self,
+        verification_result: PatternVerificationResult,
+        blockchain: BlockchainNetwork,
+        pattern: DetectedPattern
+    ):
+        """Verify the pattern's addresses exist, concurrently within the chain's request limit"""
+        # Unique addresses, in node order
+        addresses = list(dict.fromkeys([node.address for node in pattern.transaction_graph.nodes]))
+        results = await asyncio.gather(
+            *[self.verify_address_exists(blockchain, address) for address in addresses], return_exceptions=True
+        )
+        for address, exists in zip(addresses, results):
+            if isinstance(exists, Exception):
+                verification_result.verification_errors.append(f"Error verifying address {address}: {str(exists)}")
+            elif not exists:
+                verification_result.verification_errors.append(f"Address {address} does not exist")
+                verification_result.addresses_exist = False
+    
+    @staticmethod
+    def _set_confidence(verification_result: PatternVerificationResult):
         if verification_result.total_transactions > 0:
             verification_result.verification_confidence = (
                 verification_result.transactions_verified / verification_result.total_transactions
             )
-        
-        return verification_result
     
-    def _verify_transaction_details(self, edge: GraphEdge, tx: Transaction) -> bool:
+    def _verify_transaction_details(self, edge: GraphEdge, tx: Transaction, decimals: int) -> bool:
         """Verify transaction details match between pattern and blockchain"""
-        # Check addresses match
-        if edge.from_address.lower() != tx.from_address.lower():
-            return False
-        if edge.to_address.lower() != tx.to_address.lower():
-            return False
+        return bool(self._match_transaction_details([(edge, tx)], decimals)[0])
+    
+    @staticmethod
+    def _amount_matches(edge: GraphEdge, tx: Transaction, decimals: int) -> bool:
+        # Edge amounts are in the smallest unit; compare in integers when the
+        # transaction has an exact amount in the same unit
+        if tx.amount_base_units is not None and tx.decimals == decimals:
+            return abs(edge.amount - tx.amount_base_units) <= _amount_tolerance(decimals)
+        return abs(edge.amount_as_decimal(decimals) - tx.amount) <= Decimal('0.000001')  # 1e-6 tolerance
+    
+    def _match_transaction_details(self, pairs: List[Tuple[GraphEdge, Transaction]], decimals: int) -> np.ndarray:
+        """
+        Check (edge, transaction) pairs for matching details, all at once.
         
-        # Check amounts match (with small tolerance for precision)
-        amount_diff = abs(edge.amount - tx.amount)
-        if amount_diff > Decimal('0.000001'):  # 1e-6 tolerance
-            return False
+        Returns a boolean array, True where the addresses are equal, the
+        amounts agree within 1e-6 asset units and the timestamps are within
+        an hour of each other.
+        """
+        if not pairs:
+            return np.zeros(0, dtype=bool)
+        # Read all the fields of each edge and transaction in one pass, while
+        # the object is still in cache, then compare column by column
+        edge_from, edge_to, edge_times, edge_amounts = zip(*[_EDGE_FIELDS(edge) for edge, _ in pairs])
+        tx_from, tx_to, tx_times, tx_amounts, tx_decimals = zip(*[_TRANSACTION_FIELDS(tx) for _, tx in pairs])
+        
+        # Addresses on both sides are normalized and interned, so the object
+        # comparisons mostly resolve by identity
+        valid = np.array(edge_from, dtype=object) == np.array(tx_from, dtype=object)
+        valid &= np.array(edge_to, dtype=object) == np.array(tx_to, dtype=object)
         
         # Check timestamps are reasonable (within 1 hour)
-        time_diff = abs(edge.timestamp - tx.timestamp)
-        if time_diff > 3600:  # 1 hour tolerance
-            return False
+        valid &= np.abs(np.array(edge_times, dtype=np.int64) - np.array(tx_times, dtype=np.int64)) <= 3600
         
-        return True
+        # Check amounts match (with small tolerance for precision), in int64
+        # when every transaction has an exact amount in the edges' unit
+        if tx_decimals.count(decimals) == len(pairs) and None not in tx_amounts:
+            try:
+                edge_column = np.array(edge_amounts, dtype=np.int64)
+                tx_column = np.array(tx_amounts, dtype=np.int64)
+            except OverflowError:
+                edge_column = None
+            if edge_column is not None and (edge_column >= 0).all() and (tx_column >= 0).all():
+                valid &= np.abs(edge_column - tx_column) <= _amount_tolerance(decimals)
+                return valid
+        valid &= np.fromiter(
+            (self._amount_matches(edge, tx, decimals) for edge, tx in pairs), dtype=bool, count=len(pairs)
+        )
+        return valid
     
     def get_supported_blockchains(self) -> List[BlockchainNetwork]:
         """Get list of supported blockchains"""
@@ -460,14 +1206,10 @@ class BlockchainManager:
     
     def is_blockchain_supported(self, blockchain: str) -> bool:
         """Check if blockchain is supported"""
-        try:
-            blockchain_enum = BlockchainNetwork(blockchain)
-            return blockchain_enum in self.interfaces
-        except ValueError:
-            return False
+        return _NETWORK_BY_VALUE.get(blockchain) in self.interfaces
 
 
-@dataclass
+@dataclass(slots=True)
 class ComprehensiveVerificationResult:
     """Complete verification result including all checks"""
     basic_verification: PatternVerificationResult
@@ -509,6 +1251,33 @@ class PatternBlockchainVerifier:
             overall_confidence=overall_confidence
         )
     
+    async def verify_patterns_batch(self, patterns: List[DetectedPattern]) -> List[ComprehensiveVerificationResult]:
+        """
+        Verify several patterns, grouped by blockchain.
+        
+        Each chain's patterns share one batched transaction lookup, and the
+        chains are verified concurrently. Results are in the order of patterns.
+        """
+        groups: Dict[str, List[int]] = {}
+        for index, pattern in enumerate(patterns):
+            groups.setdefault(pattern.blockchain, []).append(index)
+        
+        group_results = await asyncio.gather(*[
+            self.blockchain_manager.verify_chain_patterns(blockchain, [patterns[index] for index in indexes])
+            for blockchain, indexes in groups.items()
+        ])
+        
+        results: List[Optional[ComprehensiveVerificationResult]] = [None] * len(patterns)
+        for (blockchain, indexes), basic_verifications in zip(groups.items(), group_results):
+            blockchain_coverage = {blockchain: self.blockchain_manager.is_blockchain_supported(blockchain)}
+            for index, basic_verification in zip(indexes, basic_verifications):
+                results[index] = ComprehensiveVerificationResult(
+                    basic_verification=basic_verification,
+                    blockchain_coverage=blockchain_coverage,
+                    overall_confidence=self._calculate_overall_confidence(basic_verification, blockchain_coverage)
+                )
+        return results
+    
     def _calculate_overall_confidence(
         self, 
         basic_verification: PatternVerificationResult, 
@@ -2,17 +2,24 @@
 SQLAlchemy database models and data manager for validator pattern storage.
 
 This module provides:
-- Pattern table for storing patterns received from miners with verification results
+- Pattern table for storing patterns received from miners with verification results,
+  partitioned by month of timestamp
 - ValidatorDataManager class for database operations
 """
 
+import asyncio
+import logging
 import os
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional, Dict, Any
 from enum import Enum
 from sqlalchemy import (
     create_engine, 
-    Column, 
+    insert,
+    select,
+    update,
     BigInteger, 
     String, 
     Text, 
@@ -20,13 +27,22 @@ from sqlalchemy import (
     Integer,
     Boolean,
     Float,
-    Enum as SQLEnum
+    ForeignKey,
+    Index,
+    SmallInteger,
+    TypeDecorator,
+    text
 )
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+import orjson
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker, Session, relationship
 from sqlalchemy.sql import func
 
-Base = declarative_base()
+logger = logging.getLogger(__name__)
+
+
+class Base(DeclarativeBase):
+    pass
 
 
 class VerificationStatus(Enum):
@@ -37,6 +53,36 @@ class VerificationStatus(Enum):
     INVALID = "invalid"
 
 
+class VerificationStatusCode(TypeDecorator):
+    """
+    Stores VerificationStatus as a SMALLINT code.
+    
+    Two-byte keys keep the status indexes small and compare as integers;
+    new statuses need a new code here rather than an ALTER TYPE.
+    """
+    impl = SmallInteger
+    cache_ok = True
+    
+    # Stored codes; never renumber existing entries
+    CODES = {
+        VerificationStatus.PENDING: 0,
+        VerificationStatus.VERIFIED: 1,
+        VerificationStatus.REJECTED: 2,
+        VerificationStatus.INVALID: 3,
+    }
+    STATUSES = {code: status for status, code in CODES.items()}
+    
+    def process_bind_param(self, value: Optional[VerificationStatus], dialect) -> Optional[int]:
+        return None if value is None else self.CODES[value]
+    
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[VerificationStatus]:
+        return None if value is None else self.STATUSES[value]
+
+
+def _json_dumps(value: Any) -> str:
+    return orjson.dumps(value).decode()
+
+
 def get_database_url(role: str = "validator") -> str:
     """
     Get database URL from environment variables or use defaults.
@@ -65,45 +111,132 @@ def get_database_url(role: str = "validator") -> str:
     return f"postgresql://{username}:{password}@{host}:{port}/{database}"
 
 
+class Miner(Base):
+    """
+    Miner table mapping hotkeys to compact integer ids.
+    
+    Patterns reference miners by id, so each hotkey is stored once rather
+    than in every pattern row and index entry.
+    """
+    __tablename__ = 'miners'
+    
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    hotkey: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    
+    def __repr__(self):
+        return f"<Miner(id={self.id}, hotkey='{self.hotkey}')>"
+
+
 class Pattern(Base):
     """
     Pattern table for storing patterns received from miners with verification results.
     
     Columns:
-    - id: Big integer auto increment primary key
+    - id: Big integer auto increment, primary key together with timestamp
     - pattern_id: String max length for pattern identifier
     - network: String for network name
     - asset_symbol: String for asset symbol
     - asset_contract: String for asset contract (native by default)
-    - data: Text field for pattern data (nullable)
-    - timestamp: DateTime for when pattern was received
-    - miner_hotkey: String for the miner's hotkey who submitted the pattern
-    - verification_status: Enum for verification result (pending, verified, rejected, invalid)
+    - data: JSONB field for pattern data (nullable)
+    - timestamp: DateTime for when pattern was received; partition key
+    - miner_id: Integer foreign key to the miner who submitted the pattern (see Miner)
+    - verification_status: SMALLINT code for verification result (pending, verified, rejected, invalid), see VerificationStatusCode
     - verification_score: Float for verification score (0.0 to 1.0)
     - verification_timestamp: DateTime for when verification was completed
     - verification_details: Text field for additional verification information
     """
     __tablename__ = 'patterns'
+    # Monthly RANGE partitions (see ValidatorDataManager.ensure_pattern_partitions):
+    # indexes stay one month deep and timestamp filters prune to the hot partition
+    __table_args__ = (
+        # Containment queries on pattern data (data @> '{...}')
+        Index('ix_patterns_data', 'data', postgresql_using='gin', postgresql_ops={'data': 'jsonb_path_ops'}),
+        # Newest-first scans in get_patterns_by_miner and get_patterns_by_status,
+        # equality columns first so ORDER BY ... LIMIT reads an index range
+        Index('ix_patterns_miner_status_timestamp', 'miner_id', 'verification_status', text('timestamp DESC')),
+        Index('ix_patterns_status_timestamp', 'verification_status', text('timestamp DESC')),
+        {'postgresql_partition_by': 'RANGE (timestamp)'},
+    )
     
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
-    pattern_id = Column(String(255), nullable=False, index=True)
-    network = Column(String(100), nullable=False)
-    asset_symbol = Column(String(50), nullable=False)
-    asset_contract = Column(String(255), nullable=False, default='native')
-    data = Column(Text, nullable=True)
-    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow)
+    # A partitioned table's primary key must include the partition key
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    pattern_id: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    network: Mapped[str] = mapped_column(String(100), nullable=False)
+    asset_symbol: Mapped[str] = mapped_column(String(50), nullable=False)
+    asset_contract: Mapped[str] = mapped_column(String(255), nullable=False, default='native')
+    data: Mapped[Optional[Any]] = mapped_column(JSONB, nullable=True)
+    # Set by the database clock, so every validator process stamps rows alike
+    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True, server_default=func.now())
     
-    # Miner information
-    miner_hotkey = Column(String(255), nullable=False, index=True)
+    # Miner information; miner_id and verification_status lead the composite indexes in __table_args__
+    miner_id: Mapped[int] = mapped_column(Integer, ForeignKey('miners.id'), nullable=False)
+    miner: Mapped[Miner] = relationship(lazy='joined')
     
     # Verification results
-    verification_status = Column(SQLEnum(VerificationStatus), nullable=False, default=VerificationStatus.PENDING, index=True)
-    verification_score = Column(Float, nullable=True)  # 0.0 to 1.0
-    verification_timestamp = Column(DateTime, nullable=True)
-    verification_details = Column(Text, nullable=True)
+    verification_status: Mapped[VerificationStatus] = mapped_column(VerificationStatusCode, nullable=False, default=VerificationStatus.PENDING)
+    verification_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # 0.0 to 1.0
+    verification_timestamp: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    verification_details: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    
+    @property
+    def miner_hotkey(self) -> str:
+        """Hotkey of the miner who submitted the pattern"""
+        return self.miner.hotkey
     
     def __repr__(self):
-        return f"<Pattern(id={self.id}, pattern_id='{self.pattern_id}', miner='{self.miner_hotkey}', status='{self.verification_status.value}')>"
+        # id, pattern_id and miner are fixed once the row exists, so that part is
+        # built once per instance; status is updated in place and formatted each time
+        prefix = self.__dict__.get('_repr_prefix')
+        if prefix is None:
+            prefix = f"<Pattern(id={self.id}, pattern_id='{self.pattern_id}', miner='{self.miner_hotkey[:8]}...'"
+            if self.id is not None:
+                self.__dict__['_repr_prefix'] = prefix
+        return f"{prefix}, status='{self.verification_status.value}')>"
+
+
+class PatternStatCounter(Base):
+    """
+    Per-status pattern counters, kept current by triggers on the patterns table.
+    
+    See ValidatorDataManager._install_stat_counter_triggers. Each status is
+    split over _STAT_COUNTER_SHARDS rows, picked by the writing backend, so
+    concurrent inserts do not queue on one hot row; a status's totals are
+    the sums over its shards. Serves get_verification_statistics without
+    scanning patterns.
+    """
+    __tablename__ = 'pattern_stat_counters'
+    
+    verification_status: Mapped[VerificationStatus] = mapped_column(VerificationStatusCode, primary_key=True)
+    shard: Mapped[int] = mapped_column(SmallInteger, primary_key=True, default=0)
+    # Deltas accumulate per shard, so a single shard may go negative
+    pattern_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    scored_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)  # Rows with a verification_score
+    score_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+
+# Rows per status in pattern_stat_counters
+_STAT_COUNTER_SHARDS = 16
+
+# pg_advisory_xact_lock key serializing schema setup across validator processes
+_SCHEMA_LOCK_KEY = 0x76616c6964  # "valid"
+
+# Seconds between ensure_pattern_partitions runs of the maintenance thread; a
+# day keeps every month's partition created weeks before its first row
+_PARTITION_MAINTENANCE_INTERVAL = 24 * 60 * 60
+
+_STAT_TRIGGER_EXISTS = text("""
+    SELECT EXISTS (
+        SELECT 1 FROM pg_trigger
+        WHERE tgrelid = to_regclass('patterns') AND tgname = 'patterns_count_stats'
+    )
+""")
+
+
+# Statements of get_patterns_by_status, built once per status
+_PATTERNS_BY_STATUS = {
+    status: select(Pattern).where(Pattern.verification_status == status).order_by(Pattern.timestamp.desc())
+    for status in VerificationStatus
+}
 
 
 class ValidatorDataManager:
@@ -117,12 +250,13 @@ class ValidatorDataManager:
     - Manage database sessions and connections
     """
     
-    def __init__(self, database_url: Optional[str] = None):
+    def __init__(self, database_url: Optional[str] = None, maintain_partitions: bool = True):
         """
         Initialize the ValidatorDataManager with database connection.
         
         Args:
             database_url: SQLAlchemy database URL. If None, uses PostgreSQL with default validator configuration.
+            maintain_partitions: Run ensure_pattern_partitions daily on a background thread
         """
         if database_url is None:
             database_url = get_database_url("validator")
@@ -132,25 +266,350 @@ class ValidatorDataManager:
             echo=False,
             pool_size=10,
             max_overflow=20,
-            pool_pre_ping=True,
-            pool_recycle=3600
+            pool_recycle=3600,
+            # Reuse the most recently returned connection so idle extras can age out
+            pool_use_lifo=True,
+            query_cache_size=1200,
+            json_serializer=_json_dumps,
+            json_deserializer=orjson.loads,
+            # libpq TCP keepalives detect dead connections without a pre-ping round trip per checkout
+            connect_args={
+                "keepalives": 1,
+                "keepalives_idle": 30,
+                "keepalives_interval": 10,
+                "keepalives_count": 3
+            }
         )
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+
+        # Miner hotkey -> miners.id; rows are never deleted, so entries stay valid
+        self._miner_ids: Dict[str, int] = {}
+
+        # Configure mappers up front rather than lazily on first query
+        Base.registry.configure()
         
-        # Create tables if they don't exist
+        # Upgrade tables of earlier versions, then create the missing ones
+        self._migrate_legacy_schema()
         Base.metadata.create_all(bind=self.engine)
+        self.ensure_pattern_partitions()
+        self._install_stat_counter_triggers()
+        
+        self._maintenance_stop = threading.Event()
+        self._maintenance_thread = None
+        if maintain_partitions:
+            self._maintenance_thread = threading.Thread(
+                target=self._maintain_pattern_partitions, name="pattern-partition-maintenance", daemon=True
+            )
+            self._maintenance_thread.start()
+    
+    def ensure_pattern_partitions(self, months_ahead: int = 2):
+        """
+        Create the monthly partitions of patterns up to months_ahead months from now.
+        
+        Rows outside every monthly partition land in patterns_default; any
+        that fall in a month being created are moved into it. Runs daily on
+        the maintenance thread, so each month's partition exists before its
+        first row arrives; old months can then be dropped as a whole instead
+        of DELETEd.
+        
+        Args:
+            months_ahead: Months after the current one to create partitions for
+        """
+        now = datetime.now(timezone.utc)
+        with self.engine.begin() as connection:
+            connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _SCHEMA_LOCK_KEY})
+            self._create_pattern_partitions(connection, now, months_ahead + 1)
+    
+    def _maintain_pattern_partitions(self):
+        """Background loop running ensure_pattern_partitions every _PARTITION_MAINTENANCE_INTERVAL seconds."""
+        while not self._maintenance_stop.wait(_PARTITION_MAINTENANCE_INTERVAL):
+            try:
+                self.ensure_pattern_partitions()
+            except Exception as e:
+                logger.warning(f"Pattern partition maintenance failed, retrying next run: {e}")
+    
+    @staticmethod
+    def _create_pattern_partitions(connection, first: datetime, months: int):
+        """
+        Create patterns_default and the monthly partitions of the months months starting at first's month.
+        
+        PostgreSQL refuses a partition while the default partition holds rows
+        in its range, so those rows are moved out first and reinserted once
+        the partition exists.
+        """
+        connection.execute(text("CREATE TABLE IF NOT EXISTS patterns_default PARTITION OF patterns DEFAULT"))
+        for offset in range(months):
+            year, month = divmod(first.month - 1 + offset, 12)
+            start = datetime(first.year + year, month + 1, 1, tzinfo=timezone.utc)
+            year, month = divmod(start.month, 12)
+            end = datetime(start.year + year, month + 1, 1, tzinfo=timezone.utc)
+            name = f"patterns_{start:%Y_%m}"
+            if connection.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar() is not None:
+                continue
+            
+            bounds = {"start": start, "end": end}
+            moved = connection.execute(text("""
+                SELECT count(*) FROM patterns_default WHERE timestamp >= :start AND timestamp < :end
+            """), bounds).scalar()
+            if moved:
+                logger.info(f"Moving {moved} patterns out of patterns_default into {name}")
+                connection.execute(text(
+                    "CREATE TEMP TABLE patterns_moving (LIKE patterns) ON COMMIT DROP"
+                ))
+                connection.execute(text("""
+                    WITH moved AS (
+                        DELETE FROM patterns_default
+                        WHERE timestamp >= :start AND timestamp < :end
+                        RETURNING *
+                    )
+                    INSERT INTO patterns_moving SELECT * FROM moved
+                """), bounds)
+            connection.execute(text(
+                f"CREATE TABLE {name} PARTITION OF patterns "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            ))
+            if moved:
+                connection.execute(text("INSERT INTO patterns SELECT * FROM patterns_moving"))
+                connection.execute(text("DROP TABLE patterns_moving"))
+    
+    def _migrate_legacy_schema(self):
+        """
+        Move patterns stored by earlier validator versions into the current schema.
+        
+        Those kept patterns in a plain table, with the miner hotkey in every
+        row, a verificationstatus enum and text data. create_all cannot
+        partition an existing table, so the old one is renamed, the new one
+        created, and the rows copied over in one transaction; ids are kept.
+        A no-op once patterns is partitioned.
+        """
+        with self.engine.begin() as connection:
+            connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _SCHEMA_LOCK_KEY})
+            kind = connection.execute(text("SELECT relkind FROM pg_class WHERE oid = to_regclass('patterns')")).scalar()
+            if kind != 'r':
+                # Missing (fresh database) or already partitioned
+                return
+            
+            columns = set(connection.execute(text("""
+                SELECT column_name FROM information_schema.columns
+                WHERE table_schema = current_schema() AND table_name = 'patterns'
+            """)).scalars())
+            expected = {'id', 'pattern_id', 'network', 'asset_symbol', 'asset_contract', 'data', 'timestamp',
+                        'miner_hotkey', 'verification_status', 'verification_score',
+                        'verification_timestamp', 'verification_details'}
+            if not expected <= columns:
+                raise RuntimeError(
+                    "The patterns table is not partitioned and does not match the legacy layout "
+                    f"(missing columns: {', '.join(sorted(expected - columns))}), so it cannot be "
+                    "migrated automatically. Rename it (ALTER TABLE patterns RENAME TO patterns_old) "
+                    "or drop it, restart the validator to create the current schema, and copy any "
+                    "rows to keep into the new patterns table by hand."
+                )
+            
+            # Move the old table and the names of its indexes and sequence out of the way
+            connection.execute(text("ALTER TABLE patterns RENAME TO patterns_legacy"))
+            for index_name in connection.execute(text(
+                "SELECT indexname FROM pg_indexes WHERE schemaname = current_schema() AND tablename = 'patterns_legacy'"
+            )).scalars().all():
+                connection.execute(text(f'ALTER INDEX "{index_name}" RENAME TO "legacy_{index_name}"'))
+            connection.execute(text("ALTER SEQUENCE IF EXISTS patterns_id_seq RENAME TO patterns_legacy_id_seq"))
+            
+            Base.metadata.create_all(bind=connection)
+            
+            # Monthly partitions for the stored rows; the timestamps were naive UTC
+            first, last = connection.execute(text(
+                "SELECT min(timestamp AT TIME ZONE 'UTC'), max(timestamp AT TIME ZONE 'UTC') FROM patterns_legacy"
+            )).one()
+            if first is None:
+                first, months = datetime.now(timezone.utc), 0
+            else:
+                first, last = first.astimezone(timezone.utc), last.astimezone(timezone.utc)
+                months = (last.year - first.year) * 12 + last.month - first.month + 1
+            self._create_pattern_partitions(connection, first, months)
+            
+            connection.execute(text("""
+                INSERT INTO miners (hotkey)
+                SELECT DISTINCT miner_hotkey FROM patterns_legacy
+                ON CONFLICT (hotkey) DO NOTHING
+            """))
+            # Text data that does not parse as JSON is kept as a JSON string
+            connection.execute(text("""
+                CREATE FUNCTION pg_temp.try_jsonb(value text) RETURNS jsonb AS $$
+                BEGIN
+                    RETURN value::jsonb;
+                EXCEPTION WHEN others THEN
+                    RETURN to_jsonb(value);
+                END;
+                $$ LANGUAGE plpgsql IMMUTABLE
+            """))
+            # The enum stored member names (PENDING, ...)
+            status_codes = " ".join(
+                f"WHEN '{status.name}' THEN {code}" for status, code in VerificationStatusCode.CODES.items()
+            )
+            connection.execute(text(f"""
+                INSERT INTO patterns (
+                    id, pattern_id, network, asset_symbol, asset_contract, data, timestamp, miner_id,
+                    verification_status, verification_score, verification_timestamp, verification_details
+                )
+                SELECT
+                    legacy.id, legacy.pattern_id, legacy.network, legacy.asset_symbol, legacy.asset_contract,
+                    pg_temp.try_jsonb(legacy.data::text), legacy.timestamp AT TIME ZONE 'UTC', miners.id,
+                    CASE upper(legacy.verification_status::text) {status_codes} END,
+                    legacy.verification_score, legacy.verification_timestamp AT TIME ZONE 'UTC',
+                    legacy.verification_details
+                FROM patterns_legacy legacy
+                JOIN miners ON miners.hotkey = legacy.miner_hotkey
+            """))
+            connection.execute(text(
+                "SELECT setval(pg_get_serial_sequence('patterns', 'id'), max(id)) FROM patterns"
+            ))
+            
+            connection.execute(text("DROP TABLE patterns_legacy"))
+            connection.execute(text("DROP TYPE IF EXISTS verificationstatus"))
+    
+    def _install_stat_counter_triggers(self):
+        """
+        Create the triggers maintaining pattern_stat_counters and backfill the counters, once.
+        
+        Skipped when the triggers already exist, so only the first start on a
+        database pays for the recount. Writes to patterns are blocked while
+        it runs, so no change can slip between the recount and the triggers.
+        """
+        with self.engine.begin() as connection:
+            if connection.execute(_STAT_TRIGGER_EXISTS).scalar():
+                return
+            connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _SCHEMA_LOCK_KEY})
+            # Another validator may have installed them while we waited
+            if connection.execute(_STAT_TRIGGER_EXISTS).scalar():
+                return
+            connection.execute(text("LOCK TABLE patterns IN SHARE ROW EXCLUSIVE MODE"))
+            # Every change is an upsert of signed deltas into the writing
+            # backend's shard, so updates and deletes do not contend either
+            connection.execute(text(f"""
+                CREATE OR REPLACE FUNCTION count_pattern_stats() RETURNS trigger AS $$
+                DECLARE
+                    counter_shard smallint := pg_backend_pid() % {_STAT_COUNTER_SHARDS};
+                BEGIN
+                    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                        INSERT INTO pattern_stat_counters AS counters
+                            (verification_status, shard, pattern_count, scored_count, score_sum)
+                        VALUES (
+                            OLD.verification_status, counter_shard, -1,
+                            -(OLD.verification_score IS NOT NULL)::int, -COALESCE(OLD.verification_score, 0)
+                        )
+                        ON CONFLICT (verification_status, shard) DO UPDATE SET
+                            pattern_count = counters.pattern_count + EXCLUDED.pattern_count,
+                            scored_count = counters.scored_count + EXCLUDED.scored_count,
+                            score_sum = counters.score_sum + EXCLUDED.score_sum;
+                    END IF;
+                    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                        INSERT INTO pattern_stat_counters AS counters
+                            (verification_status, shard, pattern_count, scored_count, score_sum)
+                        VALUES (
+                            NEW.verification_status, counter_shard, 1,
+                            (NEW.verification_score IS NOT NULL)::int, COALESCE(NEW.verification_score, 0)
+                        )
+                        ON CONFLICT (verification_status, shard) DO UPDATE SET
+                            pattern_count = counters.pattern_count + EXCLUDED.pattern_count,
+                            scored_count = counters.scored_count + EXCLUDED.scored_count,
+                            score_sum = counters.score_sum + EXCLUDED.score_sum;
+                    END IF;
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql
+            """))
+            connection.execute(text(
+                "CREATE TRIGGER patterns_count_stats AFTER INSERT OR DELETE ON patterns "
+                "FOR EACH ROW EXECUTE FUNCTION count_pattern_stats()"
+            ))
+            connection.execute(text(
+                "CREATE TRIGGER patterns_count_stats_update "
+                "AFTER UPDATE OF verification_status, verification_score ON patterns FOR EACH ROW "
+                "WHEN (OLD.verification_status IS DISTINCT FROM NEW.verification_status "
+                "OR OLD.verification_score IS DISTINCT FROM NEW.verification_score) "
+                "EXECUTE FUNCTION count_pattern_stats()"
+            ))
+            # Backfill from the rows already stored
+            connection.execute(text("DELETE FROM pattern_stat_counters"))
+            connection.execute(text("""
+                INSERT INTO pattern_stat_counters (verification_status, shard, pattern_count, scored_count, score_sum)
+                SELECT verification_status, 0, count(*), count(verification_score), COALESCE(sum(verification_score), 0)
+                FROM patterns
+                GROUP BY verification_status
+            """))
     
     def get_session(self) -> Session:
         """Get a new database session."""
         return self.SessionLocal()
     
+    @contextmanager
+    def read_session(self) -> Iterator[Session]:
+        """
+        Session for a run of reads sharing one autocommit connection.
+        
+        Pass it as session= to the get_* methods: they then reuse its
+        connection instead of checking one out and opening a transaction
+        per call. Do not write through it.
+        """
+        connection = self.engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+        session = Session(bind=connection, autoflush=False)
+        try:
+            yield session
+        finally:
+            session.close()
+            connection.close()
+    
+    @contextmanager
+    def _reading(self, session: Optional[Session]) -> Iterator[Session]:
+        """Use the caller's session if given, else a new one closed on exit."""
+        if session is not None:
+            yield session
+            return
+        session = self.get_session()
+        try:
+            yield session
+        finally:
+            session.close()
+    
+    def get_miner_ids(self, hotkeys: List[str]) -> Dict[str, int]:
+        """
+        Get the miners.id of each hotkey, creating the missing miners.
+        
+        New miners are upserted and committed in one statement, before any
+        pattern refers to them; known ids are served from memory.
+        """
+        missing = [hotkey for hotkey in dict.fromkeys(hotkeys) if hotkey not in self._miner_ids]
+        if missing:
+            statement = pg_insert(Miner).values([{"hotkey": hotkey} for hotkey in missing])
+            # DO UPDATE rather than DO NOTHING, so existing miners come back in RETURNING too
+            statement = statement.on_conflict_do_update(
+                index_elements=[Miner.hotkey], set_={"hotkey": statement.excluded.hotkey}
+            ).returning(Miner.hotkey, Miner.id)
+            session = self.get_session()
+            try:
+                rows = session.execute(statement).all()
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                raise e
+            finally:
+                session.close()
+            self._miner_ids.update(rows)
+        return {hotkey: self._miner_ids[hotkey] for hotkey in hotkeys}
+    
+    def _miner_filter(self, miner_hotkey: str):
+        """Filter on a miner's patterns, by cached id when known"""
+        miner_id = self._miner_ids.get(miner_hotkey)
+        if miner_id is None:
+            return Pattern.miner_id == select(Miner.id).where(Miner.hotkey == miner_hotkey).scalar_subquery()
+        return Pattern.miner_id == miner_id
+    
     def store_pattern(
         self,
         pattern_id: str,
         network: str,
         asset_symbol: str,
         miner_hotkey: str,
-        data: Optional[str] = None,
+        data: Optional[Any] = None,
         asset_contract: str = 'native'
     ) -> Optional[Pattern]:
         """
@@ -161,12 +620,13 @@ class ValidatorDataManager:
             network: Network name
             asset_symbol: Asset symbol
             miner_hotkey: Hotkey of the miner who submitted the pattern
-            data: Pattern data (optional)
+            data: JSON-serializable pattern data (optional)
             asset_contract: Asset contract address (default: 'native')
             
         Returns:
             The created Pattern object, or None if creation failed
         """
+        miner_id = self.get_miner_ids([miner_hotkey])[miner_hotkey]
         session = self.get_session()
         try:
             pattern = Pattern(
@@ -175,8 +635,7 @@ class ValidatorDataManager:
                 asset_symbol=asset_symbol,
                 asset_contract=asset_contract,
                 data=data,
-                miner_hotkey=miner_hotkey,
-                timestamp=datetime.utcnow(),
+                miner_id=miner_id,
                 verification_status=VerificationStatus.PENDING
             )
             
@@ -191,6 +650,52 @@ class ValidatorDataManager:
         finally:
             session.close()
     
+    def store_patterns_bulk(self, rows: List[Dict[str, Any]], batch_size: int = 1000) -> int:
+        """
+        Store many patterns received from miners with multi-row INSERTs.
+        
+        Prefer this over store_pattern when ingesting bursts of patterns.
+        Each chunk of batch_size rows is inserted and committed in one
+        transaction.
+        
+        Args:
+            rows: Dicts with the store_pattern arguments as keys
+                (pattern_id, network, asset_symbol, miner_hotkey, and
+                optionally data and asset_contract)
+            batch_size: Rows per INSERT transaction
+            
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+        
+        miner_ids = self.get_miner_ids([row["miner_hotkey"] for row in rows])
+        records = [
+            {
+                "pattern_id": row["pattern_id"],
+                "network": row["network"],
+                "asset_symbol": row["asset_symbol"],
+                "asset_contract": row.get("asset_contract", "native"),
+                "data": row.get("data"),
+                "miner_id": miner_ids[row["miner_hotkey"]],
+                "verification_status": VerificationStatus.PENDING,
+            }
+            for row in rows
+        ]
+        session = self.get_session()
+        try:
+            for start in range(0, len(records), batch_size):
+                session.execute(insert(Pattern), records[start:start + batch_size])
+                session.commit()
+            return len(records)
+            
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+    
     def update_verification_result(
         self,
         pattern_id: int,
@@ -212,21 +717,23 @@ class ValidatorDataManager:
         """
         session = self.get_session()
         try:
-            pattern = session.query(Pattern).filter(Pattern.id == pattern_id).first()
-            if not pattern:
-                return False
-            
-            pattern.verification_status = status
-            pattern.verification_timestamp = datetime.utcnow()
+            values = {
+                "verification_status": status,
+                "verification_timestamp": func.now(),
+            }
             
             if score is not None:
-                pattern.verification_score = max(0.0, min(1.0, score))  # Clamp between 0.0 and 1.0
+                values["verification_score"] = max(0.0, min(1.0, score))  # Clamp between 0.0 and 1.0
             
             if details is not None:
-                pattern.verification_details = details
+                values["verification_details"] = details
             
+            # One round trip; RETURNING tells whether the pattern exists
+            updated = session.execute(
+                update(Pattern).where(Pattern.id == pattern_id).values(**values).returning(Pattern.id)
+            ).first()
             session.commit()
-            return True
+            return updated is not None
             
         except Exception as e:
             session.rollback()
@@ -238,7 +745,8 @@ class ValidatorDataManager:
         self,
         status: VerificationStatus,
         limit: Optional[int] = None,
-        miner_hotkey: Optional[str] = None
+        miner_hotkey: Optional[str] = None,
+        session: Optional[Session] = None
     ) -> List[Pattern]:
         """
         Get patterns by verification status.
@@ -247,72 +755,102 @@ class ValidatorDataManager:
             status: Verification status to filter by
             limit: Maximum number of patterns to return (optional)
             miner_hotkey: Filter by specific miner hotkey (optional)
+            session: Session from read_session() to reuse (optional)
             
         Returns:
             List of Pattern objects
         """
-        session = self.get_session()
-        try:
-            query = session.query(Pattern).filter(Pattern.verification_status == status)
+        with self._reading(session) as session:
+            statement = _PATTERNS_BY_STATUS[status]
             
             if miner_hotkey:
-                query = query.filter(Pattern.miner_hotkey == miner_hotkey)
-            
-            query = query.order_by(Pattern.timestamp.desc())
+                statement = statement.where(self._miner_filter(miner_hotkey))
             
             if limit:
-                query = query.limit(limit)
+                statement = statement.limit(limit)
             
-            return query.all()
+            return list(session.scalars(statement))
+    
+    def iter_patterns_by_status(
+        self,
+        status: VerificationStatus,
+        miner_hotkey: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> Iterator[Pattern]:
+        """
+        Stream patterns by verification status, newest first.
+        
+        Unlike get_patterns_by_status, rows are read through a server-side
+        cursor batch_size at a time, so memory stays bounded however many
+        patterns match. The session stays open until the iterator is
+        exhausted or closed.
+        
+        Args:
+            status: Verification status to filter by
+            miner_hotkey: Filter by specific miner hotkey (optional)
+            batch_size: Rows fetched per round trip
             
+        Yields:
+            Pattern objects
+        """
+        statement = _PATTERNS_BY_STATUS[status]
+        if miner_hotkey:
+            statement = statement.where(self._miner_filter(miner_hotkey))
+        
+        session = self.get_session()
+        try:
+            result = session.scalars(statement.execution_options(yield_per=batch_size))
+            for partition in result.partitions():
+                yield from partition
         finally:
             session.close()
     
-    def get_pending_patterns(self, limit: Optional[int] = None) -> List[Pattern]:
+    def get_pending_patterns(self, limit: Optional[int] = None, session: Optional[Session] = None) -> List[Pattern]:
         """
         Get patterns that are pending verification.
         
         Args:
             limit: Maximum number of patterns to return (optional)
+            session: Session from read_session() to reuse (optional)
             
         Returns:
             List of pending Pattern objects
         """
-        return self.get_patterns_by_status(VerificationStatus.PENDING, limit)
+        return self.get_patterns_by_status(VerificationStatus.PENDING, limit, session=session)
     
-    def get_verified_patterns(self, limit: Optional[int] = None) -> List[Pattern]:
+    def get_verified_patterns(self, limit: Optional[int] = None, session: Optional[Session] = None) -> List[Pattern]:
         """
         Get patterns that have been verified.
         
         Args:
             limit: Maximum number of patterns to return (optional)
+            session: Session from read_session() to reuse (optional)
             
         Returns:
             List of verified Pattern objects
         """
-        return self.get_patterns_by_status(VerificationStatus.VERIFIED, limit)
+        return self.get_patterns_by_status(VerificationStatus.VERIFIED, limit, session=session)
     
-    def get_pattern_by_id(self, pattern_id: int) -> Optional[Pattern]:
+    def get_pattern_by_id(self, pattern_id: int, session: Optional[Session] = None) -> Optional[Pattern]:
         """
         Get a pattern by its database ID.
         
         Args:
             pattern_id: The database ID of the pattern
+            session: Session from read_session() to reuse (optional)
             
         Returns:
             Pattern object if found, None otherwise
         """
-        session = self.get_session()
-        try:
+        with self._reading(session) as session:
             return session.query(Pattern).filter(Pattern.id == pattern_id).first()
-        finally:
-            session.close()
     
     def get_patterns_by_miner(
         self,
         miner_hotkey: str,
         status: Optional[VerificationStatus] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        session: Optional[Session] = None
     ) -> List[Pattern]:
         """
         Get patterns submitted by a specific miner.
@@ -321,13 +859,13 @@ class ValidatorDataManager:
             miner_hotkey: The miner's hotkey
             status: Filter by verification status (optional)
             limit: Maximum number of patterns to return (optional)
+            session: Session from read_session() to reuse (optional)
             
         Returns:
             List of Pattern objects
         """
-        session = self.get_session()
-        try:
-            query = session.query(Pattern).filter(Pattern.miner_hotkey == miner_hotkey)
+        with self._reading(session) as session:
+            query = session.query(Pattern).filter(self._miner_filter(miner_hotkey))
             
             if status:
                 query = query.filter(Pattern.verification_status == status)
@@ -338,46 +876,107 @@ class ValidatorDataManager:
                 query = query.limit(limit)
             
             return query.all()
-            
-        finally:
-            session.close()
     
-    def get_verification_statistics(self) -> Dict[str, Any]:
+    def get_verification_statistics(self, session: Optional[Session] = None) -> Dict[str, Any]:
         """
         Get verification statistics.
         
+        Args:
+            session: Session from read_session() to reuse (optional)
+            
         Returns:
             Dictionary with verification statistics
         """
-        session = self.get_session()
-        try:
-            total_patterns = session.query(Pattern).count()
-            pending_count = session.query(Pattern).filter(Pattern.verification_status == VerificationStatus.PENDING).count()
-            verified_count = session.query(Pattern).filter(Pattern.verification_status == VerificationStatus.VERIFIED).count()
-            rejected_count = session.query(Pattern).filter(Pattern.verification_status == VerificationStatus.REJECTED).count()
-            invalid_count = session.query(Pattern).filter(Pattern.verification_status == VerificationStatus.INVALID).count()
+        with self._reading(session) as session:
+            # Trigger-maintained counters: a few shard rows per status, no scan of patterns
+            rows = session.query(
+                PatternStatCounter.verification_status,
+                func.sum(PatternStatCounter.pattern_count).cast(BigInteger),
+                func.sum(PatternStatCounter.scored_count).cast(BigInteger),
+                func.sum(PatternStatCounter.score_sum)
+            ).group_by(PatternStatCounter.verification_status).all()
             
-            avg_score = session.query(func.avg(Pattern.verification_score)).filter(
-                Pattern.verification_score.isnot(None)
-            ).scalar()
+            counts = {status: count for status, count, _, _ in rows}
+            scored = sum(score_count for _, _, score_count, _ in rows)
+            score_sum = sum(score_sum or 0.0 for _, _, _, score_sum in rows)
+            avg_score = score_sum / scored if scored else None
             
             return {
-                "total_patterns": total_patterns,
-                "pending": pending_count,
-                "verified": verified_count,
-                "rejected": rejected_count,
-                "invalid": invalid_count,
+                "total_patterns": sum(counts.values()),
+                "pending": counts.get(VerificationStatus.PENDING, 0),
+                "verified": counts.get(VerificationStatus.VERIFIED, 0),
+                "rejected": counts.get(VerificationStatus.REJECTED, 0),
+                "invalid": counts.get(VerificationStatus.INVALID, 0),
                 "average_verification_score": float(avg_score) if avg_score else 0.0
             }
-            
-        finally:
-            session.close()
     
     def close(self):
-        """Close the database engine."""
+        """Stop the partition maintenance thread and close the database engine."""
+        self._maintenance_stop.set()
+        if self._maintenance_thread is not None:
+            self._maintenance_thread.join(timeout=10.0)
         self.engine.dispose()
 
 
+class AsyncValidatorDataManager:
+    """
+    Asyncio front end to ValidatorDataManager.
+    
+    Every call runs the synchronous method on a worker thread, which checks
+    out its own pooled connection. Concurrent calls (e.g. asyncio.gather
+    over a batch of verification results) then keep up to
+    pool_size + max_overflow queries in flight without blocking the event loop.
+    """
+    
+    def __init__(self, database_url: Optional[str] = None, data_manager: Optional[ValidatorDataManager] = None):
+        """
+        Args:
+            database_url: SQLAlchemy database URL, used when data_manager is not given
+            data_manager: Existing ValidatorDataManager to wrap
+        """
+        self.data_manager = data_manager if data_manager is not None else ValidatorDataManager(database_url)
+    
+    async def store_pattern(self, *args, **kwargs) -> Optional[Pattern]:
+        """See ValidatorDataManager.store_pattern."""
+        return await asyncio.to_thread(self.data_manager.store_pattern, *args, **kwargs)
+    
+    async def store_patterns_bulk(self, *args, **kwargs) -> int:
+        """See ValidatorDataManager.store_patterns_bulk."""
+        return await asyncio.to_thread(self.data_manager.store_patterns_bulk, *args, **kwargs)
+    
+    async def update_verification_result(self, *args, **kwargs) -> bool:
+        """See ValidatorDataManager.update_verification_result."""
+        return await asyncio.to_thread(self.data_manager.update_verification_result, *args, **kwargs)
+    
+    async def get_patterns_by_status(self, *args, **kwargs) -> List[Pattern]:
+        """See ValidatorDataManager.get_patterns_by_status."""
+        return await asyncio.to_thread(self.data_manager.get_patterns_by_status, *args, **kwargs)
+    
+    async def get_pending_patterns(self, limit: Optional[int] = None) -> List[Pattern]:
+        """See ValidatorDataManager.get_pending_patterns."""
+        return await asyncio.to_thread(self.data_manager.get_pending_patterns, limit)
+    
+    async def get_verified_patterns(self, limit: Optional[int] = None) -> List[Pattern]:
+        """See ValidatorDataManager.get_verified_patterns."""
+        return await asyncio.to_thread(self.data_manager.get_verified_patterns, limit)
+    
+    async def get_pattern_by_id(self, pattern_id: int) -> Optional[Pattern]:
+        """See ValidatorDataManager.get_pattern_by_id."""
+        return await asyncio.to_thread(self.data_manager.get_pattern_by_id, pattern_id)
+    
+    async def get_patterns_by_miner(self, *args, **kwargs) -> List[Pattern]:
+        """See ValidatorDataManager.get_patterns_by_miner."""
+        return await asyncio.to_thread(self.data_manager.get_patterns_by_miner, *args, **kwargs)
+    
+    async def get_verification_statistics(self) -> Dict[str, Any]:
+        """See ValidatorDataManager.get_verification_statistics."""
+        return await asyncio.to_thread(self.data_manager.get_verification_statistics)
+    
+    async def close(self):
+        """Close the database engine."""
+        await asyncio.to_thread(self.data_manager.close)
+
+
 # Convenience function to create a ValidatorDataManager instance
 def create_validator_data_manager(database_url: Optional[str] = None) -> ValidatorDataManager:
     """
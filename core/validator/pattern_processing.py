@@ -15,14 +15,25 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import math
 import time
+from operator import attrgetter
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
 
 from core.protocol import DetectedPattern, PatternType, TransactionGraph
 
 
-@dataclass
+# Scoring weights from specification, in _SCORE_COMPONENTS order
+_SCORE_WEIGHTS = (0.25, 0.30, 0.20, 0.15, 0.10)
+_SCORE_COMPONENTS = attrgetter(
+    'confidence_score', 'complexity_score', 'recency_score', 'volume_significance', 'uniqueness_score'
+)
+
+
+@dataclass(slots=True)
 class ClassifiedPattern:
     """
     Pattern after validator classification and analysis.
@@ -47,37 +58,53 @@ class ClassifiedPattern:
     # Verification results
     verification_status: str  # "verified", "failed", "pending"
     verification_confidence: float
-    verification_errors: List[str] = field(default_factory=list)
     
     # Metadata
     miner_hotkey: str
     validator_hotkey: str
     classification_timestamp: int
     
+    verification_errors: List[str] = field(default_factory=list)
+    
+    _final_score: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    
+    def invalidate(self):
+        """Drop the cached final score after changing any scoring component"""
+        self._final_score = None
+    
     def get_final_score(self) -> float:
         """Calculate the final weighted score for this pattern"""
-        # Scoring weights from specification
-        weights = {
-            'classification': 0.25,
-            'complexity': 0.30,
-            'recency': 0.20,
-            'volume': 0.15,
-            'uniqueness': 0.10
-        }
+        if self._final_score is not None:
+            return self._final_score
         
         # Calculate weighted score
-        score = (
-            self.confidence_score * weights['classification'] +
-            self.complexity_score * weights['complexity'] +
-            self.recency_score * weights['recency'] +
-            self.volume_significance * weights['volume'] +
-            self.uniqueness_score * weights['uniqueness']
-        )
+        score = 0.0
+        for component, weight in zip(_SCORE_COMPONENTS(self), _SCORE_WEIGHTS):
+            score += component * weight
+        
+        self._final_score = min(1.0, max(0.0, score))  # Clamp between 0-1
+        return self._final_score
+    
+    @staticmethod
+    def get_final_scores(patterns: List["ClassifiedPattern"]) -> np.ndarray:
+        """
+        Calculate the final scores of many patterns at once, for ranking.
         
-        return min(1.0, max(0.0, score))  # Clamp between 0-1
+        The weighted sum runs column by column over an (N, 5) component
+        matrix, in the same order as get_final_score, so the scores are
+        identical; they are cached on the patterns as well.
+        """
+        components = np.array([_SCORE_COMPONENTS(pattern) for pattern in patterns], dtype=np.float64).reshape(-1, 5)
+        scores = np.zeros(len(patterns))
+        for column, weight in enumerate(_SCORE_WEIGHTS):
+            scores += components[:, column] * weight
+        np.clip(scores, 0.0, 1.0, out=scores)
+        for pattern, score in zip(patterns, scores.tolist()):
+            pattern._final_score = score
+        return scores
 
 
-@dataclass
+@dataclass(slots=True)
 class PatternVerificationResult:
     """Results of on-chain pattern verification"""
     pattern_id: str
@@ -101,7 +128,11 @@ class PatternVerificationResult:
         return (self.transactions_verified / self.total_transactions) * self.verification_confidence
 
 
-@dataclass
+# Smoothing factor of the reputation running averages
+_REPUTATION_EMA_ALPHA = 0.1
+
+
+@dataclass(slots=True)
 class MinerReputation:
     """
     Tracks miner reputation and performance metrics.
@@ -134,10 +165,29 @@ class MinerReputation:
     last_submission_timestamp: int = 0
     reputation_update_timestamp: int = 0
     
-    def update_with_pattern(self, pattern: ClassifiedPattern):
-        """Update reputation based on a new pattern submission"""
+    # Multiplier components, each refreshed only when its inputs change
+    _balance_penalty: float = field(default=0.0, init=False, repr=False, compare=False)
+    _gaming_penalty: float = field(default=0.0, init=False, repr=False, compare=False)
+    _quality_bonus: float = field(default=0.0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._update_balance_penalty()
+        self._update_gaming_penalty()
+        self._update_quality_bonus()
+    
+    def update_with_pattern(self, pattern: ClassifiedPattern, now: Optional[int] = None):
+        """
+        Update reputation based on a new pattern submission.
+        
+        Args:
+            pattern: The classified pattern
+            now: Current Unix timestamp; batch callers can read the clock once and pass it in
+        """
+        if now is None:
+            now = int(time.time())
+        
         self.total_patterns_submitted += 1
-        self.last_submission_timestamp = int(time.time())
+        self.last_submission_timestamp = now
         
         if pattern.verification_status == "verified":
             self.verified_patterns += 1
@@ -151,46 +201,111 @@ class MinerReputation:
         if self.total_patterns_submitted > 0:
             self.verification_success_rate = self.verified_patterns / self.total_patterns_submitted
         
-        # Recalculate reputation multiplier
-        self._calculate_reputation_multiplier()
+        # Only the quality inputs change with a new pattern
+        self._update_quality_bonus()
+        self._apply_reputation_multiplier()
         
-        self.reputation_update_timestamp = int(time.time())
+        self.reputation_update_timestamp = now
+    
+    def update_with_patterns(self, patterns: List[ClassifiedPattern], now: Optional[int] = None):
+        """
+        Update reputation with a batch of pattern submissions, in submission order.
+        
+        Same result as calling update_with_pattern for each pattern, but the
+        running averages are folded in closed form and the multiplier is
+        recomputed once per batch.
+        
+        Args:
+            patterns: The classified patterns, oldest first
+            now: Current Unix timestamp
+        """
+        if not patterns:
+            return
+        if now is None:
+            now = int(time.time())
+        
+        verified = [pattern for pattern in patterns if pattern.verification_status == "verified"]
+        self.total_patterns_submitted += len(patterns)
+        self.verified_patterns += len(verified)
+        self.rejected_patterns += len(patterns) - len(verified)
+        self.last_submission_timestamp = now
+        
+        if verified:
+            # After n EMA steps: alpha * sum((1 - alpha)^(n - k) * x_k) + (1 - alpha)^n * initial
+            keep = 1 - _REPUTATION_EMA_ALPHA
+            weights = _REPUTATION_EMA_ALPHA * keep ** np.arange(len(verified) - 1, -1, -1)
+            retained = keep ** len(verified)
+            scores = np.fromiter((pattern.get_final_score() for pattern in verified), dtype=np.float64, count=len(verified))
+            complexities = np.fromiter((pattern.complexity_score for pattern in verified), dtype=np.float64, count=len(verified))
+            self.average_pattern_score = float(weights @ scores) + retained * self.average_pattern_score
+            self.average_complexity_score = float(weights @ complexities) + retained * self.average_complexity_score
+        
+        self.verification_success_rate = self.verified_patterns / self.total_patterns_submitted
+        
+        self._update_quality_bonus()
+        self._apply_reputation_multiplier()
+        
+        self.reputation_update_timestamp = now
+    
+    def record_duplicate_submission(self, penalty: float = 0.0):
+        """Count a duplicate submission and add an optional extra gaming penalty"""
+        self.duplicate_submission_count += 1
+        self.gaming_penalty_score += penalty
+        self._update_gaming_penalty()
+        self._apply_reputation_multiplier()
+    
+    def update_historical_pattern_ratio(self, ratio: float):
+        """Set the ratio of historical vs recent patterns"""
+        self.historical_pattern_ratio = ratio
+        self._update_balance_penalty()
+        self._apply_reputation_multiplier()
     
     def _update_running_average(self, field_name: str, new_value: float):
         """Update a running average field"""
         current_value = getattr(self, field_name)
         # Simple exponential moving average with alpha=0.1
-        alpha = 0.1
+        alpha = _REPUTATION_EMA_ALPHA
         new_average = alpha * new_value + (1 - alpha) * current_value
         setattr(self, field_name, new_average)
     
     def _calculate_reputation_multiplier(self):
-        """Calculate the reputation multiplier applied to pattern scores"""
-        multiplier = self.base_reputation_score
-        
-        # Penalty for poor historical/recent balance
+        """Calculate the reputation multiplier applied to pattern scores from all inputs"""
+        self._update_balance_penalty()
+        self._update_gaming_penalty()
+        self._update_quality_bonus()
+        self._apply_reputation_multiplier()
+    
+    def _update_balance_penalty(self):
+        """Penalty for poor historical/recent balance"""
         if self.historical_pattern_ratio < 0.3:  # Less than 30% historical
-            balance_penalty = 0.5 * (0.3 - self.historical_pattern_ratio)
-            multiplier -= balance_penalty
-        
-        # Penalty for gaming attempts
-        gaming_penalty = min(0.8, self.duplicate_submission_count * 0.1 + self.gaming_penalty_score)
-        multiplier -= gaming_penalty
-        
-        # Bonus for consistent quality
+            self._balance_penalty = 0.5 * (0.3 - self.historical_pattern_ratio)
+        else:
+            self._balance_penalty = 0.0
+    
+    def _update_gaming_penalty(self):
+        """Penalty for gaming attempts"""
+        self._gaming_penalty = min(0.8, self.duplicate_submission_count * 0.1 + self.gaming_penalty_score)
+    
+    def _update_quality_bonus(self):
+        """Bonus for consistent quality"""
         if (self.verification_success_rate > 0.9 and 
             self.average_pattern_score > 0.7 and
             self.total_patterns_submitted > 50):
-            multiplier += 0.3
+            self._quality_bonus = 0.3
         elif (self.verification_success_rate > 0.8 and 
               self.average_pattern_score > 0.6):
-            multiplier += 0.1
+            self._quality_bonus = 0.1
+        else:
+            self._quality_bonus = 0.0
+    
+    def _apply_reputation_multiplier(self):
+        multiplier = self.base_reputation_score - self._balance_penalty - self._gaming_penalty + self._quality_bonus
         
         # Clamp between 0.1 and 2.0
         self.reputation_multiplier = max(0.1, min(2.0, multiplier))
 
 
-@dataclass
+@dataclass(slots=True)
 class StoredPattern:
     """
     Pattern as stored in Memgraph with complete validator metadata.
@@ -219,7 +334,6 @@ class StoredPattern:
     # Verification metadata
     verification_status: str
     verification_confidence: float
-    verification_errors: List[str] = field(default_factory=list)
     
     # Metadata
     miner_hotkey: str
@@ -227,6 +341,8 @@ class StoredPattern:
     classification_timestamp: int
     verification_timestamp: int
     
+    verification_errors: List[str] = field(default_factory=list)
+    
     # Anti-gaming data
     is_duplicate: bool = False
     similar_patterns: List[str] = field(default_factory=list)
@@ -235,16 +351,35 @@ class StoredPattern:
     miner_reputation_delta: float = 0.0
 
 
-def calculate_pattern_complexity(graph: TransactionGraph) -> float:
+# Complexity scores keyed by pattern hash; the oldest entries are evicted first
+_COMPLEXITY_CACHE_MAXSIZE = 4096
+_complexity_cache: Dict[str, float] = {}
+
+
+def calculate_pattern_complexity(graph: TransactionGraph, pattern_hash: Optional[str] = None) -> float:
     """
     Calculate complexity score for a transaction pattern.
     
     Args:
         graph: The transaction graph to analyze
+        pattern_hash: Content hash of the pattern; when given, the score is memoized under it
         
     Returns:
         Complexity score between 0.0 and 1.0
     """
+    if pattern_hash is None:
+        return _calculate_pattern_complexity(graph)
+    
+    score = _complexity_cache.get(pattern_hash)
+    if score is None:
+        score = _calculate_pattern_complexity(graph)
+        if len(_complexity_cache) >= _COMPLEXITY_CACHE_MAXSIZE:
+            del _complexity_cache[next(iter(_complexity_cache))]
+        _complexity_cache[pattern_hash] = score
+    return score
+
+
+def _calculate_pattern_complexity(graph: TransactionGraph) -> float:
     if not graph.edges:
         return 0.0
     
@@ -253,85 +388,204 @@ def calculate_pattern_complexity(graph: TransactionGraph) -> float:
     edge_count = len(graph.edges)
     unique_addresses = len(graph.get_unique_addresses())
     
-    # Calculate graph depth (longest path)
-    graph_depth = _calculate_graph_depth(graph)
+    # Depth and cycle count share one SCC pass
+    components = _strongly_connected_components(graph)
     
     # Calculate branching factor
     branching_factor = edge_count / node_count if node_count > 0 else 0
     
     # Detect cycles
-    cycle_count = _count_cycles(graph)
-    
-    # Base complexity from graph structure
-    base_score = min(1.0, (graph_depth * unique_addresses) / 100.0)
+    cycle_count = _count_cycles(graph, components)
     
     # Bonuses for sophisticated patterns
     cycle_bonus = min(0.3, cycle_count * 0.1)
     branching_bonus = min(0.2, branching_factor * 0.1)
     
+    # Past this depth the score is capped at 1.0 whatever the true depth is;
+    # one extra hop of margin keeps float rounding from falling short of the cap
+    saturating_depth = math.ceil((1.0 - cycle_bonus - branching_bonus) * 100.0 / unique_addresses) + 1
+    
+    # Calculate graph depth (longest path)
+    graph_depth = _calculate_graph_depth(graph, components, stop_at=saturating_depth)
+    
+    # Base complexity from graph structure
+    base_score = min(1.0, (graph_depth * unique_addresses) / 100.0)
+    
     total_score = base_score + cycle_bonus + branching_bonus
     return min(1.0, total_score)
 
 
-def _calculate_graph_depth(graph: TransactionGraph) -> int:
-    """Calculate the maximum depth (longest path) in the transaction graph"""
-    # Simple implementation - could be enhanced with proper graph algorithms
-    max_depth = 0
-    
-    # For each node, try to find the longest path starting from it
-    for node in graph.nodes:
-        depth = _dfs_max_depth(graph, node.address, set())
-        max_depth = max(max_depth, depth)
-    
-    return max_depth
+def _strongly_connected_components(graph: TransactionGraph) -> List[List[str]]:
+    """
+    Tarjan's SCC algorithm over the addresses reachable from the graph nodes.
 
+    Iterative, so deep chains cannot hit the recursion limit. Components are
+    returned in reverse topological order: every component reachable from a
+    component is emitted before it.
+    """
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack = set()
+    components: List[List[str]] = []
+    successors_of = graph.get_successor_addresses
 
-def _dfs_max_depth(graph: TransactionGraph, address: str, visited: set) -> int:
-    """DFS to find maximum depth from a given address"""
-    if address in visited:
-        return 0
-    
-    visited.add(address)
-    max_depth = 0
-    
-    # Find all outgoing edges from this address
-    outgoing_edges = graph.get_edges_from_address(address)
-    
-    for edge in outgoing_edges:
-        depth = 1 + _dfs_max_depth(graph, edge.to_address, visited.copy())
-        max_depth = max(max_depth, depth)
-    
-    return max_depth
+    for root in dict.fromkeys(node.address for node in graph.nodes):
+        if root in index:
+            continue
 
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors_of(root)))]
 
-def _count_cycles(graph: TransactionGraph) -> int:
-    """Count the number of cycles in the transaction graph"""
-    # Simple cycle detection - could be enhanced
-    cycles = 0
-    visited = set()
-    
-    for node in graph.nodes:
-        if node.address not in visited:
-            cycles += _dfs_cycle_detection(graph, node.address, set(), visited)
-    
-    return cycles
+        while work:
+            address, successors = work[-1]
+            for successor in successors:
+                if successor not in index:
+                    index[successor] = lowlink[successor] = len(index)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(successors_of(successor))))
+                    break
+                if successor in on_stack and index[successor] < lowlink[address]:
+                    lowlink[address] = index[successor]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[address] < lowlink[parent]:
+                        lowlink[parent] = lowlink[address]
+                if lowlink[address] == index[address]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == address:
+                            break
+                    components.append(component)
 
+    return components
 
-def _dfs_cycle_detection(graph: TransactionGraph, address: str, path: set, global_visited: set) -> int:
-    """DFS-based cycle detection"""
-    if address in path:
-        return 1  # Found a cycle
-    
-    if address in global_visited:
-        return 0
+
+# Path extensions tried per strongly connected component when measuring depth;
+# past this the deepest walk found so far is used (see _deepest_walk)
+_DEPTH_SEARCH_STEPS = 20_000
+
+
+def _calculate_graph_depth(
+    graph: TransactionGraph,
+    components: Optional[List[List[str]]] = None,
+    stop_at: Optional[int] = None
+) -> int:
+    """
+    Calculate the maximum depth (longest path) in the transaction graph.
     
-    global_visited.add(address)
-    path.add(address)
+    Depth is the hop count of the longest walk from a graph node that visits
+    no address twice, plus one for a final edge back onto the walk itself.
+    Walks inside a strongly connected component are searched exhaustively,
+    up to about _DEPTH_SEARCH_STEPS path extensions per component; components
+    are then combined over the condensation DAG.
     
-    cycles = 0
-    outgoing_edges = graph.get_edges_from_address(address)
+    With stop_at, returns as soon as some path is found at least that deep,
+    so the result is then only a lower bound of at least stop_at.
+    """
+    successors_of = graph.get_successor_addresses
+    starts = {node.address for node in graph.nodes}
+    component_of: Dict[str, int] = {}
+    # Deepest walk from each address, the walk's own component searched exhaustively
+    deepest: Dict[str, int] = {}
+
+    if components is None:
+        components = _strongly_connected_components(graph)
+
+    # Reverse topological order: every component left through an edge is already measured
+    for component_id, component in enumerate(components):
+        for address in component:
+            component_of[address] = component_id
+
+        exit_depth = {}
+        for address in component:
+            longest_exit = 0
+            for successor in successors_of(address):
+                if component_of[successor] != component_id:
+                    longest_exit = max(longest_exit, 1 + deepest[successor])
+            exit_depth[address] = longest_exit
+
+        # Every address gets an even share of the budget, and may also spend up
+        # to one component's length of what is left, enough for one long walk
+        remaining = _DEPTH_SEARCH_STEPS
+        for address in component:
+            max_steps = max(_DEPTH_SEARCH_STEPS // len(component), min(remaining, len(component)))
+            deepest[address], steps = _deepest_walk(
+                graph, address, component_of, exit_depth, max_steps, stop_at
+            )
+            remaining = max(0, remaining - steps)
+            if stop_at is not None and address in starts and deepest[address] >= stop_at:
+                return deepest[address]
+
+    return max((deepest[address] for address in starts if address in deepest), default=0)
+
+
+def _deepest_walk(
+    graph: TransactionGraph,
+    start: str,
+    component_of: Dict[str, int],
+    exit_depth: Dict[str, int],
+    max_steps: int,
+    stop_at: Optional[int]
+) -> Tuple[int, int]:
+    """
+    Depth of the deepest walk from start, trying every simple path inside its component.
     
-    for edge in outgoing_edges:
-        cycles += _dfs_cycle_detection(graph, edge.to_address, path.copy(), global_visited)
+    A path ending at an address scores its hop count plus the larger of
+    exit_depth there and one for an edge back onto the path. After max_steps
+    path extensions the deepest walk found so far is returned: a walk that
+    exists, so dense components can only be underestimated.
     
-    return cycles
\ No newline at end of file
+    Returns:
+        (depth, path extensions spent)
+    """
+    successors_of = graph.get_successor_addresses
+    component_id = component_of[start]
+    on_path = {start}
+
+    closes = any(successor in on_path for successor in successors_of(start))
+    deepest = max(exit_depth[start], int(closes))
+    steps = 0
+    work = [(start, iter(successors_of(start)))]
+
+    while work:
+        _, successors = work[-1]
+        for successor in successors:
+            if successor in on_path or component_of[successor] != component_id:
+                continue
+
+            on_path.add(successor)
+            closes = any(following in on_path for following in successors_of(successor))
+            deepest = max(deepest, len(work) + max(exit_depth[successor], int(closes)))
+
+            steps += 1
+            if steps >= max_steps or (stop_at is not None and deepest >= stop_at):
+                return deepest, steps
+
+            work.append((successor, iter(successors_of(successor))))
+            break
+        else:
+            address, _ = work.pop()
+            on_path.discard(address)
+
+    return deepest, steps
+
+
+def _count_cycles(graph: TransactionGraph, components: Optional[List[List[str]]] = None) -> int:
+    """Count the number of cycles in the transaction graph"""
+    if components is None:
+        components = _strongly_connected_components(graph)
+
+    # One cycle per strongly connected component that contains one
+    return sum(
+        1 for component in components
+        if len(component) > 1 or component[0] in graph.get_successor_addresses(component[0])
+    )
@@ -1,7 +1,6 @@
 # The MIT License (MIT)
 # Copyright © 2023 Yuma Rao
 # Copyright © 2025 aphex5
-import asyncio
 # Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
 # documentation files (the “Software”), to deal in the Software without restriction, including without limitation
 # the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
@@ -16,7 +15,10 @@ import asyncio
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import asyncio
+import queue
 import signal
+import threading
 import time
 import typing
 import bittensor as bt
@@ -24,7 +26,15 @@ import bittensor as bt
 import core
 from core.base.miner import BaseMinerNeuron
 from core.miner.database import DataManager
-from core.protocol import DetectedPattern
+from core.protocol import DetectedPattern, patterns_from_json
+
+# bittensor's TRACE logging level, below logging.DEBUG
+_TRACE_LEVEL = 5
+
+
+def _trace_enabled() -> bool:
+    """Whether bt.logging.trace output is on; guards f-string formatting in per-request paths."""
+    return bt.logging.get_level() <= _TRACE_LEVEL
 
 
 class Miner(BaseMinerNeuron):
@@ -34,6 +44,25 @@ class Miner(BaseMinerNeuron):
 
         self.data_manager = data_manager
 
+        # Blacklist settings, read once rather than through the config tree per request
+        self._allow_non_registered = self.config.blacklist.allow_non_registered
+        self._force_validator_permit = self.config.blacklist.force_validator_permit
+        self._max_batch_query = max(1, self.config.miner.max_batch_query)
+
+        # Hotkey -> uid and hotkey -> stake, rebuilt on every metagraph resync
+        self._hotkey_to_uid: typing.Dict[str, int] = {}
+        self._stake_by_hotkey: typing.Dict[str, float] = {}
+        self._index_hotkeys()
+
+        # Bounds the queries hitting the database pool at once, see _query_database
+        self._query_semaphore = asyncio.Semaphore(self.config.miner.max_concurrent_queries)
+
+        # Acks are queued and written in batches by the _write_acks thread, started with the miner;
+        # a full queue turns acks away (accepted=False) instead of growing without bound
+        self._ack_queue: queue.Queue = queue.Queue(maxsize=max(1, self.config.miner.ack_queue_size))
+        self._ack_writer: typing.Optional[threading.Thread] = None
+        self._ack_writer_stop = threading.Event()
+
         bt.logging.info(f"Attaching forward function to miner axon.")
         self.axon.attach(
             forward_fn=self.pattern_query,
@@ -41,6 +70,12 @@ class Miner(BaseMinerNeuron):
             priority_fn=self.priority_pattern_query
         )
 
+        self.axon.attach(
+            forward_fn=self.pattern_query_batch,
+            blacklist_fn=self.blacklist_pattern_query_batch,
+            priority_fn=self.priority_pattern_query_batch,
+        )
+
         self.axon.attach(
             forward_fn=self.pattern_query_ack,
             blacklist_fn=self.blacklist_pattern_query_ack,
@@ -49,29 +84,147 @@ class Miner(BaseMinerNeuron):
 
         bt.logging.info(f"Axon created: {self.axon}")
 
+    def resync_metagraph(self):
+        super().resync_metagraph()
+        self._index_hotkeys()
+
+    def _index_hotkeys(self):
+        self._hotkey_to_uid = {hotkey: uid for uid, hotkey in enumerate(self.metagraph.hotkeys)}
+        # One tolist() per resync rather than a tensor scalar conversion per request
+        self._stake_by_hotkey = dict(zip(self.metagraph.hotkeys, self.metagraph.S.tolist()))
+
     async def pattern_query(
         self, synapse: core.protocol.PatternQuery
     ) -> core.protocol.PatternQuery:
 
         validator_hotkey = synapse.dendrite.hotkey
-        pattern = self.data_manager.get_unacknowledged_patterns(validator_hotkey)
+        pattern = await self._query_database(self.data_manager.get_unacknowledged_patterns, validator_hotkey)
         if pattern:
             synapse.pattern_id = pattern.pattern_id
-            # TODO: parse pattern.data -> List[DetectedPattern]
-            # TODO: synapse.detected_patterns = []
+            synapse.detected_patterns = self._detected_patterns(pattern)
+
+        return synapse.pack()
+
+    async def pattern_query_batch(
+        self, synapse: core.protocol.PatternQueryBatch
+    ) -> core.protocol.PatternQueryBatch:
+
+        validator_hotkey = synapse.dendrite.hotkey
+        # The caller picks the batch size, so cap it before it reaches the database
+        if len(synapse.queries) > self._max_batch_query:
+            synapse.queries = synapse.queries[:self._max_batch_query]
+        # One query for the whole batch
+        patterns = await self._query_database(
+            self.data_manager.get_unacknowledged_patterns_batch, validator_hotkey, len(synapse.queries)
+        )
+        for query, pattern in zip(synapse.queries, patterns or []):
+            query.pattern_id = pattern.pattern_id
+            query.detected_patterns = self._detected_patterns(pattern)
+            query.pack()
 
         return synapse
 
+    @staticmethod
+    def _detected_patterns(pattern) -> typing.Optional[typing.List[DetectedPattern]]:
+        """Decode a stored pattern's data (see patterns_from_json); None if it is malformed."""
+        try:
+            return patterns_from_json(pattern.data)
+        except ValueError as e:
+            bt.logging.warning(f"Stored pattern {pattern.pattern_id} has malformed data, sending its id only: {e}")
+            return None
+
+    async def _query_database(self, fn, *args):
+        """
+        Run a DataManager read on a worker thread, at most max_concurrent_queries at a time.
+
+        Requests that wait longer than query_wait_timeout for a slot are shed
+        and get None, so a burst of validators cannot pile up behind the pool.
+        """
+        try:
+            await asyncio.wait_for(self._query_semaphore.acquire(), timeout=self.config.miner.query_wait_timeout)
+        except asyncio.TimeoutError:
+            bt.logging.debug("Shedding pattern query: database busy")
+            return None
+        try:
+            return await asyncio.to_thread(fn, *args)
+        finally:
+            self._query_semaphore.release()
+
     async def pattern_query_ack(self, synapse: core.protocol.PatternQueryAck) -> core.protocol.PatternQueryAck:
+        try:
+            self._ack_queue.put_nowait((synapse.pattern_id, synapse.dendrite.hotkey))
+        except queue.Full:
+            bt.logging.debug("Ack queue full, turning pattern ack away")
+            synapse.accepted = False
+            return synapse
+        synapse.accepted = True
         return synapse
 
+    def _start_ack_writer(self):
+        if self._ack_writer is None or not self._ack_writer.is_alive():
+            self._ack_writer_stop.clear()
+            self._ack_writer = threading.Thread(target=self._write_acks, name="pattern-ack-writer", daemon=True)
+            self._ack_writer.start()
+
+    def _stop_ack_writer(self, timeout: float = 30.0):
+        """Write out the acks still queued, then stop the writer thread."""
+        if self._ack_writer is None:
+            return
+        self._ack_writer_stop.set()
+        self._ack_writer.join(timeout)
+        if self._ack_writer.is_alive():
+            bt.logging.warning(f"Pattern ack writer still busy after {timeout}s; {self._ack_queue.qsize()} acks unwritten")
+        self._ack_writer = None
+
+    def _write_acks(self, max_batch: int = 256, linger: float = 0.005):
+        """Write queued acks in batches, one transaction per batch, until stopped and drained."""
+        while True:
+            try:
+                batch = [self._ack_queue.get(timeout=0.5)]
+            except queue.Empty:
+                if self._ack_writer_stop.is_set():
+                    return
+                continue
+            if self._ack_queue.qsize() < max_batch and not self._ack_writer_stop.is_set():
+                # Let a few more acks arrive so the batch is worth a commit
+                time.sleep(linger)
+            while len(batch) < max_batch:
+                try:
+                    batch.append(self._ack_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self.data_manager.acknowledge_pattern_keys(batch)
+            except Exception as e:
+                bt.logging.warning(f"Failed to record {len(batch)} pattern acks: {e}")
+
+    def run(self):
+        self._start_ack_writer()
+        super().run()
+
+    def __enter__(self):
+        self._start_ack_writer()
+        return super().__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super().__exit__(exc_type, exc_value, traceback)
+        # No new acks once the axon is down; then flush the queued ones
+        self.axon.stop()
+        self._stop_ack_writer()
+
     async def blacklist_pattern_query(self, synapse: core.protocol.PatternQuery) -> typing.Tuple[bool, str]:
-         return await self.blacklist_pattern_query(synapse)
+        return self._blacklist(synapse)
+
+    async def blacklist_pattern_query_batch(self, synapse: core.protocol.PatternQueryBatch) -> typing.Tuple[bool, str]:
+        if not synapse.queries:
+            return True, "Empty pattern query batch"
+        return self._blacklist(synapse)
 
     async def blacklist_pattern_query_ack(self, synapse: core.protocol.PatternQueryAck) -> typing.Tuple[bool, str]:
-         return await self.blacklist_pattern_query_ack(synapse)
+        return self._blacklist(synapse)
 
-    async def _blacklist(self, synapse: core.protocol.PatternQuery | core.protocol.PatternQueryAck) -> typing.Tuple[bool, str]:
+    def _blacklist(self, synapse: core.protocol.PatternQuery | core.protocol.PatternQueryBatch | core.protocol.PatternQueryAck) -> typing.Tuple[bool, str]:
 
         if synapse.dendrite is None or synapse.dendrite.hotkey is None:
             bt.logging.warning(
@@ -79,37 +232,41 @@ class Miner(BaseMinerNeuron):
             )
             return True, "Missing dendrite or hotkey"
 
-        uid = self.metagraph.hotkeys.index(synapse.dendrite.hotkey)
-        if (
-            not self.config.blacklist.allow_non_registered
-            and synapse.dendrite.hotkey not in self.metagraph.hotkeys
-        ):
-            # Ignore requests from un-registered entities.
+        # Permissive configs need no uid at all
+        if not self._allow_non_registered or self._force_validator_permit:
+            uid = self._hotkey_to_uid.get(synapse.dendrite.hotkey)
+            if uid is None and not self._allow_non_registered:
+                # Ignore requests from un-registered entities.
+                if _trace_enabled():
+                    bt.logging.trace(
+                        f"Blacklisting un-registered hotkey {synapse.dendrite.hotkey}"
+                    )
+                return True, "Unrecognized hotkey"
+
+            if self._force_validator_permit:
+                # If the config is set to force validator permit, then we should only allow requests from validators.
+                if uid is None or not self.metagraph.validator_permit[uid]:
+                    bt.logging.warning(
+                        f"Blacklisting a request from non-validator hotkey {synapse.dendrite.hotkey}"
+                    )
+                    return True, "Non-validator hotkey"
+
+        if _trace_enabled():
             bt.logging.trace(
-                f"Blacklisting un-registered hotkey {synapse.dendrite.hotkey}"
+                f"Not Blacklisting recognized hotkey {synapse.dendrite.hotkey}"
             )
-            return True, "Unrecognized hotkey"
-
-        if self.config.blacklist.force_validator_permit:
-            # If the config is set to force validator permit, then we should only allow requests from validators.
-            if not self.metagraph.validator_permit[uid]:
-                bt.logging.warning(
-                    f"Blacklisting a request from non-validator hotkey {synapse.dendrite.hotkey}"
-                )
-                return True, "Non-validator hotkey"
-
-        bt.logging.trace(
-            f"Not Blacklisting recognized hotkey {synapse.dendrite.hotkey}"
-        )
         return False, "Hotkey recognized!"
 
     async def priority_pattern_query_ack(self, synapse: core.protocol.PatternQueryAck) -> float:
-        return await self._priority(synapse)
+        return self._priority(synapse)
+
+    async def priority_pattern_query_batch(self, synapse: core.protocol.PatternQueryBatch) -> float:
+        return self._priority(synapse)
 
     async def priority_pattern_query(self, synapse: core.protocol.PatternQuery) -> float:
-        return await self._priority(synapse)
+        return self._priority(synapse)
 
-    async def _priority(self, synapse: core.protocol.PatternQuery | core.protocol.PatternQueryAck) -> float:
+    def _priority(self, synapse: core.protocol.PatternQuery | core.protocol.PatternQueryBatch | core.protocol.PatternQueryAck) -> float:
 
         if synapse.dendrite is None or synapse.dendrite.hotkey is None:
             bt.logging.warning(
@@ -117,20 +274,17 @@ class Miner(BaseMinerNeuron):
             )
             return 0.0
 
-        caller_uid = self.metagraph.hotkeys.index(
-            synapse.dendrite.hotkey
-        )  # Get the caller index.
-        priority = float(
-            self.metagraph.S[caller_uid]
-        )  # Return the stake as the priority.
-        bt.logging.trace(
-            f"Prioritizing {synapse.dendrite.hotkey} with value: {priority}"
-        )
+        # Return the stake as the priority; unregistered callers get none.
+        priority = self._stake_by_hotkey.get(synapse.dendrite.hotkey, 0.0)
+        if _trace_enabled():
+            bt.logging.trace(
+                f"Prioritizing {synapse.dendrite.hotkey} with value: {priority}"
+            )
         return priority
 
 
 if __name__ == "__main__":
-    terminate_event = asyncio.Event()
+    terminate_event = threading.Event()
 
     def signal_handler(sig, frame):
         bt.logging.info(
@@ -148,5 +302,4 @@ if __name__ == "__main__":
     data_manager = DataManager(core.get_database_url("miner"))
 
     with Miner(data_manager) as miner:
-        while not terminate_event.is_set():
-            time.sleep(5)
+        terminate_event.wait()
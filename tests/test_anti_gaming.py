@@ -0,0 +1,131 @@
+import os
+import tempfile
+import unittest
+
+from core.protocol import DetectedPattern, GraphEdge, GraphNode, TransactionGraph
+from core.validator.anti_gaming import DiscoveryRegistry, FirstDiscoveryEnforcement, PatternDeduplicationEngine
+
+
+def _pattern(*edges, amount: int = 10 ** 18, start: int = 1_700_000_000) -> DetectedPattern:
+    addresses = dict.fromkeys(address for edge in edges for address in edge)
+    return DetectedPattern(
+        transaction_graph=TransactionGraph(
+            nodes=[GraphNode(address=address, node_type="eoa") for address in addresses],
+            edges=[
+                GraphEdge(
+                    from_address=source,
+                    to_address=target,
+                    amount=amount,
+                    transaction_hash=f"tx{i}",
+                    timestamp=start + i,
+                )
+                for i, (source, target) in enumerate(edges)
+            ],
+        ),
+        blockchain="ethereum",
+        asset_symbol="ETH",
+        detection_timestamp=start,
+    )
+
+
+_CYCLE = (("a", "b"), ("b", "c"), ("c", "a"))
+
+
+class TestPatternDeduplication(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = PatternDeduplicationEngine()
+
+    def test_exact_duplicate_is_reported_with_its_owner(self):
+        self.assertEqual(self.engine.register_pattern("p1", _pattern(*_CYCLE)), "p1")
+        self.assertEqual(self.engine.is_duplicate_pattern(_pattern(*_CYCLE)), (True, ["p1"]))
+
+    def test_reregistering_identical_pattern_returns_first_owner(self):
+        self.engine.register_pattern("p1", _pattern(*_CYCLE))
+        self.assertEqual(self.engine.register_pattern("p2", _pattern(*_CYCLE)), "p1")
+        self.assertNotIn("p2", self.engine.graph_signatures)
+
+    def test_unrelated_pattern_is_not_a_duplicate(self):
+        self.engine.register_pattern("p1", _pattern(*_CYCLE))
+        chain = _pattern(*[(f"x{i}", f"x{i + 1}") for i in range(12)], amount=7)
+        self.assertEqual(self.engine.is_duplicate_pattern(chain), (False, []))
+
+    def test_empty_engine_has_no_duplicates(self):
+        self.assertEqual(self.engine.is_duplicate_pattern(_pattern(*_CYCLE)), (False, []))
+
+    def test_cached_hash_is_dropped_by_invalidate_indexes(self):
+        pattern = _pattern(*_CYCLE)
+        before = self.engine._calculate_pattern_hash(pattern)
+        self.assertIn("pattern_hash", pattern.transaction_graph.derived_cache())
+
+        graph = pattern.transaction_graph
+        graph.edges.append(GraphEdge(from_address="a", to_address="d", amount=1, transaction_hash="tx9", timestamp=1))
+        graph.nodes.append(GraphNode(address="d", node_type="eoa"))
+        graph.invalidate_indexes()
+
+        self.assertNotIn("pattern_hash", graph.derived_cache())
+        self.assertNotEqual(self.engine._calculate_pattern_hash(pattern), before)
+        self.assertEqual(self.engine._calculate_pattern_hash(pattern), self.engine._hash_pattern_edges(graph))
+
+
+class TestDiscoveryRegistry(unittest.TestCase):
+
+    def test_lookup_survives_eviction_to_cold_tier(self):
+        registry = DiscoveryRegistry(hot_capacity=2)
+        self.addCleanup(registry.close)
+        for i in range(5):
+            registry.add(bytes([i]) * 16, f"miner{i}", 100 + i)
+
+        self.assertEqual(len(registry.hot), 2)
+        for i in range(5):
+            self.assertEqual(registry.get(bytes([i]) * 16), (f"miner{i}", 100 + i))
+        self.assertLessEqual(len(registry.hot), 2)
+        self.assertNotIn(b"\xff" * 16, registry)
+
+    def test_cold_tier_persists_to_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "discoveries.sqlite")
+            registry = DiscoveryRegistry(hot_capacity=1, cold_path=path)
+            registry.add(b"\x01" * 16, "miner1", 1)
+            registry.add(b"\x02" * 16, "miner2", 2)
+            registry.close()
+
+            reopened = DiscoveryRegistry(hot_capacity=1, cold_path=path)
+            self.addCleanup(reopened.close)
+            self.assertEqual(reopened.get(b"\x01" * 16), ("miner1", 1))
+            self.assertEqual(reopened.get(b"\x02" * 16), ("miner2", 2))  # written through from the hot tier on close
+
+
+class TestFirstDiscoveryEnforcement(unittest.TestCase):
+
+    def setUp(self):
+        self.enforcement = FirstDiscoveryEnforcement(hot_capacity=4)
+        self.addCleanup(self.enforcement.discovery_registry.close)
+
+    def test_first_grace_and_late_discoveries(self):
+        first = self.enforcement.register_pattern_discovery(_pattern(*_CYCLE), "m1", now=1000)
+        self.assertTrue(first.is_first_discovery)
+        self.assertEqual(first.credit_multiplier, 1.0)
+
+        grace = self.enforcement.register_pattern_discovery(_pattern(*_CYCLE), "m2", now=1000 + 300)
+        self.assertTrue(grace.is_within_grace_period)
+        self.assertEqual((grace.first_discoverer, grace.credit_multiplier), ("m1", 0.5))
+
+        late = self.enforcement.register_pattern_discovery(_pattern(*_CYCLE), "m3", now=1000 + 301)
+        self.assertFalse(late.is_first_discovery or late.is_within_grace_period)
+        self.assertEqual((late.first_discoverer, late.credit_multiplier), ("m1", 0.0))
+
+    def test_sub_micro_unit_amount_differences_share_a_discovery(self):
+        self.enforcement.register_pattern_discovery(_pattern(*_CYCLE, amount=10 ** 18), "m1", now=1000)
+        result = self.enforcement.register_pattern_discovery(_pattern(*_CYCLE, amount=10 ** 18 + 1), "m2", now=1001)
+        self.assertEqual(result.first_discoverer, "m1")
+
+    def test_distinct_patterns_are_each_first(self):
+        self.enforcement.register_pattern_discovery(_pattern(*_CYCLE), "m1", now=1000)
+        result = self.enforcement.register_pattern_discovery(_pattern(("a", "b"), ("b", "a")), "m2", now=1001)
+        self.assertTrue(result.is_first_discovery)
+        self.assertEqual(result.first_discoverer, "m2")
+
+
+if __name__ == "__main__":
+    unittest.main()
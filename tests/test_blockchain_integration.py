@@ -0,0 +1,149 @@
+import random
+import unittest
+from decimal import Decimal
+
+from core.protocol import GraphEdge
+from core.validator.blockchain_integration import BlockchainManager, BlockchainNetwork, Transaction
+
+_A = "0x" + "ab" * 20
+_B = "0x" + "cd" * 20
+_C = "0x" + "ef" * 20
+_ETH = 10 ** 18
+
+
+def _edge(amount: int = _ETH, timestamp: int = 1_700_000_000, from_address: str = _A, to_address: str = _B) -> GraphEdge:
+    return GraphEdge(
+        from_address=from_address,
+        to_address=to_address,
+        amount=amount,
+        transaction_hash="0x" + "11" * 32,
+        timestamp=timestamp,
+    )
+
+
+def _tx(
+    amount_base_units=_ETH,
+    decimals=18,
+    amount=None,
+    timestamp: int = 1_700_000_000,
+    from_address: str = _A,
+    to_address: str = _B,
+) -> Transaction:
+    if amount is None:
+        amount = Decimal(amount_base_units) / Decimal(10) ** decimals
+    return Transaction(
+        hash="0x" + "11" * 32,
+        from_address=from_address,
+        to_address=to_address,
+        amount=amount,
+        asset_symbol="ETH",
+        timestamp=timestamp,
+        block_number=1,
+        gas_fee=Decimal(0),
+        status="success",
+        blockchain=BlockchainNetwork.ETHEREUM,
+        raw_data={},
+        transaction_type="transfer",
+        amount_base_units=amount_base_units,
+        decimals=decimals,
+    )
+
+
+class TestMatchTransactionDetails(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = BlockchainManager({})
+
+    def match(self, *pairs, decimals: int = 18):
+        return self.manager._match_transaction_details(list(pairs), decimals).tolist()
+
+    def test_no_pairs(self):
+        self.assertEqual(self.match(), [])
+
+    def test_exact_match(self):
+        self.assertEqual(self.match((_edge(), _tx())), [True])
+
+    def test_addresses_must_match(self):
+        self.assertEqual(
+            self.match((_edge(), _tx(from_address=_C)), (_edge(), _tx(to_address=_C)), (_edge(), _tx())),
+            [False, False, True],
+        )
+
+    def test_addresses_are_compared_normalized(self):
+        self.assertEqual(self.match((_edge(), _tx(from_address=_A.upper().replace("0X", "0x")))), [True])
+
+    def test_timestamps_within_an_hour(self):
+        self.assertEqual(
+            self.match(
+                (_edge(), _tx(timestamp=1_700_000_000 + 3600)),
+                (_edge(), _tx(timestamp=1_700_000_000 - 3601)),
+            ),
+            [True, False],
+        )
+
+    def test_amount_tolerance_is_one_micro_unit(self):
+        tolerance = 10 ** 12
+        self.assertEqual(
+            self.match(
+                (_edge(), _tx(amount_base_units=_ETH + tolerance)),
+                (_edge(), _tx(amount_base_units=_ETH - tolerance - 1)),
+            ),
+            [True, False],
+        )
+
+    def test_low_decimal_assets_need_exact_amounts(self):
+        self.assertEqual(
+            self.match(
+                (_edge(amount=5), _tx(amount_base_units=5, decimals=2)),
+                (_edge(amount=5), _tx(amount_base_units=6, decimals=2)),
+                decimals=2,
+            ),
+            [True, False],
+        )
+
+    def test_amounts_beyond_int64_fall_back_to_exact_comparison(self):
+        big = 2 ** 80
+        self.assertEqual(
+            self.match(
+                (_edge(amount=big), _tx(amount_base_units=big)),
+                (_edge(amount=big), _tx(amount_base_units=big + 10 ** 13)),
+            ),
+            [True, False],
+        )
+
+    def test_decimal_amounts_without_base_units(self):
+        self.assertEqual(
+            self.match(
+                (_edge(amount=_ETH // 2), _tx(amount_base_units=None, amount=Decimal("0.5"))),
+                (_edge(amount=_ETH // 2), _tx(amount_base_units=None, amount=Decimal("0.50001"))),
+            ),
+            [True, False],
+        )
+
+    def test_base_units_in_another_precision_are_compared_as_decimals(self):
+        # 6-decimal transaction against 18-decimal edges: only the Decimal amount is comparable
+        self.assertEqual(self.match((_edge(amount=_ETH), _tx(amount_base_units=10 ** 6, decimals=6))), [True])
+
+    def test_matches_pairwise_check(self):
+        rng = random.Random(7)
+        pairs = []
+        for _ in range(200):
+            amount = rng.choice([rng.randrange(10 ** 20), rng.randrange(2 ** 70, 2 ** 71)])
+            tx_amount = amount + rng.choice([0, 10 ** 12, 10 ** 12 + 1, -(10 ** 13)])
+            pairs.append((
+                _edge(amount=amount, timestamp=1_700_000_000 + rng.randrange(-4000, 4000)),
+                _tx(amount_base_units=max(tx_amount, 0), to_address=rng.choice([_B, _C])),
+            ))
+        expected = [self.manager._verify_transaction_details(edge, tx, 18) for edge, tx in pairs]
+        self.assertEqual(self.match(*pairs), expected)
+        for (edge, tx), matched in zip(pairs, expected):
+            expected_match = (
+                tx.to_address == edge.to_address
+                and abs(edge.timestamp - tx.timestamp) <= 3600
+                and abs(edge.amount - tx.amount_base_units) <= 10 ** 12
+            )
+            self.assertEqual(matched, expected_match)
+
+
+if __name__ == "__main__":
+    unittest.main()
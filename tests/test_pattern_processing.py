@@ -0,0 +1,201 @@
+import random
+import unittest
+
+from core.protocol import GraphEdge, GraphNode, PatternType, TransactionGraph, create_sample_pattern
+from core.validator.pattern_processing import (
+    ClassifiedPattern,
+    MinerReputation,
+    _calculate_graph_depth,
+    _calculate_pattern_complexity,
+    _count_cycles,
+    _strongly_connected_components,
+)
+
+
+def _reference_depth(graph: TransactionGraph) -> int:
+    """The original recursive depth: DFS from every node, copying the visited set per edge."""
+    def dfs(address, visited):
+        if address in visited:
+            return 0
+        visited.add(address)
+        return max((1 + dfs(edge.to_address, visited.copy()) for edge in graph.get_edges_from_address(address)), default=0)
+
+    return max((dfs(node.address, set()) for node in graph.nodes), default=0)
+
+
+def _graph(*edges) -> TransactionGraph:
+    addresses = dict.fromkeys(address for edge in edges for address in edge)
+    return TransactionGraph(
+        nodes=[GraphNode(address=address, node_type="eoa") for address in addresses],
+        edges=[
+            GraphEdge(
+                from_address=source,
+                to_address=target,
+                amount=1,
+                transaction_hash=f"tx{i}",
+                timestamp=1_700_000_000 + i,
+            )
+            for i, (source, target) in enumerate(edges)
+        ],
+    )
+
+
+class TestGraphStructure(unittest.TestCase):
+
+    def test_chain_depth_and_no_cycles(self):
+        graph = _graph(("a", "b"), ("b", "c"), ("c", "d"))
+        self.assertEqual(_calculate_graph_depth(graph), 3)
+        self.assertEqual(_count_cycles(graph), 0)
+
+    def test_components_are_reverse_topological(self):
+        graph = _graph(("a", "b"), ("b", "a"), ("b", "c"))
+        components = _strongly_connected_components(graph)
+        self.assertEqual([sorted(component) for component in components], [["c"], ["a", "b"]])
+
+    def test_cycle_then_exit(self):
+        # a <-> b, then out to c: a -> b -> c is the longest simple path
+        graph = _graph(("a", "b"), ("b", "a"), ("b", "c"))
+        self.assertEqual(_calculate_graph_depth(graph), 2)
+        self.assertEqual(_count_cycles(graph), 1)
+
+    def test_pure_cycle_counts_its_closing_edge(self):
+        for size in (1, 2, 5):
+            graph = _graph(*[(str(i), str((i + 1) % size)) for i in range(size)])
+            with self.subTest(size=size):
+                self.assertEqual(_calculate_graph_depth(graph), size)
+
+    def test_cycles_are_counted_per_component(self):
+        graph = _graph(("a", "b"), ("b", "c"), ("c", "a"), ("c", "d"), ("d", "e"), ("e", "d"), ("f", "f"))
+        self.assertEqual(_count_cycles(graph), 3)
+        # a -> b -> c -> d -> e, then back to d
+        self.assertEqual(_calculate_graph_depth(graph), 5)
+
+    def test_round_trips_through_a_hub_stay_shallow(self):
+        # Return edges put all 11 addresses in one component, but no simple
+        # path is longer than spoke -> hub -> spoke
+        graph = _graph(*[edge for i in range(10) for edge in (("hub", f"s{i}"), (f"s{i}", "hub"))])
+        self.assertEqual(_calculate_graph_depth(graph), 3)
+        # Base score 3 * 11 / 100, one cycle, branching 20 edges / 11 nodes
+        self.assertAlmostEqual(_calculate_pattern_complexity(graph), 0.33 + 0.1 + 20 / 11 * 0.1)
+
+    def test_matches_reference_depth(self):
+        rng = random.Random(13)
+        for _ in range(300):
+            size = rng.randrange(1, 8)
+            edges = [
+                (str(rng.randrange(size)), str(rng.randrange(size)))
+                for _ in range(rng.randrange(1, 3 * size + 1))
+            ]
+            graph = _graph(*edges)
+            with self.subTest(edges=edges):
+                self.assertEqual(_calculate_graph_depth(graph), _reference_depth(graph))
+
+    def test_dense_component_search_is_bounded(self):
+        # 12! simple paths per start address; the search stops early with a real walk
+        graph = _graph(*[(str(i), str(j)) for i in range(12) for j in range(12) if i != j])
+        depth = _calculate_graph_depth(graph)
+        self.assertGreaterEqual(depth, 11)
+        self.assertLessEqual(depth, 12)
+
+    def test_longest_branch_wins(self):
+        graph = _graph(("a", "b"), ("a", "c"), ("c", "d"), ("d", "e"), ("b", "e"))
+        self.assertEqual(_calculate_graph_depth(graph), 3)
+
+    def test_stop_at_returns_early_lower_bound(self):
+        graph = _graph(*[(str(i), str(i + 1)) for i in range(50)])
+        self.assertEqual(_calculate_graph_depth(graph), 50)
+        depth = _calculate_graph_depth(graph, stop_at=5)
+        self.assertGreaterEqual(depth, 5)
+        self.assertLessEqual(depth, 50)
+
+    def test_deep_chain_does_not_recurse(self):
+        graph = _graph(*[(str(i), str(i + 1)) for i in range(5000)])
+        self.assertEqual(_calculate_graph_depth(graph), 5000)
+
+    def test_complexity_matches_unbounded_depth(self):
+        graph = _graph(("a", "b"), ("b", "c"), ("c", "a"), ("c", "d"))
+        unique_addresses = len(graph.get_unique_addresses())
+        depth = _calculate_graph_depth(graph)
+        expected = min(1.0, depth * unique_addresses / 100.0 + min(0.3, 0.1) + min(0.2, 4 / 4 * 0.1))
+        self.assertAlmostEqual(_calculate_pattern_complexity(graph), expected)
+
+    def test_complexity_saturates_on_long_chains(self):
+        graph = _graph(*[(str(i), str(i + 1)) for i in range(200)])
+        self.assertEqual(_calculate_pattern_complexity(graph), 1.0)
+
+    def test_empty_graph_has_zero_complexity(self):
+        self.assertEqual(_calculate_pattern_complexity(TransactionGraph(nodes=[], edges=[])), 0.0)
+
+
+def _classified(rng: random.Random, verified: bool) -> ClassifiedPattern:
+    return ClassifiedPattern(
+        detected_pattern=create_sample_pattern(),
+        pattern_id="p",
+        pattern_hash="h",
+        pattern_type=PatternType.CIRCULAR_TRANSFER,
+        confidence_score=rng.random(),
+        complexity_score=rng.random(),
+        uniqueness_score=rng.random(),
+        volume_significance=rng.random(),
+        recency_score=rng.random(),
+        verification_status="verified" if verified else "failed",
+        verification_confidence=1.0,
+        miner_hotkey="miner",
+        validator_hotkey="validator",
+        classification_timestamp=1_700_000_000,
+    )
+
+
+class TestReputationBatchUpdate(unittest.TestCase):
+
+    def assert_same_reputation(self, batched: MinerReputation, sequential: MinerReputation):
+        for name in (
+            "total_patterns_submitted", "verified_patterns", "rejected_patterns",
+            "last_submission_timestamp", "reputation_update_timestamp",
+        ):
+            self.assertEqual(getattr(batched, name), getattr(sequential, name), name)
+        for name in (
+            "average_pattern_score", "average_complexity_score",
+            "verification_success_rate", "reputation_multiplier",
+        ):
+            self.assertAlmostEqual(getattr(batched, name), getattr(sequential, name), places=12, msg=name)
+
+    def test_batch_matches_sequential_updates(self):
+        rng = random.Random(3)
+        for size in (1, 2, 7, 60, 300):
+            patterns = [_classified(rng, rng.random() < 0.8) for _ in range(size)]
+            batched = MinerReputation("miner", average_pattern_score=0.4, average_complexity_score=0.2)
+            sequential = MinerReputation("miner", average_pattern_score=0.4, average_complexity_score=0.2)
+
+            batched.update_with_patterns(patterns, now=1_700_000_100)
+            for pattern in patterns:
+                sequential.update_with_pattern(pattern, now=1_700_000_100)
+
+            with self.subTest(size=size):
+                self.assert_same_reputation(batched, sequential)
+
+    def test_consecutive_batches_match_sequential_updates(self):
+        rng = random.Random(5)
+        batched, sequential = MinerReputation("miner"), MinerReputation("miner")
+        for now in range(1_700_000_000, 1_700_000_010):
+            patterns = [_classified(rng, rng.random() < 0.9) for _ in range(rng.randrange(1, 20))]
+            batched.update_with_patterns(patterns, now=now)
+            for pattern in patterns:
+                sequential.update_with_pattern(pattern, now=now)
+        self.assert_same_reputation(batched, sequential)
+
+    def test_unverified_batch_leaves_averages(self):
+        rng = random.Random(11)
+        reputation = MinerReputation("miner", average_pattern_score=0.6, average_complexity_score=0.3)
+        reputation.update_with_patterns([_classified(rng, False) for _ in range(4)], now=1)
+        self.assertEqual((reputation.average_pattern_score, reputation.average_complexity_score), (0.6, 0.3))
+        self.assertEqual((reputation.rejected_patterns, reputation.verification_success_rate), (4, 0.0))
+
+    def test_empty_batch_is_a_no_op(self):
+        reputation = MinerReputation("miner")
+        reputation.update_with_patterns([], now=123)
+        self.assertEqual(reputation, MinerReputation("miner"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import base64
+import dataclasses
+import json
+import unittest
+
+import msgspec
+import zstandard
+
+from core.protocol import (
+    DetectedPattern,
+    EdgeMetadata,
+    GraphEdge,
+    GraphNode,
+    TransactionGraph,
+    create_sample_pattern,
+    pack_patterns,
+    patterns_from_json,
+    unpack_patterns,
+)
+
+
+def _hex_pattern() -> DetectedPattern:
+    a, b = "0x" + "11" * 20, "0x" + "22" * 20
+    return DetectedPattern(
+        transaction_graph=TransactionGraph(
+            nodes=[GraphNode(address=a, node_type="eoa"), GraphNode(address=b, node_type="contract", metadata={"label": "x"})],
+            edges=[
+                GraphEdge(
+                    from_address=a,
+                    to_address=b,
+                    amount=2 ** 70,  # too large for int64, packed as a string
+                    transaction_hash="0x" + "ab" * 32,
+                    timestamp=1_700_000_000,
+                    metadata=EdgeMetadata(block_number=1, gas_used=21000, gas_price=None),
+                ),
+                GraphEdge(
+                    from_address=b,
+                    to_address=a,
+                    amount=5,
+                    transaction_hash="0x" + "cd" * 32,
+                    timestamp=1_700_000_060,
+                ),
+            ],
+        ),
+        blockchain="ethereum",
+        asset_symbol="ETH",
+        detection_timestamp=1_700_000_100,
+    )
+
+
+def _blob(payload: bytes) -> str:
+    return base64.b64encode(zstandard.ZstdCompressor().compress(payload)).decode("ascii")
+
+
+class TestPatternWireFormat(unittest.TestCase):
+
+    def test_round_trip_preserves_patterns(self):
+        patterns = [_hex_pattern(), create_sample_pattern()]
+        unpacked = unpack_patterns(pack_patterns(patterns))
+
+        self.assertEqual(len(unpacked), 2)
+        for original, decoded in zip(patterns, unpacked):
+            self.assertEqual(decoded.pattern_hash(), original.pattern_hash())
+            self.assertEqual(decoded.transaction_graph.edges, original.transaction_graph.edges)
+            self.assertEqual(decoded.detection_timestamp, original.detection_timestamp)
+        self.assertEqual(unpacked[0].transaction_graph.edges[0].amount, 2 ** 70)
+        self.assertEqual(unpacked[0].transaction_graph.nodes[1].metadata, {"label": "x"})
+
+    def test_empty_list_round_trips(self):
+        self.assertEqual(unpack_patterns(pack_patterns([])), [])
+
+    def test_invalid_base64_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            unpack_patterns("not base64 at all!")
+
+    def test_garbage_zstd_frame_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            unpack_patterns(base64.b64encode(b"definitely not zstd").decode("ascii"))
+
+    def test_oversized_payload_is_rejected(self):
+        # A few KB compressed, 32 MB once expanded
+        with self.assertRaisesRegex(ValueError, "exceeds"):
+            unpack_patterns(_blob(b"\x00" * (32 * 1024 * 1024)))
+
+    def test_wrong_shape_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            unpack_patterns(_blob(b"\x93\x01\x02\x03"))  # msgpack [1, 2, 3]
+
+    def test_non_string_addresses_raise_value_error(self):
+        node = ["0xaa", "eoa", None]
+        edge = ["0xaa", "0xbb", 1, "0xcc", 1_700_000_000, None]
+        for bad_node, bad_edge in [
+            ([42, "eoa", None], edge),
+            (node, [42, "0xbb", 1, "0xcc", 1_700_000_000, None]),
+            (node, ["0xaa", "0xbb", 1, 3.5, 1_700_000_000, None]),
+        ]:
+            payload = msgspec.msgpack.encode([["ethereum", "ETH", 1_700_000_000, 18, [node, bad_node], [bad_edge]]])
+            with self.subTest(node=bad_node, edge=bad_edge), self.assertRaises(ValueError):
+                unpack_patterns(_blob(payload), validate=False)
+
+    def test_non_numeric_amount_raises_value_error(self):
+        payload = msgspec.msgpack.encode(
+            [["ethereum", "ETH", 1_700_000_000, 18, [], [["0xaa", "0xbb", "lots", "0xcc", 1_700_000_000, None]]]]
+        )
+        with self.assertRaises(ValueError):
+            unpack_patterns(_blob(payload), validate=False)
+
+    def test_pattern_without_edges_fails_validation(self):
+        pattern = _hex_pattern()
+        pattern.transaction_graph = TransactionGraph(nodes=pattern.transaction_graph.nodes, edges=[])
+        with self.assertRaises(ValueError):
+            unpack_patterns(pack_patterns([pattern]))
+
+
+class TestPatternJson(unittest.TestCase):
+
+    def test_asdict_layout_round_trips(self):
+        pattern = _hex_pattern()
+        data = json.loads(json.dumps(dataclasses.asdict(pattern), default=str))
+        (decoded,) = patterns_from_json(data)
+        self.assertEqual(decoded.pattern_hash(), pattern.pattern_hash())
+        self.assertEqual(decoded.transaction_graph.edges[0].amount, 2 ** 70)
+        self.assertEqual(decoded.transaction_graph.edges[0].metadata, pattern.transaction_graph.edges[0].metadata)
+
+    def test_list_of_patterns(self):
+        data = [dataclasses.asdict(create_sample_pattern()), dataclasses.asdict(create_sample_pattern())]
+        self.assertEqual(len(patterns_from_json(data)), 2)
+
+    def test_malformed_data_raises_value_error(self):
+        valid = dataclasses.asdict(create_sample_pattern())
+        bad_amount = json.loads(json.dumps(valid))
+        bad_amount["transaction_graph"]["edges"][0]["amount"] = "lots"
+        for data in (None, "text", {}, [1], {**valid, "blockchain": 7}, bad_amount):
+            with self.subTest(data=data), self.assertRaises(ValueError):
+                patterns_from_json(data)
+
+    def test_pattern_without_edges_fails_validation(self):
+        data = dataclasses.asdict(create_sample_pattern())
+        data["transaction_graph"]["edges"] = []
+        with self.assertRaises(ValueError):
+            patterns_from_json(data)
+        self.assertEqual(len(patterns_from_json(data, validate=False)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()